@@ -15,3 +15,9 @@ admin.register(models.Publicacion)(models.Publicacion.Admin)
 admin.register(models.PublicacionClasificacion)(models.PublicacionClasificacion.Admin)
 admin.register(models.ProfesorPublicacion)(models.ProfesorPublicacion.Admin)
 admin.register(ProfesorEvaluacion)(ProfesorEvaluacion.Admin)
+admin.register(models.ResumenClaustro)(models.ResumenClaustro.Admin)
+admin.register(models.ResumenPublicaciones)(models.ResumenPublicaciones.Admin)
+admin.register(models.ResumenEventos)(models.ResumenEventos.Admin)
+admin.register(models.ResumenPremios)(models.ResumenPremios.Admin)
+admin.register(models.ResumenEvaluaciones)(models.ResumenEvaluaciones.Admin)
+admin.register(models.DossierCarrera)(models.DossierCarrera.Admin)
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class SgacConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.negocio.sgac"
+
+    def ready(self):
+        from apps.negocio.sgac import signals
+
+        signals.conectar()
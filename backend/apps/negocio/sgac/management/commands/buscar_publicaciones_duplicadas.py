@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+
+from apps.negocio.sgac.reportes.duplicados import (
+    SIMILITUD_TITULO,
+    SIMILITUD_TITULO_MISMO_ISBN,
+    candidatos_duplicados,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Lista las publicaciones que probablemente están registradas más de una "
+        "vez, agrupadas como candidatas a fusionarse."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--similitud",
+            type=float,
+            default=SIMILITUD_TITULO,
+            help=(
+                "Similitud mínima entre los títulos, de "
+                f"{SIMILITUD_TITULO_MISMO_ISBN} a 1 (por defecto {SIMILITUD_TITULO})."
+            ),
+        )
+        parser.add_argument(
+            "--anno", type=int, help="Solo las publicaciones de este año."
+        )
+
+    def handle(self, *args, **options):
+        similitud = max(options["similitud"], SIMILITUD_TITULO_MISMO_ISBN)
+        candidatos = candidatos_duplicados(similitud, options["anno"])
+        for numero, candidato in enumerate(candidatos, start=1):
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f"Grupo {numero} (similitud {candidato['similitud']:.2f})"
+                )
+            )
+            for publicacion in candidato["publicaciones"]:
+                autores = ", ".join(autor["nombre"] for autor in publicacion["autores"])
+                self.stdout.write(
+                    f"  #{publicacion['id']} [{publicacion['anno']}] "
+                    f"{publicacion['titulo']} ({publicacion['isbn_issn'] or 'sin ISBN/ISSN'})"
+                    f" - {autores or 'sin autores'}"
+                )
+            for par in candidato["pares"]:
+                id_a, id_b = par["publicaciones"]
+                mismo_isbn = ", mismo ISBN/ISSN" if par["mismo_isbn_issn"] else ""
+                self.stdout.write(
+                    f"    #{id_a} ~ #{id_b}: similitud {par['similitud']:.2f}{mismo_isbn}"
+                )
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(candidatos)} grupos de posibles duplicados.")
+        )
@@ -0,0 +1,90 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.negocio.sgac.models import Publicacion
+from general.conteo import contar_en_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara, para tablas de publicaciones de distintos tamaños, el tiempo "
+        "de contar un listado filtrado con COUNT(*) y con la caché de "
+        "general.conteo (acierto y fallo). Los datos se crean en una "
+        "transacción que se revierte al terminar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--filas",
+            type=int,
+            nargs="+",
+            default=[1_000, 10_000, 100_000],
+            help="Tamaños de la tabla a medir (1000 10000 100000).",
+        )
+        parser.add_argument(
+            "--repeticiones",
+            type=int,
+            default=20,
+            help="Veces que se mide cada caso; se toma la mediana (20).",
+        )
+
+    def _medir(self, funcion, repeticiones):
+        tiempos = sorted(timeit.repeat(funcion, number=1, repeat=repeticiones))
+        return tiempos[len(tiempos) // 2] * 1000
+
+    def _fallo(self, queryset):
+        # Un parámetro distinto en cada llamada (que no excluye filas) da
+        # otra clave, así que nunca está en caché
+        self.llamadas += 1
+        return contar_en_cache(queryset.filter(pk__gt=-self.llamadas))
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        repeticiones = options["repeticiones"]
+        self.llamadas = 0
+        existentes = Publicacion.objects.count()
+        # Un listado de publicaciones filtrado por años y tipo, como
+        # ``?annoInicio=&annoFin=&tipoPublicacion=``
+        queryset = Publicacion.objects.filter(
+            anno__gte=2010, anno__lte=2020, tipo_publicacion="articulo"
+        ).order_by()
+
+        for filas in sorted(options["filas"]):
+            Publicacion.objects.bulk_create(
+                (
+                    Publicacion(
+                        anno=2000 + numero % 25,
+                        titulo=f"Título de la publicación {numero}",
+                        revista_editorial="Revista Cubana de Ciencias Informáticas",
+                        tipo_publicacion=("articulo", "libro")[numero % 2],
+                        isbn_issn="2227-1899",
+                        verificacion_libro="",
+                        base_datos_revista="SciELO",
+                        verificacion_referencia="",
+                        nivel=1 + numero % 4,
+                    )
+                    for numero in range(existentes, filas)
+                ),
+                batch_size=5000,
+            )
+            existentes = max(existentes, filas)
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {Publicacion._meta.db_table}")
+
+            contar_en_cache(queryset)
+            tiempos = {
+                "COUNT(*)": self._medir(queryset.count, repeticiones),
+                "caché (acierto)": self._medir(
+                    lambda: contar_en_cache(queryset), repeticiones
+                ),
+                "caché (fallo)": self._medir(
+                    lambda: self._fallo(queryset), repeticiones
+                ),
+            }
+            self.stdout.write(
+                f"{existentes} filas: "
+                + ", ".join(f"{caso} {ms:.2f} ms" for caso, ms in tiempos.items())
+            )
+        transaction.set_rollback(True)
@@ -0,0 +1,72 @@
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as CamelCaseJSONRendererOriginal,
+)
+
+from apps.negocio.sgac.models import Publicacion
+from apps.negocio.sgac.views.serializers.publicacion import PublicacionSerializer
+from general.renderizadores import CamelCaseJSONRenderer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara el tiempo de renderizado en JSON de un listado de publicaciones "
+        "con el renderer de djangorestframework-camel-case y con el de "
+        "general.renderizadores, y comprueba que la salida es la misma."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--filas", type=int, default=5000, help="Filas del listado (5000)."
+        )
+        parser.add_argument(
+            "--repeticiones",
+            type=int,
+            default=5,
+            help="Veces que se renderiza con cada uno; se toma el mejor tiempo (5).",
+        )
+
+    def handle(self, *args, **options):
+        # Instancias sin guardar: solo se mide el renderizado
+        publicaciones = [
+            Publicacion(
+                pk=numero,
+                anno=2000 + numero % 25,
+                titulo=f"Título de la publicación {numero}",
+                revista_editorial="Revista Cubana de Ciencias Informáticas",
+                tipo_publicacion="articulo",
+                isbn_issn="2227-1899",
+                verificacion_libro="",
+                base_datos_revista="SciELO",
+                verificacion_referencia=f"https://doi.org/10.0000/{numero}",
+                nivel=1 + numero % 4,
+            )
+            for numero in range(1, options["filas"] + 1)
+        ]
+        datos = PublicacionSerializer(publicaciones, many=True).data
+
+        original, rapido = CamelCaseJSONRendererOriginal(), CamelCaseJSONRenderer()
+        if original.render(datos) != rapido.render(datos):
+            raise CommandError("La salida de los renderers no coincide.")
+
+        tiempos = {}
+        for nombre, renderer in [("original", original), ("rapido", rapido)]:
+            tiempos[nombre] = min(
+                timeit.repeat(
+                    lambda: renderer.render(datos),
+                    number=1,
+                    repeat=options["repeticiones"],
+                )
+            )
+            self.stdout.write(
+                f"{renderer.__module__}.{type(renderer).__name__}: "
+                f"{tiempos[nombre] * 1000:.1f} ms"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{options['filas']} filas, salida idéntica, "
+                f"{tiempos['original'] / tiempos['rapido']:.1f}x más rápido."
+            )
+        )
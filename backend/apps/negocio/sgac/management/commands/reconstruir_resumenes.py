@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from apps.negocio.sgac.models import DossierCarrera
+from apps.negocio.sgac.reportes.resumenes import DEFINICIONES_RESUMEN
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye desde cero las tablas resumen de los reportes de acreditación "
+        "e invalida los dossiers de las carreras."
+    )
+
+    def handle(self, *args, **options):
+        for definicion in DEFINICIONES_RESUMEN:
+            definicion.reconstruir()
+            self.stdout.write(
+                f"{definicion.resumen._meta.verbose_name}: "
+                f"{definicion.resumen.objects.count()} filas"
+            )
+        DossierCarrera.objects.update(vigente=False)
+        self.stdout.write(self.style.SUCCESS("Resúmenes reconstruidos."))
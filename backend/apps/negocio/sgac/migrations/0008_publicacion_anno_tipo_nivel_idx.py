@@ -0,0 +1,20 @@
+# Generated by Django 5.1.5 on 2026-10-18 19:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sgac", "0007_alter_indicadorevaluacion_nombre_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="publicacion",
+            index=models.Index(
+                fields=["anno", "tipo_publicacion", "nivel"],
+                name="sgac_pub_anno_tipo_nivel_idx",
+            ),
+        ),
+    ]
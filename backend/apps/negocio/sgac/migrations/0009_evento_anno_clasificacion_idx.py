@@ -0,0 +1,19 @@
+# Generated by Django 5.1.5 on 2026-10-18 19:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sgac", "0008_publicacion_anno_tipo_nivel_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="evento",
+            index=models.Index(
+                fields=["anno", "clasificacion"], name="sgac_evento_anno_clasif_idx"
+            ),
+        ),
+    ]
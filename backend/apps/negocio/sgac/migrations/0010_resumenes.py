@@ -0,0 +1,246 @@
+# Generated by Django 5.1.5 on 2026-10-18 19:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sgac", "0009_evento_anno_clasificacion_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResumenClaustro",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "categoria_docente",
+                    models.CharField(db_column="categoria_docente", max_length=255),
+                ),
+                (
+                    "grado_cientifico",
+                    models.CharField(db_column="grado_cientifico", max_length=255),
+                ),
+                (
+                    "especialidad_afin",
+                    models.BooleanField(db_column="especialidad_afin", default=False),
+                ),
+                (
+                    "cantidad",
+                    models.PositiveIntegerField(db_column="cantidad", default=0),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumen del Claustro",
+                "verbose_name_plural": "Resúmenes del Claustro",
+                "db_table": "sgac_resumen_claustro",
+                "managed": True,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "categoria_docente",
+                            "grado_cientifico",
+                            "especialidad_afin",
+                        ),
+                        name="sgac_resumen_claustro_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ResumenEventos",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("anno", models.IntegerField(db_column="anno")),
+                (
+                    "clasificacion",
+                    models.CharField(db_column="clasificacion", max_length=255),
+                ),
+                (
+                    "cantidad",
+                    models.PositiveIntegerField(db_column="cantidad", default=0),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumen de Eventos",
+                "verbose_name_plural": "Resúmenes de Eventos",
+                "db_table": "sgac_resumen_eventos",
+                "managed": True,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("anno", "clasificacion"),
+                        name="sgac_resumen_eventos_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ResumenPremios",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("anno", models.IntegerField(db_column="anno")),
+                (
+                    "clasificacion",
+                    models.CharField(db_column="clasificacion", max_length=50),
+                ),
+                (
+                    "cantidad",
+                    models.PositiveIntegerField(db_column="cantidad", default=0),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumen de Premios",
+                "verbose_name_plural": "Resúmenes de Premios",
+                "db_table": "sgac_resumen_premios",
+                "managed": True,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("anno", "clasificacion"),
+                        name="sgac_resumen_premios_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ResumenPublicaciones",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("anno", models.IntegerField(db_column="anno")),
+                (
+                    "tipo_publicacion",
+                    models.CharField(db_column="tipo_publicacion", max_length=500),
+                ),
+                ("nivel", models.IntegerField(db_column="nivel")),
+                (
+                    "cantidad",
+                    models.PositiveIntegerField(db_column="cantidad", default=0),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumen de Publicaciones",
+                "verbose_name_plural": "Resúmenes de Publicaciones",
+                "db_table": "sgac_resumen_publicaciones",
+                "managed": True,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("anno", "tipo_publicacion", "nivel"),
+                        name="sgac_resumen_publicaciones_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ResumenEvaluaciones",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("anno", models.IntegerField(db_column="anno")),
+                ("evaluacion", models.CharField(db_column="evaluacion", max_length=2)),
+                (
+                    "cantidad",
+                    models.PositiveIntegerField(db_column="cantidad", default=0),
+                ),
+                (
+                    "indicador",
+                    models.ForeignKey(
+                        db_column="id_indicador",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="sgac.indicadorevaluacion",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Resumen de Evaluaciones",
+                "verbose_name_plural": "Resúmenes de Evaluaciones",
+                "db_table": "sgac_resumen_evaluaciones",
+                "managed": True,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("indicador", "anno", "evaluacion"),
+                        name="sgac_resumen_evaluaciones_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(
+            sql=[
+                """
+                INSERT INTO sgac_resumen_claustro
+                    (categoria_docente, grado_cientifico, especialidad_afin, cantidad)
+                SELECT categoria_docente, grado_cientifico,
+                       COALESCE(dr_especialidad_afin = 'SI', FALSE), COUNT(*)
+                FROM sgac_profesores
+                GROUP BY 1, 2, 3
+                """,
+                """
+                INSERT INTO sgac_resumen_publicaciones
+                    (anno, tipo_publicacion, nivel, cantidad)
+                SELECT anno, tipo_publicacion, nivel, COUNT(*)
+                FROM sgac_publicaciones
+                GROUP BY 1, 2, 3
+                """,
+                """
+                INSERT INTO sgac_resumen_eventos (anno, clasificacion, cantidad)
+                SELECT anno, clasificacion, COUNT(*)
+                FROM sgac_eventos
+                GROUP BY 1, 2
+                """,
+                """
+                INSERT INTO sgac_resumen_premios (anno, clasificacion, cantidad)
+                SELECT anno, clasificacion, COUNT(*)
+                FROM sgac_premios
+                GROUP BY 1, 2
+                """,
+                """
+                INSERT INTO sgac_resumen_evaluaciones
+                    (id_indicador, anno, evaluacion, cantidad)
+                SELECT id_indicador, EXTRACT(YEAR FROM fecha)::integer, evaluacion,
+                       COUNT(*)
+                FROM sgac_profesores_indicadorevaluacion
+                GROUP BY 1, 2, 3
+                """,
+            ],
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
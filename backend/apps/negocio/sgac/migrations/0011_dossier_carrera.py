@@ -0,0 +1,61 @@
+# Generated by Django 5.1.5 on 2026-10-18 19:38
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sgac", "0010_resumenes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DossierCarrera",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "version",
+                    models.PositiveIntegerField(db_column="version", default=0),
+                ),
+                ("vigente", models.BooleanField(db_column="vigente", default=False)),
+                (
+                    "contenido",
+                    models.JSONField(
+                        db_column="contenido",
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                (
+                    "generado",
+                    models.DateTimeField(blank=True, db_column="generado", null=True),
+                ),
+                (
+                    "carrera",
+                    models.OneToOneField(
+                        db_column="id_carrera",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dossier",
+                        to="sgac.carrera",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Dossier de Carrera",
+                "verbose_name_plural": "Dossiers de Carreras",
+                "db_table": "sgac_dossiers_carrera",
+                "managed": True,
+            },
+        ),
+    ]
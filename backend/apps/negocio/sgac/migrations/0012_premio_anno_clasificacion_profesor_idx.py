@@ -0,0 +1,30 @@
+# Generated by Django 5.1.5 on 2026-10-18 19:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sgac", "0011_dossier_carrera"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="premio",
+            index=models.Index(
+                fields=["anno", "clasificacion"], name="sgac_premio_anno_clasif_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="premio",
+            index=models.Index(
+                fields=["profesor", "anno"], name="sgac_premio_profesor_anno_idx"
+            ),
+        ),
+        # Las instantáneas existentes no incluyen los premios por profesor
+        migrations.RunSQL(
+            sql="UPDATE sgac_dossiers_carrera SET vigente = FALSE",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
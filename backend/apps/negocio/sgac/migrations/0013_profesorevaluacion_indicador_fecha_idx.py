@@ -0,0 +1,24 @@
+# Generated by Django 5.1.5 on 2026-10-18 19:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sgac", "0012_premio_anno_clasificacion_profesor_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="profesorevaluacion",
+            index=models.Index(
+                fields=["indicador", "fecha"], name="sgac_prof_eval_ind_fecha_idx"
+            ),
+        ),
+        # Las instantáneas existentes no incluyen los porcentajes de evaluación
+        migrations.RunSQL(
+            sql="UPDATE sgac_dossiers_carrera SET vigente = FALSE",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.5 on 2026-10-18 19:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sgac", "0013_profesorevaluacion_indicador_fecha_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="evento",
+            index=models.Index(
+                fields=["clasificacion", "anno"], name="sgac_evento_clasif_anno_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="premio",
+            index=models.Index(
+                fields=["clasificacion", "anno"], name="sgac_premio_clasif_anno_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profesor",
+            index=models.Index(
+                fields=["categoria_docente", "grado_cientifico"],
+                name="sgac_prof_categoria_grado_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profesor",
+            index=models.Index(fields=["grado_cientifico"], name="sgac_prof_grado_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="profesorevaluacion",
+            index=models.Index(fields=["fecha"], name="sgac_prof_eval_fecha_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="publicacion",
+            index=models.Index(
+                fields=["tipo_publicacion", "nivel", "anno"],
+                name="sgac_pub_tipo_nivel_anno_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.5 on 2026-10-18 19:58
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sgac", "0014_indices_filtros"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="publicacion",
+            name="busqueda",
+            field=models.GeneratedField(
+                db_column="busqueda",
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.SearchVector(
+                            "titulo", config="spanish", weight="A"
+                        ),
+                        "||",
+                        django.contrib.postgres.search.SearchVector(
+                            "revista_editorial", config="spanish", weight="B"
+                        ),
+                        django.contrib.postgres.search.SearchConfig("spanish"),
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "isbn_issn", config="spanish", weight="C"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("spanish"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="publicacion",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["busqueda"], name="sgac_pub_busqueda_idx"
+            ),
+        ),
+    ]
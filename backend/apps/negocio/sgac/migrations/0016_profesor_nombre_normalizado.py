@@ -0,0 +1,57 @@
+# Generated by Django 5.1.5 on 2026-10-18 20:00
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+import general.busqueda
+from django.contrib.postgres.operations import TrigramExtension, UnaccentExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sgac", "0015_publicacion_busqueda"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        UnaccentExtension(),
+        # ``unaccent`` es solo STABLE porque depende del diccionario por
+        # defecto; fijándolo se puede usar en columnas generadas e índices
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION sgac_unaccent(text) RETURNS text
+                LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+                AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+            """,
+            reverse_sql="DROP FUNCTION IF EXISTS sgac_unaccent(text)",
+        ),
+        migrations.AddField(
+            model_name="profesor",
+            name="nombre_normalizado",
+            field=models.GeneratedField(
+                db_column="nombre_normalizado",
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower(
+                    general.busqueda.SinTildes(
+                        django.db.models.functions.text.Concat(
+                            "nombre",
+                            models.Value(" "),
+                            "primer_apellido",
+                            models.Value(" "),
+                            "segundo_apellido",
+                        )
+                    )
+                ),
+                output_field=models.TextField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profesor",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["nombre_normalizado"],
+                name="sgac_prof_nombre_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
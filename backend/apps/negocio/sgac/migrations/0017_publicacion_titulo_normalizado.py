@@ -0,0 +1,38 @@
+# Generated by Django 5.1.5 on 2026-10-18 20:02
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+import general.busqueda
+from django.contrib.postgres.operations import BtreeGinExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sgac", "0016_profesor_nombre_normalizado"),
+    ]
+
+    operations = [
+        BtreeGinExtension(),
+        migrations.AddField(
+            model_name="publicacion",
+            name="titulo_normalizado",
+            field=models.GeneratedField(
+                db_column="titulo_normalizado",
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower(
+                    general.busqueda.SinTildes("titulo")
+                ),
+                output_field=models.TextField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="publicacion",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["anno", "titulo_normalizado"],
+                name="sgac_pub_anno_titulo_trgm_idx",
+                opclasses=["int4_ops", "gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -11,3 +11,5 @@ from .profesor_asignatura import *
 from .profesor_premio import *
 from .profesor_publicacion import *
 from .profesor_evaluacion import *
+from .resumen import *
+from .dossier import *
@@ -0,0 +1,38 @@
+from django.contrib.admin import ModelAdmin
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class DossierCarrera(models.Model):
+    carrera = models.OneToOneField(
+        "Carrera",
+        on_delete=models.CASCADE,
+        related_name="dossier",
+        db_column="id_carrera",
+    )
+    version = models.PositiveIntegerField(default=0, db_column="version")
+    vigente = models.BooleanField(default=False, db_column="vigente")
+    contenido = models.JSONField(
+        default=dict, encoder=DjangoJSONEncoder, db_column="contenido"
+    )
+    generado = models.DateTimeField(null=True, blank=True, db_column="generado")
+
+    def __str__(self):
+        return f"Dossier de {self.carrera} (v{self.version})"
+
+    @property
+    def etag(self):
+        return f'"{self.carrera_id}-{self.version}"'
+
+    class Meta:
+        db_table = "sgac_dossiers_carrera"
+        managed = True
+        verbose_name = "Dossier de Carrera"
+        verbose_name_plural = "Dossiers de Carreras"
+
+    class Admin(ModelAdmin):
+        list_display = ["carrera", "version", "vigente", "generado"]
+        readonly_fields = ["contenido"]
+
+
+__all__ = ["DossierCarrera"]
@@ -27,6 +27,16 @@ class Evento(models.Model):
         managed = True
         verbose_name = "Evento"
         verbose_name_plural = "Eventos"
+        indexes = [
+            models.Index(
+                fields=["anno", "clasificacion"],
+                name="sgac_evento_anno_clasif_idx",
+            ),
+            models.Index(
+                fields=["clasificacion", "anno"],
+                name="sgac_evento_clasif_anno_idx",
+            ),
+        ]
 
     class Admin(ModelAdmin):
         pass
@@ -39,6 +39,20 @@ class Premio(models.Model):
         managed = True
         verbose_name = "Premio"
         verbose_name_plural = "Premios"
+        indexes = [
+            models.Index(
+                fields=["anno", "clasificacion"],
+                name="sgac_premio_anno_clasif_idx",
+            ),
+            models.Index(
+                fields=["profesor", "anno"],
+                name="sgac_premio_profesor_anno_idx",
+            ),
+            models.Index(
+                fields=["clasificacion", "anno"],
+                name="sgac_premio_clasif_anno_idx",
+            ),
+        ]
 
     class Admin(admin.ModelAdmin):
         pass
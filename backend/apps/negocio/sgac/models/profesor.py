@@ -1,7 +1,11 @@
 from django.contrib.admin import ModelAdmin
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models.functions import Concat, Lower
 from django.utils.translation import gettext_lazy as _
 
+from general.busqueda import SinTildes
+
 
 class Profesor(models.Model):
     class CategoriaDocente(models.TextChoices):
@@ -47,6 +51,24 @@ class Profesor(models.Model):
         blank=True,
         db_column="dr_especialidad_afin"
     )
+    # Nombre completo en minúsculas y sin tildes para las búsquedas por
+    # similitud. Es una columna generada que mantiene PostgreSQL
+    nombre_normalizado = models.GeneratedField(
+        expression=Lower(
+            SinTildes(
+                Concat(
+                    "nombre",
+                    models.Value(" "),
+                    "primer_apellido",
+                    models.Value(" "),
+                    "segundo_apellido",
+                )
+            )
+        ),
+        output_field=models.TextField(),
+        db_persist=True,
+        db_column="nombre_normalizado",
+    )
 
     def __str__(self):
         return self.nombre + " " + self.primer_apellido + " " + self.segundo_apellido
@@ -56,6 +78,21 @@ class Profesor(models.Model):
         managed = True
         verbose_name = "Profesor"
         verbose_name_plural = "Profesores"
+        indexes = [
+            models.Index(
+                fields=["categoria_docente", "grado_cientifico"],
+                name="sgac_prof_categoria_grado_idx",
+            ),
+            models.Index(
+                fields=["grado_cientifico"],
+                name="sgac_prof_grado_idx",
+            ),
+            GinIndex(
+                fields=["nombre_normalizado"],
+                opclasses=["gin_trgm_ops"],
+                name="sgac_prof_nombre_trgm_idx",
+            ),
+        ]
 
     class Admin(ModelAdmin):
         pass
@@ -30,6 +30,16 @@ class ProfesorEvaluacion(models.Model):
         managed = True
         verbose_name = "Profesor Evaluacion"
         verbose_name_plural = "Profesores Evaluaciones"
+        indexes = [
+            models.Index(
+                fields=["indicador", "fecha"],
+                name="sgac_prof_eval_ind_fecha_idx",
+            ),
+            models.Index(
+                fields=["fecha"],
+                name="sgac_prof_eval_fecha_idx",
+            ),
+        ]
 
     class Admin(admin.ModelAdmin):
         pass
@@ -1,8 +1,13 @@
 from django.contrib import admin
 from django.contrib.admin import ModelAdmin
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Lower
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from general.busqueda import SinTildes
+
 
 class PublicacionClasificacion(models.Model):
 
@@ -21,6 +26,12 @@ class PublicacionClasificacion(models.Model):
         pass
 
 
+class PublicacionManager(models.Manager):
+    def get_queryset(self):
+        # Las columnas de búsqueda solo se usan en filtros; no se leen por defecto
+        return super().get_queryset().defer("busqueda", "titulo_normalizado")
+
+
 class Publicacion(models.Model):
     TIPO_CHOICES = [
         ('articulo', 'Artículo'),
@@ -54,6 +65,30 @@ class Publicacion(models.Model):
         ]
     )
 
+    # Vector de búsqueda de texto completo. Es una columna generada, así que
+    # PostgreSQL lo mantiene al día en cada escritura, incluidas las masivas
+    busqueda = models.GeneratedField(
+        expression=(
+            SearchVector("titulo", weight="A", config="spanish")
+            + SearchVector("revista_editorial", weight="B", config="spanish")
+            + SearchVector("isbn_issn", weight="C", config="spanish")
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        db_column="busqueda",
+    )
+
+    # Título en minúsculas y sin tildes para detectar publicaciones
+    # duplicadas por similitud de trigramas
+    titulo_normalizado = models.GeneratedField(
+        expression=Lower(SinTildes("titulo")),
+        output_field=models.TextField(),
+        db_persist=True,
+        db_column="titulo_normalizado",
+    )
+
+    objects = PublicacionManager()
+
     def __str__(self):
         return self.titulo
 
@@ -62,6 +97,24 @@ class Publicacion(models.Model):
         managed = True
         verbose_name = "Publicacion"
         verbose_name_plural = "Publicaciones"
+        indexes = [
+            models.Index(
+                fields=["anno", "tipo_publicacion", "nivel"],
+                name="sgac_pub_anno_tipo_nivel_idx",
+            ),
+            models.Index(
+                fields=["tipo_publicacion", "nivel", "anno"],
+                name="sgac_pub_tipo_nivel_anno_idx",
+            ),
+            GinIndex(fields=["busqueda"], name="sgac_pub_busqueda_idx"),
+            # ``btree_gin`` permite combinar la igualdad del año con la
+            # similitud del título en un mismo índice
+            GinIndex(
+                fields=["anno", "titulo_normalizado"],
+                opclasses=["int4_ops", "gin_trgm_ops"],
+                name="sgac_pub_anno_titulo_trgm_idx",
+            ),
+        ]
 
     class Admin(ModelAdmin):
         pass
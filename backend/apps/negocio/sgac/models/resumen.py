@@ -0,0 +1,128 @@
+from django.contrib.admin import ModelAdmin
+from django.db import models
+
+
+class ResumenClaustro(models.Model):
+    categoria_docente = models.CharField(max_length=255, db_column="categoria_docente")
+    grado_cientifico = models.CharField(max_length=255, db_column="grado_cientifico")
+    especialidad_afin = models.BooleanField(
+        default=False, db_column="especialidad_afin"
+    )
+    cantidad = models.PositiveIntegerField(default=0, db_column="cantidad")
+
+    class Meta:
+        db_table = "sgac_resumen_claustro"
+        managed = True
+        verbose_name = "Resumen del Claustro"
+        verbose_name_plural = "Resúmenes del Claustro"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["categoria_docente", "grado_cientifico", "especialidad_afin"],
+                name="sgac_resumen_claustro_uniq",
+            ),
+        ]
+
+    class Admin(ModelAdmin):
+        list_display = [
+            "categoria_docente",
+            "grado_cientifico",
+            "especialidad_afin",
+            "cantidad",
+        ]
+
+
+class ResumenPublicaciones(models.Model):
+    anno = models.IntegerField(db_column="anno")
+    tipo_publicacion = models.CharField(max_length=500, db_column="tipo_publicacion")
+    nivel = models.IntegerField(db_column="nivel")
+    cantidad = models.PositiveIntegerField(default=0, db_column="cantidad")
+
+    class Meta:
+        db_table = "sgac_resumen_publicaciones"
+        managed = True
+        verbose_name = "Resumen de Publicaciones"
+        verbose_name_plural = "Resúmenes de Publicaciones"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["anno", "tipo_publicacion", "nivel"],
+                name="sgac_resumen_publicaciones_uniq",
+            ),
+        ]
+
+    class Admin(ModelAdmin):
+        list_display = ["anno", "tipo_publicacion", "nivel", "cantidad"]
+
+
+class ResumenEventos(models.Model):
+    anno = models.IntegerField(db_column="anno")
+    clasificacion = models.CharField(max_length=255, db_column="clasificacion")
+    cantidad = models.PositiveIntegerField(default=0, db_column="cantidad")
+
+    class Meta:
+        db_table = "sgac_resumen_eventos"
+        managed = True
+        verbose_name = "Resumen de Eventos"
+        verbose_name_plural = "Resúmenes de Eventos"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["anno", "clasificacion"],
+                name="sgac_resumen_eventos_uniq",
+            ),
+        ]
+
+    class Admin(ModelAdmin):
+        list_display = ["anno", "clasificacion", "cantidad"]
+
+
+class ResumenPremios(models.Model):
+    anno = models.IntegerField(db_column="anno")
+    clasificacion = models.CharField(max_length=50, db_column="clasificacion")
+    cantidad = models.PositiveIntegerField(default=0, db_column="cantidad")
+
+    class Meta:
+        db_table = "sgac_resumen_premios"
+        managed = True
+        verbose_name = "Resumen de Premios"
+        verbose_name_plural = "Resúmenes de Premios"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["anno", "clasificacion"],
+                name="sgac_resumen_premios_uniq",
+            ),
+        ]
+
+    class Admin(ModelAdmin):
+        list_display = ["anno", "clasificacion", "cantidad"]
+
+
+class ResumenEvaluaciones(models.Model):
+    indicador = models.ForeignKey(
+        "IndicadorEvaluacion", on_delete=models.CASCADE, db_column="id_indicador"
+    )
+    anno = models.IntegerField(db_column="anno")
+    evaluacion = models.CharField(max_length=2, db_column="evaluacion")
+    cantidad = models.PositiveIntegerField(default=0, db_column="cantidad")
+
+    class Meta:
+        db_table = "sgac_resumen_evaluaciones"
+        managed = True
+        verbose_name = "Resumen de Evaluaciones"
+        verbose_name_plural = "Resúmenes de Evaluaciones"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["indicador", "anno", "evaluacion"],
+                name="sgac_resumen_evaluaciones_uniq",
+            ),
+        ]
+
+    class Admin(ModelAdmin):
+        list_display = ["indicador", "anno", "evaluacion", "cantidad"]
+
+
+__all__ = [
+    "ResumenClaustro",
+    "ResumenEventos",
+    "ResumenEvaluaciones",
+    "ResumenPremios",
+    "ResumenPublicaciones",
+]
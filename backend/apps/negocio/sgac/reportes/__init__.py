@@ -0,0 +1,11 @@
+from .claustro import *
+from .publicaciones import *
+from .ponencias import *
+from .experiencia import *
+from .grados import *
+from .premios import *
+from .evaluaciones import *
+from .dossier import *
+from .exportacion import *
+from .productividad import *
+from .duplicados import *
@@ -0,0 +1,139 @@
+from apps.negocio.sgac.models import Asignatura, Profesor
+from apps.negocio.sgac.reportes.filtros import profesores_de_carrera
+from apps.negocio.sgac.reportes.resumenes import RESUMEN_CLAUSTRO
+
+
+def reporte_claustro(carrera=None):
+    """
+    Composición del claustro por categoría docente, calculada con un único
+    ``GROUP BY categoria_docente`` sobre el resumen del claustro o, si se
+    restringe a una carrera, sobre sus profesores.
+    """
+    origen = profesores_de_carrera(Profesor.objects.all(), carrera) if carrera else None
+    conteos = dict(RESUMEN_CLAUSTRO.contar_por(["categoria_docente"], origen))
+
+    categorias = [
+        {
+            "categoria": categoria.value,
+            "nombre": categoria.label,
+            "cantidad": conteos.get(categoria.value, 0),
+        }
+        for categoria in Profesor.CategoriaDocente
+    ]
+    total_claustro = sum(conteos.values())
+    total_titulares_auxiliares = conteos.get(
+        Profesor.CategoriaDocente.TITULAR, 0
+    ) + conteos.get(Profesor.CategoriaDocente.AUXILIAR, 0)
+    porcentaje_titulares_auxiliares = (
+        round(total_titulares_auxiliares * 100 / total_claustro, 1)
+        if total_claustro
+        else 0
+    )
+
+    return {
+        "categorias": categorias,
+        "total_claustro": total_claustro,
+        "total_titulares_auxiliares": total_titulares_auxiliares,
+        "porcentaje_titulares_auxiliares": porcentaje_titulares_auxiliares,
+    }
+
+
+def _conteo_por_valor(choices, valores):
+    return {choice.value: valores.count(choice.value) for choice in choices}
+
+
+def reporte_claustro_asignaturas(carrera):
+    """
+    Profesores de cada asignatura de la carrera, agrupados por disciplina,
+    con sus conteos por categoría docente y grado científico. Se resuelve con
+    una sola consulta que une asignaturas, disciplinas y profesores.
+    """
+    registros = (
+        Asignatura.objects.filter(disciplina__carrera=carrera)
+        .values_list(
+            "disciplina_id",
+            "disciplina__codigo",
+            "disciplina__nombre",
+            "id",
+            "codigo",
+            "nombre",
+            "profesores__id",
+            "profesores__nombre",
+            "profesores__primer_apellido",
+            "profesores__segundo_apellido",
+            "profesores__categoria_docente",
+            "profesores__grado_cientifico",
+            "profesores__annos_experiencia_mes",
+        )
+        .order_by(
+            "disciplina__codigo", "disciplina_id", "codigo", "id", "profesores__id"
+        )
+    )
+
+    disciplinas = {}
+    asignaturas = {}
+    for (
+        id_disciplina,
+        codigo_disciplina,
+        nombre_disciplina,
+        id_asignatura,
+        codigo,
+        nombre,
+        id_profesor,
+        nombre_profesor,
+        primer_apellido,
+        segundo_apellido,
+        categoria_docente,
+        grado_cientifico,
+        annos_experiencia_mes,
+    ) in registros:
+        if id_disciplina not in disciplinas:
+            disciplinas[id_disciplina] = {
+                "id": id_disciplina,
+                "codigo": codigo_disciplina,
+                "nombre": nombre_disciplina,
+                "asignaturas": [],
+            }
+        if id_asignatura not in asignaturas:
+            asignaturas[id_asignatura] = {
+                "id": id_asignatura,
+                "codigo": codigo,
+                "nombre": nombre,
+                "profesores": [],
+            }
+            disciplinas[id_disciplina]["asignaturas"].append(asignaturas[id_asignatura])
+        if id_profesor is not None:
+            asignaturas[id_asignatura]["profesores"].append(
+                {
+                    "id": id_profesor,
+                    "nombre_completo": " ".join(
+                        filter(
+                            None, [nombre_profesor, primer_apellido, segundo_apellido]
+                        )
+                    ),
+                    "categoria_docente": categoria_docente,
+                    "grado_cientifico": grado_cientifico,
+                    "annos_experiencia_mes": annos_experiencia_mes,
+                }
+            )
+
+    for asignatura in asignaturas.values():
+        profesores = asignatura["profesores"]
+        categorias = [profesor["categoria_docente"] for profesor in profesores]
+        grados = [profesor["grado_cientifico"] for profesor in profesores]
+        asignatura["total"] = len(profesores)
+        asignatura["categorias"] = _conteo_por_valor(
+            Profesor.CategoriaDocente, categorias
+        )
+        asignatura["grados"] = _conteo_por_valor(Profesor.GradoCientifico, grados)
+        # El profesor principal es el de mayor experiencia en el MES
+        asignatura["profesor_principal"] = max(
+            profesores,
+            key=lambda profesor: profesor["annos_experiencia_mes"],
+            default=None,
+        )
+
+    return {"disciplinas": list(disciplinas.values())}
+
+
+__all__ = ["reporte_claustro", "reporte_claustro_asignaturas"]
@@ -0,0 +1,83 @@
+from django.db import transaction
+from django.utils import timezone
+
+from apps.negocio.sgac.models import DossierCarrera
+from apps.negocio.sgac.reportes.claustro import (
+    reporte_claustro,
+    reporte_claustro_asignaturas,
+)
+from apps.negocio.sgac.reportes.evaluaciones import reporte_evaluaciones
+from apps.negocio.sgac.reportes.experiencia import (
+    LIMITES_EXPERIENCIA,
+    reporte_experiencia,
+)
+from apps.negocio.sgac.reportes.grados import reporte_grados
+from apps.negocio.sgac.reportes.pivote import rango_annos_por_defecto
+from apps.negocio.sgac.reportes.ponencias import reporte_ponencias
+from apps.negocio.sgac.reportes.premios import reporte_premios
+from apps.negocio.sgac.reportes.publicaciones import reporte_publicaciones
+
+
+def generar_dossier(carrera):
+    """Calcula todas las secciones del dossier de acreditación de una carrera."""
+    anno_inicio, anno_fin = rango_annos_por_defecto()
+    return {
+        "carrera": {"id": carrera.pk, "nombre": carrera.nombre},
+        "anno_inicio": anno_inicio,
+        "anno_fin": anno_fin,
+        "claustro": reporte_claustro(carrera),
+        "claustro_asignaturas": reporte_claustro_asignaturas(carrera),
+        "experiencia": reporte_experiencia(LIMITES_EXPERIENCIA, carrera),
+        "grados": reporte_grados(carrera),
+        "publicaciones": reporte_publicaciones(anno_inicio, anno_fin, carrera),
+        "ponencias": reporte_ponencias(anno_inicio, anno_fin, carrera=carrera),
+        "premios": reporte_premios(anno_inicio, anno_fin, carrera),
+        "evaluaciones": reporte_evaluaciones(anno_inicio, anno_fin, carrera),
+    }
+
+
+def _vigente(dossier):
+    # Al cambiar de año el rango de años por defecto también cambia
+    return dossier.vigente and dossier.contenido.get("anno_fin") == (
+        rango_annos_por_defecto()[1]
+    )
+
+
+def obtener_dossier(carrera):
+    """
+    Devuelve la instantánea vigente del dossier de la carrera, regenerándola
+    con una nueva versión si fue invalidada. La regeneración bloquea la fila
+    del dossier, de modo que una invalidación concurrente espera a que termine
+    y vuelve a marcarla como no vigente.
+    """
+    dossier = DossierCarrera.objects.filter(carrera=carrera).first()
+    if dossier is not None and _vigente(dossier):
+        return dossier
+
+    with transaction.atomic():
+        dossier, _ = DossierCarrera.objects.select_for_update().get_or_create(
+            carrera=carrera
+        )
+        if _vigente(dossier):
+            return dossier
+        dossier.contenido = generar_dossier(carrera)
+        dossier.version += 1
+        dossier.vigente = True
+        dossier.generado = timezone.now()
+        dossier.save()
+    return dossier
+
+
+def invalidar_dossiers(carreras):
+    """Marca como no vigentes, al confirmar la transacción, los dossiers de ``carreras``."""
+    carreras = set(carreras)
+    if not carreras:
+        return
+    transaction.on_commit(
+        lambda: DossierCarrera.objects.filter(carrera_id__in=carreras).update(
+            vigente=False
+        )
+    )
+
+
+__all__ = ["generar_dossier", "invalidar_dossiers", "obtener_dossier"]
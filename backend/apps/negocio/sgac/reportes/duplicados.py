@@ -0,0 +1,153 @@
+from django.db import connections, router, transaction
+from django.db.models import Prefetch
+
+from apps.negocio.sgac.models import ProfesorPublicacion, Publicacion
+
+# Similitud de trigramas mínima entre los títulos de dos publicaciones del
+# mismo año para considerarlas la misma
+SIMILITUD_TITULO = 0.6
+
+# Similitud mínima cuando además coincide el ISBN/ISSN. No basta con el ISSN,
+# que comparten todos los artículos de una revista
+SIMILITUD_TITULO_MISMO_ISBN = 0.3
+
+# ISBN/ISSN sin guiones ni espacios, para que ``978-959`` coincida con ``978959``
+_ISBN = "upper(regexp_replace({tabla}.isbn_issn, '[^0-9A-Za-z]', '', 'g'))"
+
+# El operador ``%`` de ``pg_trgm`` compara con ``pg_trgm.similarity_threshold``
+# y lo resuelve el índice GIN ``(anno, titulo_normalizado)``: cada publicación
+# se une solo con las de su año que se le parecen, sin comparar todos los pares
+_PARES = """
+    SELECT
+        a.id,
+        b.id,
+        similarity(a.titulo_normalizado, b.titulo_normalizado) AS similitud,
+        {isbn_a} <> '' AND {isbn_a} = {isbn_b} AS mismo_isbn
+    FROM {tabla} a
+    JOIN {tabla} b
+        ON b.anno = a.anno
+        AND b.titulo_normalizado %% a.titulo_normalizado
+        AND b.id > a.id
+    WHERE {condicion}
+    ORDER BY a.id, b.id
+"""
+
+
+def _pares(similitud, anno):
+    """``(id_a, id_b, similitud, mismo_isbn)`` de cada par candidato."""
+    condicion = "({isbn_a} <> '' AND {isbn_a} = {isbn_b}) OR {similitud} >= %s"
+    parametros = [similitud]
+    if anno is not None:
+        condicion = f"({condicion}) AND a.anno = %s"
+        parametros.append(anno)
+    isbn_a, isbn_b = _ISBN.format(tabla="a"), _ISBN.format(tabla="b")
+    sql = _PARES.format(
+        tabla=Publicacion._meta.db_table,
+        isbn_a=isbn_a,
+        isbn_b=isbn_b,
+        condicion=condicion.format(
+            isbn_a=isbn_a,
+            isbn_b=isbn_b,
+            similitud="similarity(a.titulo_normalizado, b.titulo_normalizado)",
+        ),
+    )
+
+    alias = router.db_for_read(Publicacion)
+    with transaction.atomic(using=alias), connections[alias].cursor() as cursor:
+        # ``set_config(..., true)`` solo dura hasta el fin de la transacción
+        cursor.execute(
+            "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+            [str(min(similitud, SIMILITUD_TITULO_MISMO_ISBN))],
+        )
+        cursor.execute(sql, parametros)
+        return cursor.fetchall()
+
+
+def _agrupar(pares):
+    """Une los pares que comparten publicaciones: si A~B y B~C, {A, B, C}."""
+    raiz = {}
+
+    def buscar(id_publicacion):
+        raiz.setdefault(id_publicacion, id_publicacion)
+        while raiz[id_publicacion] != id_publicacion:
+            raiz[id_publicacion] = raiz[raiz[id_publicacion]]
+            id_publicacion = raiz[id_publicacion]
+        return id_publicacion
+
+    for id_a, id_b, *_ in pares:
+        raiz[buscar(id_b)] = buscar(id_a)
+
+    grupos = {}
+    for par in pares:
+        grupos.setdefault(buscar(par[0]), []).append(par)
+    return list(grupos.values())
+
+
+def _publicacion(publicacion):
+    return {
+        "id": publicacion.pk,
+        "anno": publicacion.anno,
+        "titulo": publicacion.titulo,
+        "tipo_publicacion": publicacion.tipo_publicacion,
+        "isbn_issn": publicacion.isbn_issn,
+        "autores": [
+            {
+                "profesor": autor.profesor_id,
+                "nombre": str(autor.profesor),
+                "participacion": autor.participacion,
+            }
+            for autor in publicacion.profesorpublicacion_set.all()
+        ],
+    }
+
+
+def candidatos_duplicados(similitud=SIMILITUD_TITULO, anno=None):
+    """
+    Publicaciones registradas más de una vez, por ejemplo por cada uno de sus
+    autores, agrupadas como candidatas a fusionarse. Dos publicaciones del
+    mismo año son candidatas si sus títulos normalizados tienen una similitud
+    de trigramas de al menos ``similitud``, o de
+    ``SIMILITUD_TITULO_MISMO_ISBN`` si además tienen el mismo ISBN/ISSN.
+
+    Los pares se obtienen con un único self-join apoyado en el índice de
+    trigramas, y los que comparten publicaciones se unen en un mismo grupo.
+    Los grupos se ordenan de mayor a menor similitud.
+    """
+    grupos = _agrupar(_pares(similitud, anno))
+    ids = {
+        id_publicacion
+        for grupo in grupos
+        for par in grupo
+        for id_publicacion in par[:2]
+    }
+    publicaciones = Publicacion.objects.prefetch_related(
+        Prefetch(
+            "profesorpublicacion_set",
+            ProfesorPublicacion.objects.select_related("profesor").order_by("pk"),
+        )
+    ).in_bulk(ids)
+
+    candidatos = []
+    for grupo in grupos:
+        ids_grupo = sorted(
+            {id_publicacion for par in grupo for id_publicacion in par[:2]}
+        )
+        candidatos.append(
+            {
+                "similitud": round(max(par[2] for par in grupo), 3),
+                "publicaciones": [_publicacion(publicaciones[pk]) for pk in ids_grupo],
+                "pares": [
+                    {
+                        "publicaciones": [id_a, id_b],
+                        "similitud": round(similitud_par, 3),
+                        "mismo_isbn_issn": mismo_isbn,
+                    }
+                    for id_a, id_b, similitud_par, mismo_isbn in grupo
+                ],
+            }
+        )
+    candidatos.sort(key=lambda candidato: -candidato["similitud"])
+    return candidatos
+
+
+__all__ = ["candidatos_duplicados"]
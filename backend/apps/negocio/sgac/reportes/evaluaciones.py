@@ -0,0 +1,62 @@
+from apps.negocio.sgac.models import IndicadorEvaluacion, ProfesorEvaluacion
+from apps.negocio.sgac.reportes.filtros import profesores_de_carrera
+from apps.negocio.sgac.reportes.pivote import porcentaje
+from apps.negocio.sgac.reportes.resumenes import RESUMEN_EVALUACIONES
+
+
+def reporte_evaluaciones(anno_inicio, anno_fin, carrera=None):
+    """
+    Cantidad y porcentaje de cada valor de evaluación por indicador y año,
+    calculados con una única consulta agregada sobre el resumen de
+    evaluaciones o, si se restringe a una carrera, sobre las evaluaciones de
+    sus profesores.
+    """
+    annos = list(range(anno_inicio, anno_fin + 1))
+    origen = None
+    if carrera is not None:
+        origen = profesores_de_carrera(
+            ProfesorEvaluacion.objects.all(), carrera, campo="profesor_id"
+        )
+    registros = RESUMEN_EVALUACIONES.contar_por(
+        ["indicador_id", "anno", "evaluacion"],
+        origen,
+        # Sin carrera se filtra la columna entera ``anno`` del resumen. Con
+        # carrera se cuenta sobre las evaluaciones, y gte/lte (y no range)
+        # sobre el año extraído de ``fecha`` se traduce en comparaciones de
+        # fechas sobre la columna, que aprovechan su índice
+        anno__gte=anno_inicio,
+        anno__lte=anno_fin,
+    )
+    conteos = {
+        (indicador, anno, evaluacion): cantidad
+        for indicador, anno, evaluacion, cantidad in registros
+    }
+
+    indicadores = []
+    for id_indicador, nombre in IndicadorEvaluacion.objects.order_by("id").values_list(
+        "id", "nombre"
+    ):
+        filas = []
+        for anno in annos:
+            valores = {
+                valor.value: conteos.get((id_indicador, anno, valor.value), 0)
+                for valor in ProfesorEvaluacion.ValorEvaluacion
+            }
+            total = sum(valores.values())
+            filas.append(
+                {
+                    "anno": anno,
+                    "valores": valores,
+                    "porcentajes": {
+                        valor: porcentaje(cantidad, total)
+                        for valor, cantidad in valores.items()
+                    },
+                    "total": total,
+                }
+            )
+        indicadores.append({"id": id_indicador, "nombre": nombre, "annos": filas})
+
+    return {"annos": annos, "indicadores": indicadores}
+
+
+__all__ = ["reporte_evaluaciones"]
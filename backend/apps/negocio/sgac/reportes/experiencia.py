@@ -0,0 +1,69 @@
+from django.db.models import Avg, Count, Q
+
+from apps.negocio.sgac.models import Profesor
+from apps.negocio.sgac.reportes.filtros import profesores_de_carrera
+
+CAMPOS_EXPERIENCIA = ["annos_experiencia_carrera", "annos_experiencia_mes"]
+LIMITES_EXPERIENCIA = [5, 10, 15, 20]
+
+
+def rangos_de_experiencia(limites):
+    """
+    Convierte los límites ``[5, 10]`` en los rangos ``[0, 4]``, ``[5, 9]`` y
+    ``[10, ∞)``. El extremo superior de cada rango es inclusivo.
+    """
+    desdes = [0, *limites]
+    hastas = [limite - 1 for limite in limites] + [None]
+    return list(zip(desdes, hastas))
+
+
+def _condicion(campo, desde, hasta):
+    condicion = Q(**{f"{campo}__gte": desde})
+    if hasta is not None:
+        condicion &= Q(**{f"{campo}__lte": hasta})
+    return condicion
+
+
+def reporte_experiencia(limites, carrera=None):
+    """
+    Distribución de los años de experiencia (en la carrera y en el MES) por
+    rangos. Todos los rangos de ambos campos se cuentan en un único
+    ``aggregate`` con conteos condicionales.
+    """
+    rangos = rangos_de_experiencia(limites)
+    agregados = {"total": Count("id")}
+    for campo in CAMPOS_EXPERIENCIA:
+        agregados[f"{campo}__promedio"] = Avg(campo)
+        for indice, (desde, hasta) in enumerate(rangos):
+            agregados[f"{campo}__{indice}"] = Count(
+                "id", filter=_condicion(campo, desde, hasta)
+            )
+
+    resultado = profesores_de_carrera(Profesor.objects.all(), carrera).aggregate(
+        **agregados
+    )
+    total = resultado["total"]
+
+    reporte = {"total_claustro": total}
+    for campo in CAMPOS_EXPERIENCIA:
+        promedio = resultado[f"{campo}__promedio"]
+        reporte[campo] = {
+            "promedio": round(promedio, 2) if promedio is not None else 0,
+            "rangos": [
+                {
+                    "desde": desde,
+                    "hasta": hasta,
+                    "cantidad": resultado[f"{campo}__{indice}"],
+                    "porcentaje": (
+                        round(resultado[f"{campo}__{indice}"] * 100 / total, 2)
+                        if total
+                        else 0
+                    ),
+                }
+                for indice, (desde, hasta) in enumerate(rangos)
+            ],
+        }
+    return reporte
+
+
+__all__ = ["reporte_experiencia"]
@@ -0,0 +1,265 @@
+from apps.negocio.sgac.models import Evento, Profesor, ProfesorEvaluacion, Publicacion
+from apps.negocio.sgac.reportes.experiencia import CAMPOS_EXPERIENCIA
+from apps.negocio.sgac.reportes.filtros import eventos_de, publicaciones_de
+from general.exportacion import Hoja
+
+# Filas leídas por viaje al cursor del servidor en los detalles exportados
+TAMANO_LOTE = 2000
+
+TITULOS_EXPERIENCIA = {
+    "annos_experiencia_carrera": "Experiencia en la carrera",
+    "annos_experiencia_mes": "Experiencia en el MES",
+}
+
+
+def hoja_pivote(titulo, reporte):
+    annos = reporte["annos"]
+    return Hoja(
+        titulo,
+        ["Clasificación", *annos, "Total"],
+        (
+            [fila["clasificacion"], *[fila[str(anno)] for anno in annos], fila["total"]]
+            for fila in reporte["filas"]
+        ),
+    )
+
+
+def hojas_claustro(reporte, **parametros):
+    filas = [
+        [categoria["nombre"], categoria["cantidad"]]
+        for categoria in reporte["categorias"]
+    ]
+    filas += [
+        ["Total del claustro", reporte["total_claustro"]],
+        ["Total de titulares y auxiliares", reporte["total_titulares_auxiliares"]],
+        ["% de titulares y auxiliares", reporte["porcentaje_titulares_auxiliares"]],
+    ]
+    return [Hoja("Claustro", ["Categoría docente", "Cantidad"], filas)]
+
+
+def hojas_claustro_asignaturas(reporte, **parametros):
+    categorias = list(Profesor.CategoriaDocente)
+    grados = list(Profesor.GradoCientifico)
+    columnas = [
+        "Disciplina",
+        "Código",
+        "Asignatura",
+        "Total",
+        *[categoria.label for categoria in categorias],
+        *[grado.label for grado in grados],
+        "Profesor principal",
+    ]
+
+    def filas():
+        for disciplina in reporte["disciplinas"]:
+            for asignatura in disciplina["asignaturas"]:
+                principal = asignatura["profesor_principal"]
+                yield [
+                    disciplina["nombre"],
+                    asignatura["codigo"],
+                    asignatura["nombre"],
+                    asignatura["total"],
+                    *[asignatura["categorias"][categoria] for categoria in categorias],
+                    *[asignatura["grados"][grado] for grado in grados],
+                    principal["nombre_completo"] if principal else None,
+                ]
+
+    return [Hoja("Claustro por asignaturas", columnas, filas())]
+
+
+def hojas_experiencia(reporte, **parametros):
+    hojas = []
+    for campo in CAMPOS_EXPERIENCIA:
+        filas = [
+            [rango["desde"], rango["hasta"], rango["cantidad"], rango["porcentaje"]]
+            for rango in reporte[campo]["rangos"]
+        ]
+        filas.append(["Promedio", None, reporte[campo]["promedio"], None])
+        hojas.append(
+            Hoja(TITULOS_EXPERIENCIA[campo], ["Desde", "Hasta", "Cantidad", "%"], filas)
+        )
+    return hojas
+
+
+def hojas_grados(reporte, **parametros):
+    categorias = list(Profesor.CategoriaDocente)
+    grados = Hoja(
+        "Grados científicos",
+        [
+            "Grado científico",
+            *[categoria.label for categoria in categorias],
+            "Dr. con especialidad afín",
+            "Total",
+            "%",
+        ],
+        [
+            [
+                fila["nombre"],
+                *[fila["categorias"][categoria] for categoria in categorias],
+                fila["especialidad_afin"],
+                fila["total"],
+                fila["porcentaje"],
+            ]
+            for fila in reporte["grados"]
+        ],
+    )
+    resumen = Hoja(
+        "Resumen de grados",
+        ["Grado", "Total", "%"],
+        [
+            [fila["grado"], fila["total"], fila["porcentaje"]]
+            for fila in reporte["resumen"]
+        ],
+    )
+    return [grados, resumen]
+
+
+def _detalle_publicaciones(anno_inicio, anno_fin, carrera=None):
+    tipos = dict(Publicacion.TIPO_CHOICES)
+    registros = (
+        publicaciones_de(Publicacion.objects.all(), carrera)
+        .filter(anno__range=(anno_inicio, anno_fin))
+        .order_by("anno", "id")
+        .values_list(
+            "anno",
+            "titulo",
+            "revista_editorial",
+            "tipo_publicacion",
+            "nivel",
+            "isbn_issn",
+            "base_datos_revista",
+        )
+    )
+    for anno, titulo, revista, tipo, nivel, isbn_issn, base_datos in registros.iterator(
+        chunk_size=TAMANO_LOTE
+    ):
+        yield [
+            anno,
+            titulo,
+            revista,
+            tipos.get(tipo, tipo),
+            nivel,
+            isbn_issn,
+            base_datos,
+        ]
+
+
+def hojas_publicaciones(reporte, anno_inicio, anno_fin, carrera=None, **parametros):
+    detalle = Hoja(
+        "Detalle de publicaciones",
+        [
+            "Año",
+            "Título",
+            "Revista o editorial",
+            "Tipo",
+            "Nivel",
+            "ISBN/ISSN",
+            "Base de datos",
+        ],
+        _detalle_publicaciones(anno_inicio, anno_fin, carrera),
+    )
+    return [hoja_pivote("Publicaciones", reporte), detalle]
+
+
+def _detalle_ponencias(anno_inicio, anno_fin, profesor=None, carrera=None):
+    clasificaciones = dict(Evento.Clasificacion.choices)
+    registros = (
+        eventos_de(Evento.objects.all(), profesor=profesor, carrera=carrera)
+        .filter(anno__range=(anno_inicio, anno_fin))
+        .order_by("anno", "id")
+        .values_list("anno", "titulo", "titulo_corto", "clasificacion")
+    )
+    for anno, titulo, titulo_corto, clasificacion in registros.iterator(
+        chunk_size=TAMANO_LOTE
+    ):
+        yield [
+            anno,
+            titulo,
+            titulo_corto,
+            clasificaciones.get(clasificacion, clasificacion),
+        ]
+
+
+def hojas_ponencias(
+    reporte, anno_inicio, anno_fin, profesor=None, carrera=None, **parametros
+):
+    detalle = Hoja(
+        "Detalle de ponencias",
+        ["Año", "Evento", "Título corto", "Clasificación"],
+        _detalle_ponencias(anno_inicio, anno_fin, profesor, carrera),
+    )
+    return [hoja_pivote("Ponencias", reporte), detalle]
+
+
+def hojas_premios(reporte, **parametros):
+    annos = reporte["annos"]
+    profesores = Hoja(
+        "Premios por profesor",
+        ["Profesor", *annos, "Total"],
+        (
+            [
+                profesor["nombre_completo"],
+                *[profesor[str(anno)] for anno in annos],
+                profesor["total"],
+            ]
+            for profesor in reporte["profesores"]
+        ),
+    )
+    return [hoja_pivote("Premios", reporte), profesores]
+
+
+def hojas_evaluaciones(reporte, **parametros):
+    valores = list(ProfesorEvaluacion.ValorEvaluacion)
+    return [
+        Hoja(
+            "Evaluaciones",
+            [
+                "Indicador",
+                "Año",
+                *[valor.label for valor in valores],
+                "Total",
+                *[f"% {valor.label}" for valor in valores],
+            ],
+            (
+                [
+                    indicador["nombre"],
+                    fila["anno"],
+                    *[fila["valores"][valor] for valor in valores],
+                    fila["total"],
+                    *[fila["porcentajes"][valor] for valor in valores],
+                ]
+                for indicador in reporte["indicadores"]
+                for fila in indicador["annos"]
+            ),
+        )
+    ]
+
+
+def hojas_dossier(contenido):
+    """
+    Todas las secciones del dossier, a partir del contenido de su
+    instantánea. Los detalles de publicaciones y ponencias no se incluyen.
+    """
+    return [
+        *hojas_claustro(contenido["claustro"]),
+        *hojas_claustro_asignaturas(contenido["claustro_asignaturas"]),
+        *hojas_experiencia(contenido["experiencia"]),
+        *hojas_grados(contenido["grados"]),
+        hoja_pivote("Publicaciones", contenido["publicaciones"]),
+        hoja_pivote("Ponencias", contenido["ponencias"]),
+        *hojas_premios(contenido["premios"]),
+        *hojas_evaluaciones(contenido["evaluaciones"]),
+    ]
+
+
+__all__ = [
+    "hojas_claustro",
+    "hojas_claustro_asignaturas",
+    "hojas_dossier",
+    "hojas_evaluaciones",
+    "hojas_experiencia",
+    "hojas_grados",
+    "hojas_ponencias",
+    "hojas_premios",
+    "hojas_publicaciones",
+]
@@ -0,0 +1,59 @@
+from apps.negocio.sgac.models import (
+    ProfesorAsignatura,
+    ProfesorEvento,
+    ProfesorPublicacion,
+)
+
+
+def profesores_de_carrera(queryset, carrera=None, campo="pk"):
+    """
+    Restringe un queryset a los profesores que imparten alguna asignatura de
+    la carrera, siguiendo la cadena asignatura -> disciplina -> carrera.
+    ``campo`` es la ruta al profesor dentro del queryset.
+    """
+    if carrera is None:
+        return queryset
+    return queryset.filter(
+        **{
+            f"{campo}__in": ProfesorAsignatura.objects.filter(
+                asignatura__disciplina__carrera=carrera
+            ).values("profesor_id")
+        }
+    )
+
+
+def eventos_de(queryset, profesor=None, carrera=None):
+    """
+    Restringe un queryset de eventos a los que tienen como autor al profesor
+    indicado o a algún profesor de la carrera, a través de ``ProfesorEvento``.
+    """
+    if profesor is None and carrera is None:
+        return queryset
+    autores = ProfesorEvento.objects.all()
+    if profesor is not None:
+        autores = autores.filter(profesor=profesor)
+    if carrera is not None:
+        autores = profesores_de_carrera(autores, carrera, campo="profesor_id")
+    return queryset.filter(pk__in=autores.values("evento_id"))
+
+
+def publicaciones_de(queryset, carrera=None):
+    """
+    Restringe un queryset de publicaciones a las que tienen como autor a algún
+    profesor de la carrera, a través de ``ProfesorPublicacion``.
+    """
+    if carrera is None:
+        return queryset
+    autores = profesores_de_carrera(
+        ProfesorPublicacion.objects.all(), carrera, campo="profesor_id"
+    )
+    return queryset.filter(pk__in=autores.values("publicacion_id"))
+
+
+def carreras_de_profesores(profesores):
+    """Identificadores de las carreras en las que imparten los ``profesores``."""
+    return set(
+        ProfesorAsignatura.objects.filter(profesor__in=profesores)
+        .values_list("asignatura__disciplina__carrera_id", flat=True)
+        .distinct()
+    )
@@ -0,0 +1,77 @@
+from apps.negocio.sgac.models import Profesor
+from apps.negocio.sgac.reportes.filtros import profesores_de_carrera
+from apps.negocio.sgac.reportes.pivote import porcentaje
+from apps.negocio.sgac.reportes.resumenes import RESUMEN_CLAUSTRO
+
+
+def reporte_grados(carrera=None):
+    """
+    Tabla cruzada ``grado científico × categoría docente × Dr. con
+    especialidad afín`` calculada con un único ``GROUP BY`` sobre el resumen
+    del claustro o, si se restringe a una carrera, sobre sus profesores.
+    """
+    origen = profesores_de_carrera(Profesor.objects.all(), carrera) if carrera else None
+    registros = RESUMEN_CLAUSTRO.contar_por(
+        ["grado_cientifico", "categoria_docente", "especialidad_afin"], origen
+    )
+
+    filas = {
+        grado.value: {
+            "grado_cientifico": grado.value,
+            "nombre": grado.label,
+            "categorias": {
+                categoria.value: 0 for categoria in Profesor.CategoriaDocente
+            },
+            "especialidad_afin": 0,
+            "total": 0,
+        }
+        for grado in Profesor.GradoCientifico
+    }
+    total_claustro = 0
+    for (
+        grado_cientifico,
+        categoria_docente,
+        especialidad_afin,
+        cantidad,
+    ) in registros:
+        total_claustro += cantidad
+        fila = filas.get(grado_cientifico)
+        if fila is None:
+            continue
+        fila["total"] += cantidad
+        if categoria_docente in fila["categorias"]:
+            fila["categorias"][categoria_docente] += cantidad
+        if especialidad_afin:
+            fila["especialidad_afin"] += cantidad
+
+    for fila in filas.values():
+        fila["porcentaje"] = porcentaje(fila["total"], total_claustro)
+
+    doctores = filas[Profesor.GradoCientifico.DOCTOR]
+    masters = filas[Profesor.GradoCientifico.MASTER]
+    return {
+        "total_claustro": total_claustro,
+        "grados": list(filas.values()),
+        "resumen": [
+            {
+                "grado": "Dr.C",
+                "total": doctores["total"],
+                "porcentaje": doctores["porcentaje"],
+            },
+            {
+                "grado": "Dr.C con especialidad afín",
+                "total": doctores["especialidad_afin"],
+                "porcentaje": porcentaje(
+                    doctores["especialidad_afin"], doctores["total"]
+                ),
+            },
+            {
+                "grado": "Master en Ciencias",
+                "total": masters["total"],
+                "porcentaje": masters["porcentaje"],
+            },
+        ],
+    }
+
+
+__all__ = ["reporte_grados"]
@@ -0,0 +1,45 @@
+from collections import Counter
+
+from django.utils import timezone
+
+ANNOS_POR_DEFECTO = 5
+
+
+def rango_annos_por_defecto(anno_fin=None):
+    """Los últimos ``ANNOS_POR_DEFECTO`` años hasta ``anno_fin`` (por defecto, el actual)."""
+    if anno_fin is None:
+        anno_fin = timezone.localdate().year
+    return anno_fin - ANNOS_POR_DEFECTO + 1, anno_fin
+
+
+def porcentaje(parte, total):
+    return round(parte * 100 / total, 2) if total else 0
+
+
+def construir_fila(clave, etiqueta, conteos, annos):
+    """Fila de un pivote ``clasificación × año`` a partir de conteos ``(clave, anno)``."""
+    fila = {"clave": clave, "clasificacion": etiqueta}
+    for anno in annos:
+        fila[str(anno)] = conteos.get((clave, anno), 0)
+    fila["total"] = sum(fila[str(anno)] for anno in annos)
+    return fila
+
+
+def sumar_filas(clave, etiqueta, filas, annos):
+    """Fila derivada que suma las ``filas`` indicadas columna a columna."""
+    fila = {"clave": clave, "clasificacion": etiqueta}
+    for columna in [*map(str, annos), "total"]:
+        fila[columna] = sum(f[columna] for f in filas)
+    return fila
+
+
+def acumular(registros, clasificar):
+    """
+    Agrupa registros ``(*campos, anno, cantidad)`` de una consulta agregada en
+    un ``Counter`` indexado por ``(clave, anno)``, donde la clave la decide
+    ``clasificar(*campos)``.
+    """
+    conteos = Counter()
+    for *campos, anno, cantidad in registros:
+        conteos[(clasificar(*campos), anno)] += cantidad
+    return conteos
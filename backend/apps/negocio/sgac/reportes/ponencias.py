@@ -0,0 +1,47 @@
+from apps.negocio.sgac.models import Evento
+from apps.negocio.sgac.reportes.filtros import eventos_de
+from apps.negocio.sgac.reportes.pivote import construir_fila, sumar_filas
+from apps.negocio.sgac.reportes.resumenes import RESUMEN_EVENTOS
+
+FILAS_PONENCIAS = [
+    (Evento.Clasificacion.INTERNACIONAL, "INTERNACIONAL"),
+    (Evento.Clasificacion.NACIONAL, "NACIONAL"),
+    (Evento.Clasificacion.PROVINCIAL, "PROVINCIAL"),
+    (Evento.Clasificacion.MUNICIPAL, "MUNICIPAL"),
+    (Evento.Clasificacion.DE_BASE, "DE BASE"),
+]
+
+
+def reporte_ponencias(anno_inicio, anno_fin, profesor=None, carrera=None):
+    """
+    Pivote de ponencias ``clasificación × año`` calculado con una única
+    consulta agregada sobre el resumen de eventos o, si se filtra por
+    profesor o carrera, sobre ``sgac_eventos``.
+    """
+    annos = list(range(anno_inicio, anno_fin + 1))
+    origen = None
+    if profesor is not None or carrera is not None:
+        origen = eventos_de(Evento.objects.all(), profesor=profesor, carrera=carrera)
+    registros = RESUMEN_EVENTOS.contar_por(
+        ["clasificacion", "anno"], origen, anno__range=(anno_inicio, anno_fin)
+    )
+    conteos = {
+        (clasificacion, anno): cantidad for clasificacion, anno, cantidad in registros
+    }
+
+    filas = [
+        construir_fila(str(clave), etiqueta, conteos, annos)
+        for clave, etiqueta in FILAS_PONENCIAS
+    ]
+    nacional_internacional = sumar_filas(
+        "nacional_internacional", "NACIONAL E INTERNACIONAL", filas[:2], annos
+    )
+    total = sumar_filas("total", "TOTAL", filas, annos)
+
+    return {
+        "annos": annos,
+        "filas": [*filas, nacional_internacional, total],
+    }
+
+
+__all__ = ["reporte_ponencias"]
@@ -0,0 +1,86 @@
+from django.db.models import Count
+
+from apps.negocio.sgac.models import Premio
+from apps.negocio.sgac.reportes.filtros import profesores_de_carrera
+from apps.negocio.sgac.reportes.pivote import construir_fila, sumar_filas
+from apps.negocio.sgac.reportes.resumenes import RESUMEN_PREMIOS
+
+
+def _premios_por_profesor(premios, annos):
+    """
+    Totales de premios por profesor y año, en un único ``GROUP BY
+    id_profesor, anno`` unido a ``sgac_profesores`` para obtener los nombres.
+    """
+    registros = (
+        premios.values_list(
+            "profesor_id",
+            "profesor__nombre",
+            "profesor__primer_apellido",
+            "profesor__segundo_apellido",
+            "anno",
+        )
+        .annotate(cantidad=Count("id"))
+        .order_by()
+    )
+
+    profesores = {}
+    for (
+        id_profesor,
+        nombre,
+        primer_apellido,
+        segundo_apellido,
+        anno,
+        cantidad,
+    ) in registros:
+        if id_profesor not in profesores:
+            profesores[id_profesor] = {
+                "id": id_profesor,
+                "nombre_completo": " ".join(
+                    filter(None, [nombre, primer_apellido, segundo_apellido])
+                ),
+                **{str(anno): 0 for anno in annos},
+                "total": 0,
+            }
+        profesores[id_profesor][str(anno)] += cantidad
+        profesores[id_profesor]["total"] += cantidad
+
+    return sorted(
+        profesores.values(),
+        key=lambda profesor: (-profesor["total"], profesor["nombre_completo"]),
+    )
+
+
+def reporte_premios(anno_inicio, anno_fin, carrera=None):
+    """
+    Pivote de premios ``clasificación × año`` calculado con una única
+    consulta agregada sobre el resumen de premios o, si se restringe a una
+    carrera, sobre los premios de sus profesores; y los totales por profesor
+    y año, con una segunda consulta agrupada.
+    """
+    annos = list(range(anno_inicio, anno_fin + 1))
+    premios = profesores_de_carrera(Premio.objects.all(), carrera, campo="profesor_id")
+    registros = RESUMEN_PREMIOS.contar_por(
+        ["clasificacion", "anno"],
+        premios if carrera is not None else None,
+        anno__range=(anno_inicio, anno_fin),
+    )
+    conteos = {
+        (clasificacion, anno): cantidad for clasificacion, anno, cantidad in registros
+    }
+
+    filas = [
+        construir_fila(clave, etiqueta, conteos, annos)
+        for clave, etiqueta in Premio.CLASIFICACION_CHOICES
+    ]
+    total = sumar_filas("total", "TOTAL", filas, annos)
+
+    return {
+        "annos": annos,
+        "filas": [*filas, total],
+        "profesores": _premios_por_profesor(
+            premios.filter(anno__range=(anno_inicio, anno_fin)), annos
+        ),
+    }
+
+
+__all__ = ["reporte_premios"]
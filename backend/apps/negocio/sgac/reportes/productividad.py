@@ -0,0 +1,76 @@
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.negocio.sgac.models import (
+    Premio,
+    ProfesorEvaluacion,
+    ProfesorEvento,
+    ProfesorPublicacion,
+)
+
+METRICAS_PRODUCTIVIDAD = [
+    "total_publicaciones",
+    "publicaciones_autor_principal",
+    "publicaciones_coautor",
+    "total_eventos",
+    "total_premios",
+    "ultima_evaluacion",
+]
+
+
+def _conteo(modelo, filtro=None):
+    """
+    Subconsulta correlacionada que cuenta las filas de ``modelo`` del
+    profesor. Se usa en lugar de ``Count`` sobre los joins para que contar
+    varias relaciones a la vez no multiplique las filas.
+    """
+    return Coalesce(
+        Subquery(
+            modelo.objects.filter(profesor=OuterRef("pk"))
+            .order_by()
+            .values("profesor")
+            .annotate(total=Count("pk", filter=filtro))
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def anotar_productividad(queryset):
+    """
+    Anota en un queryset de profesores las métricas de
+    ``METRICAS_PRODUCTIVIDAD`` y precarga su última evaluación en cada
+    indicador en ``ultimas_evaluaciones``. El número de consultas no depende
+    de la cantidad de profesores.
+    """
+    participacion = ProfesorPublicacion.Participacion
+    return queryset.annotate(
+        total_publicaciones=_conteo(ProfesorPublicacion),
+        publicaciones_autor_principal=_conteo(
+            ProfesorPublicacion,
+            Q(participacion=participacion.AUTOR_PRINCIPAL),
+        ),
+        publicaciones_coautor=_conteo(
+            ProfesorPublicacion, Q(participacion=participacion.CO_AUTOR)
+        ),
+        total_eventos=_conteo(ProfesorEvento),
+        total_premios=_conteo(Premio),
+        ultima_evaluacion=Subquery(
+            ProfesorEvaluacion.objects.filter(profesor=OuterRef("pk"))
+            .order_by("-fecha")
+            .values("fecha")[:1]
+        ),
+    ).prefetch_related(
+        Prefetch(
+            "profesorevaluacion_set",
+            # DISTINCT ON: la evaluación más reciente de cada indicador
+            queryset=ProfesorEvaluacion.objects.select_related("indicador")
+            .order_by("profesor_id", "indicador_id", "-fecha", "-id")
+            .distinct("profesor_id", "indicador_id"),
+            to_attr="ultimas_evaluaciones",
+        )
+    )
+
+
+__all__ = ["METRICAS_PRODUCTIVIDAD", "anotar_productividad"]
@@ -0,0 +1,71 @@
+from apps.negocio.sgac.models import Publicacion
+from apps.negocio.sgac.reportes.filtros import publicaciones_de
+from apps.negocio.sgac.reportes.pivote import acumular, construir_fila, sumar_filas
+from apps.negocio.sgac.reportes.resumenes import RESUMEN_PUBLICACIONES
+
+FILAS_PUBLICACIONES = [
+    ("grupo1", "ARTÍCULO GRUPO I"),
+    ("grupo2", "ARTÍCULO GRUPO II"),
+    ("grupo3", "ARTÍCULO GRUPO III"),
+    ("grupo4", "ARTÍCULO GRUPO IV"),
+    ("sin_grupo", "ARTÍCULO SIN GRUPO"),
+    ("libro", "LIBRO"),
+    ("capitulo_libro", "CAPÍTULO DE LIBRO"),
+    ("patente", "PATENTES"),
+    ("libro_digital", "LIBRO DIGITAL"),
+    ("texto_carrera", "TEXTO DE LA CARRERA"),
+    ("material_docente", "MAT. DOCENTE INTERNO"),
+]
+
+
+def clasificar_publicacion(tipo_publicacion, nivel):
+    if tipo_publicacion != "articulo":
+        return tipo_publicacion
+    if nivel in (1, 2, 3, 4):
+        return f"grupo{nivel}"
+    return "sin_grupo"
+
+
+def reporte_publicaciones(anno_inicio, anno_fin, carrera=None):
+    """
+    Pivote de publicaciones ``tipo × nivel × año`` calculado con una única
+    consulta agregada sobre el resumen de publicaciones o, si se restringe a
+    una carrera, sobre las publicaciones de sus profesores.
+    """
+    annos = list(range(anno_inicio, anno_fin + 1))
+    origen = None
+    if carrera is not None:
+        origen = publicaciones_de(Publicacion.objects.all(), carrera)
+    registros = RESUMEN_PUBLICACIONES.contar_por(
+        ["tipo_publicacion", "nivel", "anno"],
+        origen,
+        anno__range=(anno_inicio, anno_fin),
+    )
+    conteos = acumular(registros, clasificar_publicacion)
+
+    filas = [
+        construir_fila(clave, etiqueta, conteos, annos)
+        for clave, etiqueta in FILAS_PUBLICACIONES
+    ]
+    por_clave = {fila["clave"]: fila for fila in filas}
+    grupos_libros_patentes = sumar_filas(
+        "grupos1a4_libros_patentes",
+        "GRUPOS 1 AL 4, LIBROS Y PATENTES",
+        [fila for fila in filas if fila["clave"] != "sin_grupo"],
+        annos,
+    )
+    grupos_1_2 = sumar_filas(
+        "grupos1y2",
+        "GRUPOS 1 Y 2",
+        [por_clave["grupo1"], por_clave["grupo2"]],
+        annos,
+    )
+    total = sumar_filas("total", "TOTAL", filas, annos)
+
+    return {
+        "annos": annos,
+        "filas": [*filas, grupos_libros_patentes, grupos_1_2, total],
+    }
+
+
+__all__ = ["reporte_publicaciones"]
@@ -0,0 +1,173 @@
+from django.db import transaction
+from django.db.models import BooleanField, Case, Count, Sum, Value, When
+from django.db.models.functions import ExtractYear
+
+from apps.negocio.sgac.models import (
+    Evento,
+    Premio,
+    Profesor,
+    ProfesorEvaluacion,
+    Publicacion,
+    ResumenClaustro,
+    ResumenEvaluaciones,
+    ResumenEventos,
+    ResumenPremios,
+    ResumenPublicaciones,
+)
+
+
+class DefinicionResumen:
+    """
+    Describe cómo se obtiene una tabla resumen a partir de su modelo de
+    origen: qué campos forman la clave y cómo se calculan sobre el origen.
+
+    Cada resumen guarda una fila por clave con la cantidad de registros de
+    origen que la comparten, de modo que los reportes leen tantas filas como
+    combinaciones existan y no tantas como registros haya en la base de datos.
+    """
+
+    modelo = None
+    resumen = None
+    campos = []
+
+    def anotar(self, queryset):
+        """Añade al queryset de origen los campos de la clave que no son columnas."""
+        return queryset
+
+    def clave(self, instancia):
+        return {campo: getattr(instancia, campo) for campo in self.campos}
+
+    def agrupar(self):
+        return (
+            self.anotar(self.modelo.objects.all())
+            .values(*self.campos)
+            .annotate(cantidad=Count("id"))
+            .order_by()
+        )
+
+    def contar_por(self, campos, origen=None, **filtros):
+        """
+        Conteos agrupados por ``campos`` como tuplas ``(*campos, total)``.
+
+        Sin ``origen`` se leen del resumen; con un queryset de origen (por
+        ejemplo, restringido a una carrera) se calculan directamente sobre él.
+        """
+        if origen is None:
+            return (
+                self.resumen.objects.filter(**filtros)
+                .values_list(*campos)
+                .annotate(total=Sum("cantidad"))
+                .order_by()
+            )
+        return (
+            self.anotar(origen)
+            .filter(**filtros)
+            .values_list(*campos)
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+
+    @transaction.atomic
+    def actualizar(self, clave):
+        """
+        Recalcula la fila del resumen de una clave usando el índice del origen.
+
+        La fila se crea si no existe y se bloquea antes de contar: dos
+        actualizaciones concurrentes de la misma clave se ejecutan una tras
+        otra, y en READ COMMITTED la segunda cuenta también los registros que
+        confirmó la primera.
+        """
+        fila = None
+        while fila is None:
+            self.resumen.objects.get_or_create(**clave)
+            # Si otra transacción la eliminó entretanto, se vuelve a crear
+            fila = self.resumen.objects.select_for_update().filter(**clave).first()
+        cantidad = self.anotar(self.modelo.objects.all()).filter(**clave).count()
+        if cantidad:
+            fila.cantidad = cantidad
+            fila.save(update_fields=["cantidad"])
+        else:
+            fila.delete()
+
+    @transaction.atomic
+    def reconstruir(self):
+        self.resumen.objects.all().delete()
+        self.resumen.objects.bulk_create(
+            self.resumen(**fila) for fila in self.agrupar()
+        )
+
+
+class DefinicionResumenClaustro(DefinicionResumen):
+    modelo = Profesor
+    resumen = ResumenClaustro
+    campos = ["categoria_docente", "grado_cientifico", "especialidad_afin"]
+
+    def anotar(self, queryset):
+        return queryset.annotate(
+            especialidad_afin=Case(
+                When(dr_especialidad_afin="SI", then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
+
+    def clave(self, instancia):
+        return {
+            "categoria_docente": instancia.categoria_docente,
+            "grado_cientifico": instancia.grado_cientifico,
+            "especialidad_afin": instancia.dr_especialidad_afin == "SI",
+        }
+
+
+class DefinicionResumenPublicaciones(DefinicionResumen):
+    modelo = Publicacion
+    resumen = ResumenPublicaciones
+    campos = ["anno", "tipo_publicacion", "nivel"]
+
+
+class DefinicionResumenEventos(DefinicionResumen):
+    modelo = Evento
+    resumen = ResumenEventos
+    campos = ["anno", "clasificacion"]
+
+
+class DefinicionResumenPremios(DefinicionResumen):
+    modelo = Premio
+    resumen = ResumenPremios
+    campos = ["anno", "clasificacion"]
+
+
+class DefinicionResumenEvaluaciones(DefinicionResumen):
+    modelo = ProfesorEvaluacion
+    resumen = ResumenEvaluaciones
+    campos = ["indicador_id", "anno", "evaluacion"]
+
+    def anotar(self, queryset):
+        return queryset.annotate(anno=ExtractYear("fecha"))
+
+    def clave(self, instancia):
+        return {
+            "indicador_id": instancia.indicador_id,
+            "anno": instancia.fecha.year,
+            "evaluacion": instancia.evaluacion,
+        }
+
+
+RESUMEN_CLAUSTRO = DefinicionResumenClaustro()
+RESUMEN_PUBLICACIONES = DefinicionResumenPublicaciones()
+RESUMEN_EVENTOS = DefinicionResumenEventos()
+RESUMEN_PREMIOS = DefinicionResumenPremios()
+RESUMEN_EVALUACIONES = DefinicionResumenEvaluaciones()
+
+DEFINICIONES_RESUMEN = [
+    RESUMEN_CLAUSTRO,
+    RESUMEN_PUBLICACIONES,
+    RESUMEN_EVENTOS,
+    RESUMEN_PREMIOS,
+    RESUMEN_EVALUACIONES,
+]
+
+
+def reconstruir_resumenes():
+    for definicion in DEFINICIONES_RESUMEN:
+        definicion.reconstruir()
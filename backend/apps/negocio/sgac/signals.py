@@ -0,0 +1,240 @@
+"""
+Propaga los cambios de los registros del negocio a los datos derivados de los
+reportes de acreditación:
+
+- las tablas resumen, de las que cada guardado o eliminación recalcula solo
+  las filas cuya clave tenía el registro antes y después del cambio;
+- las instantáneas de los dossiers, que se invalidan únicamente para las
+  carreras a las que afecta el registro;
+- los conteos de los listados paginados guardados en caché, que se invalidan
+  al confirmar la transacción para la tabla del modelo que cambió.
+
+Las operaciones masivas (``QuerySet.update``, ``bulk_create``) no emiten
+señales; después de ellas hay que ejecutar ``manage.py reconstruir_resumenes``,
+que además invalida todos los dossiers.
+"""
+
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+
+from apps.negocio.sgac.models import (
+    Asignatura,
+    Carrera,
+    Disciplina,
+    Evento,
+    IndicadorEvaluacion,
+    Premio,
+    Profesor,
+    ProfesorAsignatura,
+    ProfesorEvaluacion,
+    ProfesorEvento,
+    ProfesorPublicacion,
+    Publicacion,
+)
+from apps.negocio.sgac.reportes.dossier import invalidar_dossiers
+from apps.negocio.sgac.reportes.filtros import carreras_de_profesores
+from apps.negocio.sgac.reportes.resumenes import DEFINICIONES_RESUMEN
+from general.conteo import invalidar_conteos
+
+
+def _carreras_de_asignaturas(asignaturas):
+    return set(
+        Asignatura.objects.filter(pk__in=asignaturas).values_list(
+            "disciplina__carrera_id", flat=True
+        )
+    )
+
+
+def _carreras_de_profesor(instancia):
+    return carreras_de_profesores([instancia.profesor_id])
+
+
+# Carreras cuyos dossiers dependen de cada registro. Los modelos marcados con
+# ``True`` cambian de carrera al modificar sus claves foráneas, por lo que
+# también se invalidan las carreras de su versión anterior.
+CARRERAS_AFECTADAS = {
+    Carrera: (lambda instancia: {instancia.pk}, False),
+    Disciplina: (lambda instancia: {instancia.carrera_id}, True),
+    Asignatura: (
+        lambda instancia: set(
+            Disciplina.objects.filter(pk=instancia.disciplina_id).values_list(
+                "carrera_id", flat=True
+            )
+        ),
+        True,
+    ),
+    ProfesorAsignatura: (
+        lambda instancia: _carreras_de_asignaturas([instancia.asignatura_id]),
+        True,
+    ),
+    Profesor: (lambda instancia: carreras_de_profesores([instancia.pk]), False),
+    Publicacion: (
+        lambda instancia: carreras_de_profesores(
+            ProfesorPublicacion.objects.filter(publicacion_id=instancia.pk).values(
+                "profesor_id"
+            )
+        ),
+        False,
+    ),
+    Evento: (
+        lambda instancia: carreras_de_profesores(
+            ProfesorEvento.objects.filter(evento_id=instancia.pk).values("profesor_id")
+        ),
+        False,
+    ),
+    Premio: (_carreras_de_profesor, True),
+    ProfesorEvaluacion: (_carreras_de_profesor, True),
+    ProfesorPublicacion: (_carreras_de_profesor, True),
+    ProfesorEvento: (_carreras_de_profesor, True),
+}
+
+MODELOS_CON_RESUMEN = {
+    definicion.modelo: definicion for definicion in DEFINICIONES_RESUMEN
+}
+
+MODELOS_CON_ESTADO_ANTERIOR = set(MODELOS_CON_RESUMEN) | {
+    modelo for modelo, (_, por_relacion) in CARRERAS_AFECTADAS.items() if por_relacion
+}
+
+# Tablas que leen los listados paginados, con sus filtros y anotaciones, y
+# cuyos conteos se guardan en caché (``general.conteo``). Las tablas resumen,
+# los dossiers y las de otras aplicaciones no se paginan
+MODELOS_CON_CONTEOS = [*CARRERAS_AFECTADAS, IndicadorEvaluacion]
+
+
+def recordar_estado_anterior(sender, instance, raw=False, **kwargs):
+    instance._estado_anterior = None
+    if raw or instance._state.adding:
+        return
+    instance._estado_anterior = sender.objects.filter(pk=instance.pk).first()
+
+
+def actualizar_resumen(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    definicion = MODELOS_CON_RESUMEN[sender]
+    clave = definicion.clave(instance)
+    definicion.actualizar(clave)
+    anterior = getattr(instance, "_estado_anterior", None)
+    if anterior is not None:
+        clave_anterior = definicion.clave(anterior)
+        if clave_anterior != clave:
+            definicion.actualizar(clave_anterior)
+
+
+def actualizar_resumen_tras_eliminar(sender, instance, **kwargs):
+    definicion = MODELOS_CON_RESUMEN[sender]
+    definicion.actualizar(definicion.clave(instance))
+
+
+def invalidar_dossiers_tras_guardar(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    carreras_afectadas, por_relacion = CARRERAS_AFECTADAS[sender]
+    carreras = carreras_afectadas(instance)
+    anterior = getattr(instance, "_estado_anterior", None)
+    if por_relacion and anterior is not None:
+        carreras |= carreras_afectadas(anterior)
+    invalidar_dossiers(carreras)
+
+
+def invalidar_dossiers_antes_de_eliminar(sender, instance, **kwargs):
+    # Antes de eliminar, mientras aún existen las relaciones que lo vinculan
+    # con sus carreras
+    carreras_afectadas, _ = CARRERAS_AFECTADAS[sender]
+    invalidar_dossiers(carreras_afectadas(instance))
+
+
+def invalidar_dossiers_profesores_asignaturas(
+    sender, instance, action, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if isinstance(instance, Asignatura):
+        carreras = _carreras_de_asignaturas([instance.pk])
+    else:
+        carreras = carreras_de_profesores([instance.pk])
+        carreras |= _carreras_de_asignaturas(pk_set or [])
+    invalidar_dossiers(carreras)
+
+
+def invalidar_dossiers_profesores_eventos(sender, instance, action, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if isinstance(instance, Profesor):
+        profesores = [instance.pk]
+    else:
+        profesores = set(pk_set or []) | set(
+            ProfesorEvento.objects.filter(evento=instance).values_list(
+                "profesor_id", flat=True
+            )
+        )
+    invalidar_dossiers(carreras_de_profesores(profesores))
+
+
+def invalidar_conteos_del_modelo(sender, raw=False, **kwargs):
+    # En ``m2m_changed`` el emisor es el modelo intermedio
+    invalidar_conteos(sender._meta.db_table)
+
+
+def conectar():
+    for modelo in MODELOS_CON_ESTADO_ANTERIOR:
+        pre_save.connect(
+            recordar_estado_anterior,
+            sender=modelo,
+            dispatch_uid=f"estado_anterior_{modelo._meta.model_name}",
+        )
+    for modelo in MODELOS_CON_RESUMEN:
+        post_save.connect(
+            actualizar_resumen,
+            sender=modelo,
+            dispatch_uid=f"resumen_{modelo._meta.model_name}_post_save",
+        )
+        post_delete.connect(
+            actualizar_resumen_tras_eliminar,
+            sender=modelo,
+            dispatch_uid=f"resumen_{modelo._meta.model_name}_post_delete",
+        )
+    for modelo in CARRERAS_AFECTADAS:
+        post_save.connect(
+            invalidar_dossiers_tras_guardar,
+            sender=modelo,
+            dispatch_uid=f"dossier_{modelo._meta.model_name}_post_save",
+        )
+        pre_delete.connect(
+            invalidar_dossiers_antes_de_eliminar,
+            sender=modelo,
+            dispatch_uid=f"dossier_{modelo._meta.model_name}_pre_delete",
+        )
+    m2m_changed.connect(
+        invalidar_dossiers_profesores_asignaturas,
+        sender=Asignatura.profesores.through,
+        dispatch_uid="dossier_profesores_asignaturas_m2m",
+    )
+    m2m_changed.connect(
+        invalidar_dossiers_profesores_eventos,
+        sender=Profesor.eventos.through,
+        dispatch_uid="dossier_profesores_eventos_m2m",
+    )
+    for modelo in MODELOS_CON_CONTEOS:
+        post_save.connect(
+            invalidar_conteos_del_modelo,
+            sender=modelo,
+            dispatch_uid=f"conteos_{modelo._meta.model_name}_post_save",
+        )
+        post_delete.connect(
+            invalidar_conteos_del_modelo,
+            sender=modelo,
+            dispatch_uid=f"conteos_{modelo._meta.model_name}_post_delete",
+        )
+    for intermedio in (Asignatura.profesores.through, Profesor.eventos.through):
+        m2m_changed.connect(
+            invalidar_conteos_del_modelo,
+            sender=intermedio,
+            dispatch_uid=f"conteos_{intermedio._meta.model_name}_m2m",
+        )
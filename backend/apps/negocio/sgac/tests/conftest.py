@@ -0,0 +1,9 @@
+import pytest
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def cliente(admin_user):
+    cliente = APIClient()
+    cliente.force_authenticate(admin_user)
+    return cliente
@@ -0,0 +1,110 @@
+"""Registros mínimos válidos para las pruebas."""
+
+import datetime
+
+from apps.negocio.sgac.models import (
+    Asignatura,
+    Carrera,
+    Disciplina,
+    Evento,
+    IndicadorEvaluacion,
+    Profesor,
+    ProfesorEvaluacion,
+    ProfesorEvento,
+    Publicacion,
+)
+
+
+def crear_carrera(**campos):
+    return Carrera.objects.create(
+        **{
+            "nombre": "Ingeniería Informática",
+            "modalidad": Carrera.Modalidad.CURSO_DIURNO,
+            "sede": "Sede central",
+            "anno_eval_ext": "2020",
+            "curso_evaluado": "2019-2020",
+            "numero_eval_ext": 1,
+            **campos,
+        }
+    )
+
+
+def crear_disciplina(carrera, **campos):
+    return Disciplina.objects.create(
+        **{"carrera": carrera, "codigo": "D1", "nombre": "Programación", **campos}
+    )
+
+
+def crear_asignatura(disciplina, **campos):
+    return Asignatura.objects.create(
+        **{
+            "disciplina": disciplina,
+            "nombre": "Programación I",
+            "codigo": "P1",
+            "anno": Asignatura.AnnoAcademico.PRIMER,
+            "semestre": Asignatura.Semestre.PRIMER,
+            "modalidad": Asignatura.Modalidad.DIURNO,
+            "curriculo": Asignatura.Curriculo.BASE,
+            **campos,
+        }
+    )
+
+
+def crear_profesor(**campos):
+    return Profesor.objects.create(
+        **{
+            "nombre": "Ana",
+            "primer_apellido": "Pérez",
+            "segundo_apellido": "Díaz",
+            "categoria_docente": Profesor.CategoriaDocente.AUXILIAR,
+            "grado_cientifico": Profesor.GradoCientifico.MASTER,
+            **campos,
+        }
+    )
+
+
+def crear_evento(profesores=(), **campos):
+    evento = Evento.objects.create(
+        **{
+            "anno": 2024,
+            "titulo": "Congreso de Informática",
+            "titulo_corto": "INFO",
+            "clasificacion": Evento.Clasificacion.NACIONAL,
+            **campos,
+        }
+    )
+    for profesor in profesores:
+        ProfesorEvento.objects.create(profesor=profesor, evento=evento)
+    return evento
+
+
+def crear_publicacion(**campos):
+    return Publicacion.objects.create(
+        **{
+            "anno": 2024,
+            "titulo": "Un artículo",
+            "revista_editorial": "Revista Cubana de Ciencias Informáticas",
+            "tipo_publicacion": "articulo",
+            "isbn_issn": "2227-1899",
+            "verificacion_libro": "",
+            "base_datos_revista": "SciELO",
+            "verificacion_referencia": "",
+            "nivel": 2,
+            **campos,
+        }
+    )
+
+
+def crear_evaluacion(profesor, **campos):
+    if "indicador" not in campos:
+        campos["indicador"] = IndicadorEvaluacion.objects.create(
+            nombre=IndicadorEvaluacion.NombreIndicador.GENERAL
+        )
+    return ProfesorEvaluacion.objects.create(
+        **{
+            "profesor": profesor,
+            "evaluacion": ProfesorEvaluacion.ValorEvaluacion.BIEN,
+            "fecha": datetime.date(2024, 7, 1),
+            **campos,
+        }
+    )
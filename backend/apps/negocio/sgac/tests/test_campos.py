@@ -0,0 +1,55 @@
+import pytest
+
+from apps.negocio.sgac.tests.datos import (
+    crear_asignatura,
+    crear_carrera,
+    crear_disciplina,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def asignatura():
+    return crear_asignatura(crear_disciplina(crear_carrera()))
+
+
+@pytest.mark.view
+@pytest.mark.success
+def test_detalle_anidado_con_fields(cliente, asignatura):
+    disciplina = asignatura.disciplina
+    respuesta = cliente.get(
+        f"/api/carreras/{disciplina.carrera_id}/disciplinas/{disciplina.pk}"
+        f"/asignaturas/{asignatura.pk}",
+        {"fields": "id,nombre"},
+    )
+
+    assert respuesta.status_code == 200
+    assert respuesta.json() == {"id": asignatura.pk, "nombre": asignatura.nombre}
+
+
+@pytest.mark.view
+@pytest.mark.success
+def test_detalle_anidado_con_exclude(cliente, asignatura):
+    disciplina = asignatura.disciplina
+    respuesta = cliente.get(
+        f"/api/carreras/{disciplina.carrera_id}/disciplinas/{disciplina.pk}",
+        {"exclude": "codigo,carrera"},
+    )
+
+    assert respuesta.status_code == 200
+    assert respuesta.json() == {"id": disciplina.pk, "nombre": disciplina.nombre}
+
+
+@pytest.mark.view
+@pytest.mark.failure
+def test_detalle_anidado_con_fields_y_padre_incorrecto(cliente, asignatura):
+    disciplina = asignatura.disciplina
+    otra_carrera = crear_carrera(nombre="Otra")
+    respuesta = cliente.get(
+        f"/api/carreras/{otra_carrera.pk}/disciplinas/{disciplina.pk}"
+        f"/asignaturas/{asignatura.pk}",
+        {"fields": "id"},
+    )
+
+    assert respuesta.status_code == 404
@@ -0,0 +1,90 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from general import conteo
+
+from apps.negocio.sgac.models import Profesor, ResumenClaustro
+from apps.negocio.sgac.tests.datos import (
+    crear_asignatura,
+    crear_carrera,
+    crear_disciplina,
+    crear_profesor,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def version(modelo):
+    return cache.get(f"conteo:version:{modelo._meta.db_table}")
+
+
+@pytest.mark.success
+def test_invalida_los_conteos_al_confirmar(django_capture_on_commit_callbacks):
+    anterior = version(Profesor)
+
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        crear_profesor()
+    assert version(Profesor) == anterior
+
+    for callback in callbacks:
+        callback()
+    assert version(Profesor) != anterior
+
+
+@pytest.mark.success
+def test_invalida_la_tabla_intermedia_al_asignar_profesores(
+    django_capture_on_commit_callbacks,
+):
+    asignatura = crear_asignatura(crear_disciplina(crear_carrera()))
+    profesor = crear_profesor()
+    intermedio = asignatura.profesores.through
+    anterior = version(intermedio)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        asignatura.profesores.add(profesor)
+
+    assert version(intermedio) != anterior
+
+
+@pytest.mark.success
+def test_no_invalida_modelos_sin_listado_paginado(django_capture_on_commit_callbacks):
+    anteriores = (version(get_user_model()), version(ResumenClaustro))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        get_user_model().objects.create_user("usuario")
+        # Actualiza el resumen del claustro
+        crear_profesor()
+
+    assert (version(get_user_model()), version(ResumenClaustro)) == anteriores
+
+
+@pytest.mark.success
+def test_tablas_pequenas_se_cuentan_sin_cache(django_assert_num_queries):
+    crear_profesor()
+    queryset = Profesor.objects.filter(categoria_docente="AUXILIAR")
+    conteo.contar(queryset)
+
+    # Solo ``COUNT(*)``: la estimación del tamaño de la tabla ya se obtuvo
+    with django_assert_num_queries(1):
+        assert conteo.contar(queryset) == (1, False)
+
+
+@pytest.mark.success
+def test_tablas_grandes_usan_la_cache_hasta_confirmar(
+    monkeypatch, django_capture_on_commit_callbacks, django_assert_num_queries
+):
+    monkeypatch.setattr(conteo, "_estimacion", lambda queryset: 50_000)
+    crear_profesor()
+    queryset = Profesor.objects.filter(categoria_docente="AUXILIAR")
+    assert conteo.contar(queryset) == (1, False)
+
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        crear_profesor()
+    # Hasta confirmar se reutiliza el conteo anterior, sin ``COUNT(*)``
+    with django_assert_num_queries(2):
+        assert conteo.contar(queryset) == (1, False)
+
+    for callback in callbacks:
+        callback()
+    assert conteo.contar(queryset) == (2, False)
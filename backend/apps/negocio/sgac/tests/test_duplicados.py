@@ -0,0 +1,15 @@
+import pytest
+
+from apps.negocio.sgac.reportes.duplicados import SIMILITUD_TITULO_MISMO_ISBN
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.view
+@pytest.mark.failure
+@pytest.mark.parametrize("similitud", [0, SIMILITUD_TITULO_MISMO_ISBN - 0.01, 1.5])
+def test_similitud_fuera_de_rango(cliente, similitud):
+    respuesta = cliente.get("/api/publicaciones/duplicados", {"similitud": similitud})
+
+    assert respuesta.status_code == 400
+    assert "similitud" in respuesta.json()
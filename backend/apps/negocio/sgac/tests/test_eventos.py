@@ -0,0 +1,49 @@
+import pytest
+
+from apps.negocio.sgac.tests.datos import crear_evento, crear_profesor
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(params=[5, 50])
+def eventos(request):
+    """
+    Eventos con tres autores cada uno, en dos tamaños: la cantidad de
+    consultas no debe depender de cuántos haya.
+    """
+    profesores = [crear_profesor(nombre=f"Profesor {numero}") for numero in range(3)]
+    return [
+        crear_evento(profesores=profesores, titulo=f"Evento {numero}")
+        for numero in range(request.param)
+    ]
+
+
+@pytest.mark.view
+@pytest.mark.success
+def test_lista_de_eventos_precarga_los_autores(
+    cliente, eventos, django_assert_num_queries
+):
+    with django_assert_num_queries(2):
+        respuesta = cliente.get("/api/eventos")
+
+    assert respuesta.status_code == 200
+    datos = respuesta.json()
+    assert len(datos) == len(eventos)
+    assert all(len(evento["autores"]) == 3 for evento in datos)
+    assert datos[0]["profesorNombre"] == "Profesor 0 Pérez Díaz"
+
+
+@pytest.mark.view
+@pytest.mark.success
+def test_detalle_de_evento_precarga_los_autores(
+    cliente, eventos, django_assert_num_queries
+):
+    with django_assert_num_queries(2):
+        respuesta = cliente.get(f"/api/eventos/{eventos[0].pk}")
+
+    assert respuesta.status_code == 200
+    assert [autor["nombreCompleto"] for autor in respuesta.json()["autores"]] == [
+        "Profesor 0 Pérez Díaz",
+        "Profesor 1 Pérez Díaz",
+        "Profesor 2 Pérez Díaz",
+    ]
@@ -0,0 +1,161 @@
+import datetime
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from apps.negocio.sgac.models import Premio, ProfesorEvaluacion
+from apps.negocio.sgac.tests.datos import (
+    crear_evaluacion,
+    crear_profesor,
+    crear_publicacion,
+)
+from apps.negocio.sgac.views.premio import PremioViewSet
+from apps.negocio.sgac.views.profesor import ProfesorViewSet
+from apps.negocio.sgac.views.profesor_evaluacion import ProfesorEvaluacionViewSet
+from general import lectura, mixins
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def profesores():
+    profesores = [
+        crear_profesor(
+            primer_apellido=apellido,
+            segundo_apellido="" if numero % 2 else "Díaz",
+            categoria_docente=categoria,
+            dr_especialidad_afin=None if numero % 3 else "SI",
+            correos=[{"etiqueta": "trabajo", "correo": f"p{numero}@uci.cu"}],
+            telefonos=(
+                [{"etiqueta": "móvil", "numero": f"5{numero:07}"}] if numero % 2 else []
+            ),
+        )
+        for numero, (apellido, categoria) in enumerate(
+            [
+                ("Pérez", "TITULAR"),
+                ("Álvarez", "AUXILIAR"),
+                ("Pérez", "ASISTENTE"),
+                ("Zayas", "INSTRUCTOR"),
+                ("Martí", "AD"),
+            ]
+        )
+    ]
+    for numero, profesor in enumerate(profesores):
+        crear_evaluacion(profesor, fecha=datetime.date(2020 + numero, 7, 1))
+        Premio.objects.create(
+            profesor=profesor,
+            anno=2020 + numero,
+            descripcion=f"Premio {numero}",
+            clasificacion="OTROS",
+        )
+    crear_publicacion()
+    return profesores
+
+
+def _serializer_y_filas(viewset_class, parametros):
+    """``serializer.data`` y las filas de ``values()`` de un listado."""
+    request = APIRequestFactory().get("/", parametros)
+    vista = viewset_class(
+        action="list", action_map={"get": "list"}, format_kwarg=None, kwargs={}
+    )
+    vista.request = vista.initialize_request(request)
+    queryset = vista.filter_queryset(vista.get_queryset())
+    plan = lectura.planificar_lectura(vista.get_serializer(many=True).child, queryset)
+    assert plan is not None
+    filas = queryset.prefetch_related(None).values(*plan.columnas(queryset))
+    return vista.get_serializer(queryset, many=True).data, plan.representar(filas)
+
+
+@pytest.mark.success
+@pytest.mark.parametrize(
+    "viewset_class, parametros",
+    [
+        (ProfesorViewSet, {}),
+        (ProfesorViewSet, {"fields": "id,correos,categoriaDocente"}),
+        (ProfesorViewSet, {"exclude": "telefonos", "ordering": "-primerApellido"}),
+        (ProfesorEvaluacionViewSet, {}),
+        (PremioViewSet, {"fields": "profesor,anno"}),
+    ],
+)
+def test_plan_representa_igual_que_el_serializer(profesores, viewset_class, parametros):
+    datos, representados = _serializer_y_filas(viewset_class, parametros)
+
+    assert representados == datos
+    assert len(representados) == viewset_class.queryset.count()
+
+
+@pytest.fixture
+def sin_plan(monkeypatch):
+    """
+    Registra los planes de los listados, y devuelve una función que hace que
+    a partir de entonces usen siempre el serializer.
+    """
+    planes = []
+
+    def planificar(serializer, queryset):
+        planes.append(lectura.planificar_lectura(serializer, queryset))
+        return planes[-1]
+
+    def usar_serializer():
+        # Las respuestas anteriores se leyeron con ``values()``
+        assert planes and all(plan is not None for plan in planes)
+        monkeypatch.setattr(mixins, "planificar_lectura", lambda *args: None)
+
+    monkeypatch.setattr(mixins, "planificar_lectura", planificar)
+    return usar_serializer
+
+
+def _paginas(cliente, url, parametros):
+    paginas = []
+    cursor = ""
+    while cursor is not None:
+        respuesta = cliente.get(url, {**parametros, "cursor": cursor})
+        assert respuesta.status_code == 200
+        paginas.append(respuesta.json())
+        cursor = respuesta.json()["meta"]["nextCursor"]
+    return paginas
+
+
+@pytest.mark.view
+@pytest.mark.success
+@pytest.mark.parametrize(
+    "url, parametros",
+    [
+        ("/api/profesores", {"page": 1, "limit": 2}),
+        ("/api/profesores", {"page": 2, "limit": 2, "fields": "id,telefonos"}),
+        ("/api/profesorevaluacion", {}),
+        ("/api/premios", {"fields": "id,profesor"}),
+        ("/api/publicaciones/", {"page": 1}),
+    ],
+)
+def test_listado_igual_que_con_el_serializer(
+    cliente, profesores, sin_plan, url, parametros
+):
+    rapida = cliente.get(url, parametros)
+    sin_plan()
+    serializada = cliente.get(url, parametros)
+
+    assert rapida.status_code == serializada.status_code == 200
+    assert rapida.content == serializada.content
+
+
+@pytest.mark.view
+@pytest.mark.success
+@pytest.mark.parametrize(
+    "parametros",
+    [
+        {"limit": 2},
+        # El cursor lee de cada fila las columnas del orden, aunque no se pidan
+        {"limit": 2, "ordering": "-primerApellido,id", "fields": "id,nombre"},
+        {"limit": 2, "ordering": "categoriaDocente,id", "exclude": "categoriaDocente"},
+    ],
+)
+def test_paginas_por_cursor_iguales_que_con_el_serializer(
+    cliente, profesores, sin_plan, parametros
+):
+    rapidas = _paginas(cliente, "/api/profesores", parametros)
+    sin_plan()
+    serializadas = _paginas(cliente, "/api/profesores", parametros)
+
+    assert rapidas == serializadas
+    assert sum(len(pagina["data"]) for pagina in rapidas) == len(profesores)
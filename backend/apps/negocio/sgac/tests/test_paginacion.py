@@ -0,0 +1,120 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.negocio.sgac.tests.datos import (
+    crear_evaluacion,
+    crear_profesor,
+    crear_publicacion,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def publicaciones():
+    return [
+        crear_publicacion(anno=2020 + numero % 3, nivel=1 + numero % 2)
+        for numero in range(12)
+    ]
+
+
+@pytest.fixture
+def profesores():
+    profesores = [crear_profesor(nombre=f"Profesor {numero}") for numero in range(7)]
+    # Sin evaluaciones, ``ultimaEvaluacion`` es nula
+    for numero, profesor in enumerate(profesores[:4]):
+        crear_evaluacion(profesor, fecha=datetime.date(2020 + numero % 2, 7, 1))
+    return profesores
+
+
+def _paginas(cliente, url, parametros, cursor="", clave="nextCursor"):
+    """Páginas desde ``cursor`` siguiendo ``clave``, como ``(cursor, ids)``."""
+    paginas = []
+    while cursor is not None:
+        respuesta = cliente.get(url, {**parametros, "cursor": cursor})
+        assert respuesta.status_code == 200
+        pagina = respuesta.json()
+        paginas.append((cursor, [fila["id"] for fila in pagina["data"]]))
+        cursor = pagina["meta"][clave]
+    return paginas
+
+
+def _ids(cliente, url, parametros):
+    return [fila["id"] for fila in cliente.get(url, parametros).json()]
+
+
+@pytest.mark.view
+@pytest.mark.success
+@pytest.mark.parametrize(
+    "url, parametros",
+    [
+        ("/api/publicaciones/", {"ordering": "anno"}),
+        ("/api/publicaciones/", {"ordering": "-anno,nivel"}),
+        ("/api/profesores/scorecard", {"ordering": "ultimaEvaluacion"}),
+        ("/api/profesores/scorecard", {"ordering": "-ultimaEvaluacion"}),
+        ("/api/profesores/scorecard", {}),
+    ],
+)
+def test_cursor_recorre_todas_las_filas_con_empates(
+    cliente, publicaciones, profesores, url, parametros
+):
+    esperados = _ids(cliente, url, parametros)
+    parametros = {**parametros, "limit": 2}
+
+    adelante = _paginas(cliente, url, parametros)
+    assert [id_ for _, ids in adelante for id_ in ids] == esperados
+
+    # Desde la última página hacia atrás
+    ultimo, _ = adelante[-1]
+    atras = _paginas(cliente, url, parametros, ultimo, "previousCursor")
+    assert [id_ for _, ids in reversed(atras) for id_ in ids] == esperados
+
+
+@pytest.mark.view
+@pytest.mark.success
+def test_cursor_filtra_por_posicion_sin_offset(cliente, publicaciones):
+    parametros = {"ordering": "anno", "limit": 2}
+    cursor = cliente.get("/api/publicaciones/", {**parametros, "cursor": ""})
+    cursor = cursor.json()["meta"]["nextCursor"]
+
+    with CaptureQueriesContext(connection) as consultas:
+        cliente.get("/api/publicaciones/", {**parametros, "cursor": cursor})
+
+    sql = consultas.captured_queries[-1]["sql"]
+    assert "OFFSET" not in sql
+    assert '"anno" >= 2020' in sql
+
+
+@pytest.mark.view
+@pytest.mark.failure
+@pytest.mark.parametrize("cursor", ["no-es-un-cursor", "cD1bMV0="])
+def test_cursor_invalido(cliente, publicaciones, cursor):
+    respuesta = cliente.get(
+        "/api/publicaciones/", {"ordering": "anno", "cursor": cursor}
+    )
+
+    assert respuesta.status_code == 404
+
+
+@pytest.mark.view
+@pytest.mark.success
+def test_cursor_con_search_ordena_por_relevancia(cliente):
+    titulos = [
+        "Un estudio sobre datos",
+        "Datos abiertos: datos, metadatos y más datos",
+        "Otro tema",
+        "Minería de datos sobre datos abiertos",
+        "Bases de datos",
+    ]
+    for titulo in titulos:
+        crear_publicacion(titulo=titulo)
+    parametros = {"search": "datos"}
+    esperados = _ids(cliente, "/api/publicaciones/", parametros)
+    assert esperados != sorted(esperados)
+
+    paginas = _paginas(cliente, "/api/publicaciones/", {**parametros, "limit": 2})
+
+    assert [id_ for _, ids in paginas for id_ in ids] == esperados
@@ -0,0 +1,91 @@
+import pytest
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as CamelCaseJSONRendererOriginal,
+)
+from rest_framework import serializers
+
+from apps.negocio.sgac.tests.datos import (
+    crear_asignatura,
+    crear_carrera,
+    crear_disciplina,
+    crear_evaluacion,
+    crear_profesor,
+    crear_publicacion,
+)
+from general.renderizadores import CamelCaseJSONRenderer, mapa_claves
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def datos():
+    disciplina = crear_disciplina(crear_carrera())
+    crear_asignatura(disciplina)
+    crear_asignatura(disciplina, nombre="Programación II", codigo="P2")
+    for numero in range(3):
+        profesor = crear_profesor(
+            nombre=f"Profesor {numero}",
+            correos=[{"etiqueta": "trabajo_uci", "correo": f"p{numero}@uci.cu"}],
+        )
+        crear_evaluacion(profesor)
+    crear_publicacion()
+    return disciplina
+
+
+@pytest.mark.view
+@pytest.mark.success
+@pytest.mark.parametrize(
+    "url, parametros",
+    [
+        # Anidados y expandidos
+        ("/api/carreras/{carrera}/disciplinas/{disciplina}/asignaturas", {}),
+        (
+            "/api/carreras/{carrera}/disciplinas/{disciplina}/asignaturas",
+            {"expand": "disciplina.carrera"},
+        ),
+        ("/api/profesorevaluacion", {"expand": "profesor,indicador"}),
+        ("/api/profesores/scorecard", {}),
+        # Paginados
+        ("/api/profesores", {"page": 1, "limit": 2}),
+        ("/api/profesores", {"cursor": "", "limit": 2}),
+        ("/api/publicaciones/", {"page": 1}),
+        # Reportes
+        ("/api/reportes/publicaciones", {}),
+        ("/api/reportes/claustro", {}),
+        ("/api/reportes/evaluaciones", {}),
+    ],
+)
+def test_igual_que_el_renderizador_original(cliente, datos, url, parametros):
+    respuesta = cliente.get(
+        url.format(carrera=datos.carrera_id, disciplina=datos.pk), parametros
+    )
+    assert respuesta.status_code == 200
+    assert isinstance(respuesta.accepted_renderer, CamelCaseJSONRenderer)
+
+    original = CamelCaseJSONRendererOriginal().render(
+        respuesta.data,
+        respuesta.accepted_media_type,
+        respuesta.renderer_context,
+    )
+
+    assert respuesta.content == original
+
+
+class SerializerConArgumentos(serializers.Serializer):
+    nombre_completo = serializers.CharField()
+
+    def __init__(self, requerido, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+
+class SerializerConAnidado(serializers.Serializer):
+    fecha_alta = serializers.DateField()
+    anidado = SerializerConArgumentos(None)
+
+
+@pytest.mark.success
+def test_mapa_claves_omite_serializers_que_requieren_argumentos():
+    assert mapa_claves(SerializerConAnidado) == {
+        "fecha_alta": "fechaAlta",
+        "anidado": "anidado",
+    }
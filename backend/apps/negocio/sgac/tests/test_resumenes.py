@@ -0,0 +1,43 @@
+import pytest
+
+from apps.negocio.sgac.models import Evento, ResumenEventos
+from apps.negocio.sgac.reportes.resumenes import RESUMEN_EVENTOS
+from apps.negocio.sgac.tests.datos import crear_evento
+
+pytestmark = pytest.mark.django_db
+
+
+def resumen_eventos():
+    return {
+        (fila.anno, fila.clasificacion): fila.cantidad
+        for fila in ResumenEventos.objects.all()
+    }
+
+
+@pytest.mark.success
+def test_resumen_sigue_a_los_cambios_del_origen():
+    evento = crear_evento()
+    crear_evento()
+    assert resumen_eventos() == {(2024, Evento.Clasificacion.NACIONAL): 2}
+
+    evento.clasificacion = Evento.Clasificacion.INTERNACIONAL
+    evento.save()
+    assert resumen_eventos() == {
+        (2024, Evento.Clasificacion.NACIONAL): 1,
+        (2024, Evento.Clasificacion.INTERNACIONAL): 1,
+    }
+
+    evento.delete()
+    assert resumen_eventos() == {(2024, Evento.Clasificacion.NACIONAL): 1}
+
+
+@pytest.mark.success
+def test_actualizar_crea_la_fila_que_falta():
+    crear_evento()
+    ResumenEventos.objects.all().delete()
+
+    RESUMEN_EVENTOS.actualizar(
+        {"anno": 2024, "clasificacion": Evento.Clasificacion.NACIONAL}
+    )
+
+    assert resumen_eventos() == {(2024, Evento.Clasificacion.NACIONAL): 1}
@@ -4,13 +4,31 @@ from apps.negocio.sgac.models import ProfesorPublicacion
 from apps.negocio.sgac.views.asignatura import AsignaturaViewSet
 from apps.negocio.sgac.views.carrera import CarreraViewSet
 from apps.negocio.sgac.views.disciplina import DisciplinaViewSet
+from apps.negocio.sgac.views.dossier import DossierCarreraView
 from apps.negocio.sgac.views.evento import EventoViewSet
 from apps.negocio.sgac.views.indicador_evaluacion import IndicadorEvaluacionViewSet
 from apps.negocio.sgac.views.premio import PremioViewSet
-from apps.negocio.sgac.views.profesor import ProfesorViewSet
+from apps.negocio.sgac.views.profesor import (
+    ProfesorBusquedaView,
+    ProfesorScorecardViewSet,
+    ProfesorViewSet,
+)
 from apps.negocio.sgac.views.profesor_evaluacion import ProfesorEvaluacionViewSet
 from apps.negocio.sgac.views.profesor_publicacion import ProfesorPublicacionViewSet
-from apps.negocio.sgac.views.publicacion import PublicacionViewSet
+from apps.negocio.sgac.views.publicacion import (
+    PublicacionDuplicadosView,
+    PublicacionViewSet,
+)
+from apps.negocio.sgac.views.reporte import (
+    ReporteClaustroAsignaturasView,
+    ReporteClaustroView,
+    ReporteEvaluacionesView,
+    ReporteExperienciaView,
+    ReporteGradosView,
+    ReportePonenciasView,
+    ReportePremiosView,
+    ReportePublicacionesView,
+)
 
 acciones_listar = {"get": "list", "post": "create"}
 acciones_detalles = {
@@ -22,18 +40,22 @@ acciones_detalles = {
 
 listar_carreras = CarreraViewSet.as_view(acciones_listar)
 detalle_carreras = CarreraViewSet.as_view(acciones_detalles)
+dossier_carrera = DossierCarreraView.as_view()
 
 listar_disciplinas = DisciplinaViewSet.as_view(acciones_listar)
 detalle_disciplinas = DisciplinaViewSet.as_view(acciones_detalles)
 
 listar_profesores = ProfesorViewSet.as_view(acciones_listar)
 detalle_profesores = ProfesorViewSet.as_view(acciones_detalles)
+scorecard_profesores = ProfesorScorecardViewSet.as_view({"get": "list"})
+buscar_profesores = ProfesorBusquedaView.as_view()
 
 listar_indicador_evaluacion = IndicadorEvaluacionViewSet.as_view(acciones_listar)
 detalle_indicador_evaluacion = IndicadorEvaluacionViewSet.as_view(acciones_detalles)
 
 listar_publicacion = PublicacionViewSet.as_view(acciones_listar)
 detalle_publicacion = PublicacionViewSet.as_view(acciones_detalles)
+duplicados_publicacion = PublicacionDuplicadosView.as_view()
 
 listar_publicacion_autor = ProfesorPublicacionViewSet.as_view(acciones_listar)
 detalle_publicacion_autor = ProfesorPublicacionViewSet.as_view(acciones_detalles)
@@ -50,6 +72,15 @@ detalle_asignatura = AsignaturaViewSet.as_view(acciones_detalles)
 listar_profesores_evaluacion = ProfesorEvaluacionViewSet.as_view(acciones_listar)
 detalle_profesores_evaluacion = ProfesorEvaluacionViewSet.as_view(acciones_detalles)
 
+reporte_claustro = ReporteClaustroView.as_view()
+reporte_claustro_asignaturas = ReporteClaustroAsignaturasView.as_view()
+reporte_experiencia = ReporteExperienciaView.as_view()
+reporte_grados = ReporteGradosView.as_view()
+reporte_publicaciones = ReportePublicacionesView.as_view()
+reporte_ponencias = ReportePonenciasView.as_view()
+reporte_premios = ReportePremiosView.as_view()
+reporte_evaluaciones = ReporteEvaluacionesView.as_view()
+
 # fmt: off
 urlpatterns = [
     path("eventos", listar_evento, name="evento-list"),
@@ -57,12 +88,15 @@ urlpatterns = [
     path("premios", listar_premio, name="premio-list"),
     path("premios/<int:id_premio>", detalle_premio, name="premio-detail"),
     path("publicaciones/", listar_publicacion, name="publicacion-list"),
+    path("publicaciones/duplicados", duplicados_publicacion, name="publicacion-duplicados"),
     path("publicaciones/<int:id_publicacion>",detalle_publicacion,name="publicacion-detail"),
     path("publicaciones/<int:id_publicacion>/autores", listar_publicacion_autor, name="profesorpublicacion-list"),
     path("publicaciones/<int:id_publicacion>/autores/<int:id_profesor>", detalle_publicacion_autor, name="profesorpublicacion-detail"),
     path("indicadores-evaluacion", listar_indicador_evaluacion, name="indicadorevaluacion-list"),
     path("indicadores-evaluacion/<int:id_indicador>", detalle_indicador_evaluacion, name="indicadorvaluacion-detail"),
     path("profesores", listar_profesores, name="profesor-list"),
+    path("profesores/scorecard", scorecard_profesores, name="profesor-scorecard"),
+    path("profesores/buscar", buscar_profesores, name="profesor-buscar"),
     path("profesores/<int:id_profesor>", detalle_profesores, name="profesor-detail"),
     path("profesores/<int:id_profesor>/evaluaciones", listar_profesores_evaluacion, name="profesorevaluacion-list"),
     path("profesores/<int:id_profesor>/evaluaciones/<int:id_indicador>", detalle_profesores_evaluacion, name="profesorevaluacion-detail"),
@@ -70,12 +104,21 @@ urlpatterns = [
     path("profesorevaluacion/<int:pk>", detalle_profesores_evaluacion, name="profesorevaluacion-detail"),
     path("carreras", listar_carreras, name="carrera-list"),
     path("carreras/<int:id_carrera>", detalle_carreras, name="carrera-detail"),
+    path("carreras/<int:id_carrera>/dossier", dossier_carrera, name="carrera-dossier"),
     path("carreras/<int:id_carrera>/disciplinas/<int:id_disciplina>", detalle_disciplinas, name="disciplina-detail"),
     path("carreras/<int:id_carrera>/disciplinas",listar_disciplinas, name="disciplina-list"),
     path("disciplinas", listar_disciplinas, name="disciplina-list"),
     path("disciplinas/<int:id_disciplina>", detalle_disciplinas, name="disciplina-detail"),
     path("carreras/<int:id_carrera>/disciplinas/<int:id_disciplina>/asignaturas",listar_asignatura, name="asignatura-list"),
     path("carreras/<int:id_carrera>/disciplinas/<int:id_disciplina>/asignaturas/<int:id_asignatura>",detalle_asignatura, name="asignatura-detail"),
+    path("reportes/claustro", reporte_claustro, name="reporte-claustro"),
+    path("reportes/claustro-asignaturas", reporte_claustro_asignaturas, name="reporte-claustro-asignaturas"),
+    path("reportes/experiencia", reporte_experiencia, name="reporte-experiencia"),
+    path("reportes/grados", reporte_grados, name="reporte-grados"),
+    path("reportes/publicaciones", reporte_publicaciones, name="reporte-publicaciones"),
+    path("reportes/ponencias", reporte_ponencias, name="reporte-ponencias"),
+    path("reportes/premios", reporte_premios, name="reporte-premios"),
+    path("reportes/evaluaciones", reporte_evaluaciones, name="reporte-evaluaciones"),
 ]
 
 # fmt: on
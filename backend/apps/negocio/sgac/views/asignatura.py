@@ -1,9 +1,9 @@
 from drf_spectacular.utils import extend_schema_view, extend_schema
 from rest_framework import viewsets
-from rest_framework.generics import get_object_or_404
 
-from apps.negocio.sgac.models import Asignatura, Carrera, Disciplina
+from apps.negocio.sgac.models import Asignatura
 from apps.negocio.sgac.views.serializers.asignatura import AsignaturaSerializer
+from general.mixins import ObtenerPorMultiplesCamposMixin, PrecargaMixin
 
 
 @extend_schema_view(
@@ -33,35 +33,23 @@ from apps.negocio.sgac.views.serializers.asignatura import AsignaturaSerializer
     ),
 )
 class AsignaturaViewSet(
+    ObtenerPorMultiplesCamposMixin,
+    PrecargaMixin,
     viewsets.ModelViewSet,
 ):
     queryset = Asignatura.objects.all()
     serializer_class = AsignaturaSerializer
-
-    def get_queryset(self):
-        return self.queryset.filter(disciplina=self.obtener_disciplina())
+    multiple_lookup_fields = {"id_asignatura": "pk"}
+    parent_lookup_fields = {
+        "id_carrera": "disciplina__carrera",
+        "id_disciplina": "disciplina",
+    }
 
     def obtener_carrera(self):
-        return get_object_or_404(Carrera.objects.all(), pk=self.kwargs["id_carrera"])
+        return self.obtener_padre("disciplina__carrera")
 
     def obtener_disciplina(self):
-        return get_object_or_404(
-            Disciplina.objects.all(),
-            carrera=self.obtener_carrera(),
-            pk=self.kwargs["id_disciplina"],
-        )
-
-    def get_object(self):
-        disciplina_obj = self.obtener_disciplina()
-        carrera_obj = self.obtener_carrera()
-
-        obj = get_object_or_404(
-            self.queryset,
-            pk=self.kwargs["id_asignatura"],
-            disciplina=disciplina_obj,
-        )
-        self.check_object_permissions(self.request, obj)
-        return obj
+        return self.obtener_padre("disciplina")
 
     def perform_create(self, serializer):
         print(f"Validated data before save: {serializer.validated_data}")
@@ -3,6 +3,7 @@ from rest_framework import viewsets
 
 from apps.negocio.sgac.models.carrera import Carrera
 from apps.negocio.sgac.views.serializers.carrera import CarreraSerializer
+from general.mixins import LecturaRapidaMixin, PrecargaMixin
 
 
 @extend_schema_view(
@@ -31,7 +32,7 @@ from apps.negocio.sgac.views.serializers.carrera import CarreraSerializer
         summary="Elimina una carrera.",
     ),
 )
-class CarreraViewSet(viewsets.ModelViewSet):
+class CarreraViewSet(LecturaRapidaMixin, PrecargaMixin, viewsets.ModelViewSet):
     queryset = Carrera.objects.all()
     serializer_class = CarreraSerializer
     lookup_url_kwarg = "id_carrera"
@@ -1,11 +1,13 @@
 from drf_spectacular.utils import extend_schema_view, extend_schema
-from rest_framework.generics import get_object_or_404
 from rest_framework.viewsets import ModelViewSet
 
-from apps.negocio.sgac.models import Carrera
 from apps.negocio.sgac.models.disciplina import Disciplina
 from apps.negocio.sgac.views.serializers.disciplina import DisciplinaSerializer
-from general.mixins import ObtenerPorMultiplesCamposMixin
+from general.mixins import (
+    LecturaRapidaMixin,
+    ObtenerPorMultiplesCamposMixin,
+    PrecargaMixin,
+)
 
 
 @extend_schema_view(
@@ -36,17 +38,17 @@ from general.mixins import ObtenerPorMultiplesCamposMixin
 )
 class DisciplinaViewSet(
     ObtenerPorMultiplesCamposMixin,
+    LecturaRapidaMixin,
+    PrecargaMixin,
     ModelViewSet,
 ):
     serializer_class = DisciplinaSerializer
     queryset = Disciplina.objects.all()
-    multiple_lookup_fields = {"id_carrera": "carrera_id", "id_disciplina": "id"}
-
-    def get_queryset(self):
-        return self.queryset.filter(carrera=self.obtener_carrera())
+    multiple_lookup_fields = {"id_disciplina": "id"}
+    parent_lookup_fields = {"id_carrera": "carrera"}
 
     def obtener_carrera(self):
-        return get_object_or_404(Carrera.objects.all(), pk=self.kwargs["id_carrera"])
+        return self.obtener_padre("carrera")
 
     def perform_create(self, serializer):
         serializer.save(carrera=self.obtener_carrera())
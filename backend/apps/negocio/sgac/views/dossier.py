@@ -0,0 +1,43 @@
+from django.utils.http import parse_etags
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.negocio.sgac.models import Carrera
+from apps.negocio.sgac.reportes import hojas_dossier, obtener_dossier
+from general.exportacion import PARAMETRO_FORMATO, ExportacionMixin
+
+
+class DossierCarreraView(ExportacionMixin, APIView):
+
+    @extend_schema(
+        tags=["Reportes"],
+        summary="Obtiene el dossier de acreditación de una carrera.",
+        description=(
+            "Se sirve desde una instantánea versionada que solo se regenera "
+            "cuando cambian los datos de la carrera. La respuesta incluye un "
+            "ETag; con If-None-Match se responde 304 si no hubo cambios."
+        ),
+        parameters=[PARAMETRO_FORMATO],
+    )
+    def get(self, request, *args, **kwargs):
+        carrera = get_object_or_404(Carrera.objects.all(), pk=self.kwargs["id_carrera"])
+        dossier = obtener_dossier(carrera)
+        if self.exportando():
+            self.nombre_exportacion = f"dossier-{carrera.pk}-v{dossier.version}"
+            return self.exportar(hojas_dossier(dossier.contenido))
+
+        cabeceras = {"ETag": dossier.etag}
+        etags = parse_etags(request.headers.get("If-None-Match", ""))
+        if dossier.etag in etags or "*" in etags:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=cabeceras)
+        return Response(
+            {
+                "version": dossier.version,
+                "generado": dossier.generado,
+                **dossier.contenido,
+            },
+            headers=cabeceras,
+        )
@@ -1,9 +1,14 @@
+from django.db.models import Prefetch
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema_view, extend_schema
-from rest_framework import viewsets, status
-from rest_framework.response import Response
+from rest_framework import viewsets
 
 from apps.negocio.sgac.models.evento import Evento
+from apps.negocio.sgac.models.profesor_evento import ProfesorEvento
+from apps.negocio.sgac.views.filtros import EventoFilterSet
 from apps.negocio.sgac.views.serializers.evento import EventoSerializer
+from general.mixins import PrecargaMixin
+from general.ordenamiento import CamelCaseOrderingFilter
 
 
 @extend_schema_view(
@@ -32,13 +37,18 @@ from apps.negocio.sgac.views.serializers.evento import EventoSerializer
         summary="Elimina un evento.",
     ),
 )
-class EventoViewSet(viewsets.ModelViewSet):
+class EventoViewSet(PrecargaMixin, viewsets.ModelViewSet):
     serializer_class = EventoSerializer
-    queryset = Evento.objects.all()
+    # Se declara explícitamente para fijar el orden de los autores
+    queryset = Evento.objects.prefetch_related(
+        Prefetch(
+            "profesorevento_set",
+            queryset=ProfesorEvento.objects.select_related("profesor").order_by("id"),
+        )
+    )
     lookup_url_kwarg = "id_evento"
     lookup_field = "pk"
-    
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+    filter_backends = [DjangoFilterBackend, CamelCaseOrderingFilter]
+    filterset_class = EventoFilterSet
+    ordering_fields = ["anno", "titulo", "clasificacion"]
+    ordering = ["id"]
@@ -0,0 +1,56 @@
+from django_filters import rest_framework as filters
+
+from apps.negocio.sgac.models import (
+    Evento,
+    Premio,
+    Profesor,
+    ProfesorEvaluacion,
+    Publicacion,
+)
+
+# Los nombres de los filtros no usan ``__`` porque ``CamelCaseMiddleWare``
+# convierte ``annoInicio`` en ``anno_inicio``, no en ``anno__gte``.
+
+
+class ProfesorFilterSet(filters.FilterSet):
+    class Meta:
+        model = Profesor
+        fields = ["categoria_docente", "grado_cientifico"]
+
+
+class PublicacionFilterSet(filters.FilterSet):
+    anno_inicio = filters.NumberFilter(
+        field_name="anno", lookup_expr="gte", label="Año inicial (inclusive)"
+    )
+    anno_fin = filters.NumberFilter(
+        field_name="anno", lookup_expr="lte", label="Año final (inclusive)"
+    )
+
+    class Meta:
+        model = Publicacion
+        fields = ["anno", "tipo_publicacion", "nivel"]
+
+
+class EventoFilterSet(filters.FilterSet):
+    class Meta:
+        model = Evento
+        fields = ["anno", "clasificacion"]
+
+
+class PremioFilterSet(filters.FilterSet):
+    class Meta:
+        model = Premio
+        fields = ["profesor", "anno", "clasificacion"]
+
+
+class ProfesorEvaluacionFilterSet(filters.FilterSet):
+    fecha_inicio = filters.DateFilter(
+        field_name="fecha", lookup_expr="gte", label="Fecha inicial (inclusive)"
+    )
+    fecha_fin = filters.DateFilter(
+        field_name="fecha", lookup_expr="lte", label="Fecha final (inclusive)"
+    )
+
+    class Meta:
+        model = ProfesorEvaluacion
+        fields = ["indicador"]
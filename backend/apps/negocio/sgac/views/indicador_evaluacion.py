@@ -7,6 +7,7 @@ from apps.negocio.sgac.views.serializers.disciplina import DisciplinaSerializer
 from apps.negocio.sgac.views.serializers.indicador_evaluacion import (
     IndicadorEvaluacionSerializer,
 )
+from general.mixins import LecturaRapidaMixin, PrecargaMixin
 
 
 @extend_schema_view(
@@ -35,7 +36,7 @@ from apps.negocio.sgac.views.serializers.indicador_evaluacion import (
         summary="Elimina un indicador de evaluación.",
     ),
 )
-class IndicadorEvaluacionViewSet(ModelViewSet):
+class IndicadorEvaluacionViewSet(LecturaRapidaMixin, PrecargaMixin, ModelViewSet):
     serializer_class = IndicadorEvaluacionSerializer
     queryset = IndicadorEvaluacion.objects.all()
     lookup_url_kwarg = "id_indicador"
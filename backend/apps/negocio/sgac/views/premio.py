@@ -1,8 +1,12 @@
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema_view, extend_schema
 from rest_framework import viewsets
 
 from apps.negocio.sgac.models.premio import Premio
+from apps.negocio.sgac.views.filtros import PremioFilterSet
 from apps.negocio.sgac.views.serializers.premio import PremioSerializer
+from general.mixins import LecturaRapidaMixin, PrecargaMixin
+from general.ordenamiento import CamelCaseOrderingFilter
 
 
 @extend_schema_view(
@@ -31,8 +35,12 @@ from apps.negocio.sgac.views.serializers.premio import PremioSerializer
         summary="Elimina un premio.",
     ),
 )
-class PremioViewSet(viewsets.ModelViewSet):
+class PremioViewSet(LecturaRapidaMixin, PrecargaMixin, viewsets.ModelViewSet):
     queryset = Premio.objects.all()
     serializer_class = PremioSerializer
     lookup_url_kwarg = "id_premio"
     lookup_field = "pk"
+    filter_backends = [DjangoFilterBackend, CamelCaseOrderingFilter]
+    filterset_class = PremioFilterSet
+    ordering_fields = ["anno", "clasificacion"]
+    ordering = ["id"]
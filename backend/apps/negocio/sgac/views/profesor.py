@@ -1,8 +1,24 @@
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema_view, extend_schema
-from rest_framework import viewsets
+from rest_framework import mixins, viewsets
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.negocio.sgac.models.profesor import Profesor
-from apps.negocio.sgac.views.serializers.profesor import ProfesorSerializer
+from apps.negocio.sgac.reportes import METRICAS_PRODUCTIVIDAD, anotar_productividad
+from apps.negocio.sgac.views.filtros import ProfesorFilterSet
+from apps.negocio.sgac.views.serializers.profesor import (
+    ProfesorBusquedaParametrosSerializer,
+    ProfesorBusquedaSerializer,
+    ProfesorScorecardSerializer,
+    ProfesorSerializer,
+)
+from general.busqueda import SinTildes
+from general.mixins import LecturaRapidaMixin, PrecargaMixin
+from general.ordenamiento import CamelCaseOrderingFilter
 
 
 @extend_schema_view(
@@ -31,8 +47,85 @@ from apps.negocio.sgac.views.serializers.profesor import ProfesorSerializer
         summary="Elimina un profesor.",
     ),
 )
-class ProfesorViewSet(viewsets.ModelViewSet):
+class ProfesorViewSet(LecturaRapidaMixin, PrecargaMixin, viewsets.ModelViewSet):
     serializer_class = ProfesorSerializer
     queryset = Profesor.objects.all()
     lookup_url_kwarg = "id_profesor"
     lookup_field = "pk"
+    filter_backends = [DjangoFilterBackend, CamelCaseOrderingFilter]
+    filterset_class = ProfesorFilterSet
+    ordering_fields = [
+        "nombre",
+        "primer_apellido",
+        "segundo_apellido",
+        "categoria_docente",
+        "grado_cientifico",
+        "annos_experiencia_carrera",
+        "annos_experiencia_mes",
+    ]
+    ordering = ["id"]
+
+
+@extend_schema_view(
+    list=extend_schema(
+        tags=["Gestión de Profesores"],
+        summary="Lista la productividad de los profesores.",
+        description=(
+            "Publicaciones (como autor principal y como coautor), eventos, "
+            "premios y últimas evaluaciones de cada profesor. Se puede "
+            "ordenar por cualquiera de las métricas con `ordering`."
+        ),
+    ),
+)
+class ProfesorScorecardViewSet(
+    PrecargaMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
+    serializer_class = ProfesorScorecardSerializer
+    # Anotado de antemano para que ``?fields=`` reconozca las métricas
+    queryset = anotar_productividad(Profesor.objects.all())
+    filter_backends = [CamelCaseOrderingFilter]
+    ordering_fields = [
+        "nombre",
+        "primer_apellido",
+        "segundo_apellido",
+        *METRICAS_PRODUCTIVIDAD,
+    ]
+    ordering = ["primer_apellido", "segundo_apellido", "nombre", "id"]
+
+
+class ProfesorBusquedaView(APIView):
+    """
+    Búsqueda de profesores por nombre para los selectores con autocompletado.
+    Compara el texto, sin tildes ni mayúsculas, con el nombre normalizado del
+    profesor: coinciden los que lo contienen y los que se le parecen por
+    trigramas (``pg_trgm``), ambos resueltos con su índice GIN.
+    """
+
+    @extend_schema(
+        tags=["Gestión de Profesores"],
+        summary="Busca profesores por nombre.",
+        parameters=[ProfesorBusquedaParametrosSerializer],
+        responses=ProfesorBusquedaSerializer(many=True),
+    )
+    def get(self, request, *args, **kwargs):
+        parametros = ProfesorBusquedaParametrosSerializer(data=request.query_params)
+        parametros.is_valid(raise_exception=True)
+        termino = Lower(SinTildes(Value(parametros.validated_data["q"])))
+        profesores = (
+            Profesor.objects.annotate(
+                similitud=TrigramWordSimilarity(termino, "nombre_normalizado")
+            )
+            .filter(
+                Q(nombre_normalizado__contains=termino)
+                | Q(nombre_normalizado__trigram_word_similar=termino)
+            )
+            .order_by("-similitud", "primer_apellido", "segundo_apellido", "nombre")
+            .only(
+                "id",
+                "nombre",
+                "primer_apellido",
+                "segundo_apellido",
+                "categoria_docente",
+            )[: parametros.validated_data["limit"]]
+        )
+        return Response(ProfesorBusquedaSerializer(profesores, many=True).data)
@@ -1,7 +1,7 @@
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema_view, extend_schema
 from rest_framework import viewsets
 from rest_framework.generics import get_object_or_404
-from rest_framework.response import Response
 
 from apps.negocio.sgac.models import (
     ProfesorPublicacion,
@@ -9,9 +9,12 @@ from apps.negocio.sgac.models import (
     ProfesorEvaluacion,
     Profesor,
 )
+from apps.negocio.sgac.views.filtros import ProfesorEvaluacionFilterSet
 from apps.negocio.sgac.views.serializers.profesor_evaluacion import (
     ProfesorEvaluacionSerializer,
 )
+from general.mixins import LecturaRapidaMixin, PrecargaMixin
+from general.ordenamiento import CamelCaseOrderingFilter
 
 
 @extend_schema_view(
@@ -41,6 +44,8 @@ from apps.negocio.sgac.views.serializers.profesor_evaluacion import (
     ),
 )
 class ProfesorEvaluacionViewSet(
+    LecturaRapidaMixin,
+    PrecargaMixin,
     viewsets.ModelViewSet,
 ):
     queryset = ProfesorEvaluacion.objects.all()
@@ -49,9 +54,13 @@ class ProfesorEvaluacionViewSet(
         "id_profesor": "profesor_id",
         "id_evaluacion": "indicador_id",
     }
+    filter_backends = [DjangoFilterBackend, CamelCaseOrderingFilter]
+    filterset_class = ProfesorEvaluacionFilterSet
+    ordering_fields = ["fecha", "indicador", "evaluacion"]
+    ordering = ["id"]
 
     def get_queryset(self):
-        qs = ProfesorEvaluacion.objects.all()
+        qs = super().get_queryset()
         id_profesor = self.kwargs.get('id_profesor')
         if id_profesor:
             return qs.filter(profesor_id=id_profesor)
@@ -62,9 +71,3 @@ class ProfesorEvaluacionViewSet(
             Profesor.objects.all(),
             pk=self.kwargs["id_profesor"],
         )
-
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        # Desactivar paginación: devolver todos los resultados
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
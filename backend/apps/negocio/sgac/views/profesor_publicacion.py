@@ -1,8 +1,7 @@
 from drf_spectacular.utils import extend_schema_view, extend_schema
 from rest_framework import viewsets
-from rest_framework.generics import get_object_or_404
 
-from apps.negocio.sgac.models import ProfesorPublicacion, Publicacion
+from apps.negocio.sgac.models import ProfesorPublicacion
 from general.mixins import ObtenerPorMultiplesCamposMixin
 
 
@@ -37,16 +36,8 @@ class ProfesorPublicacionViewSet(
     viewsets.ModelViewSet,
 ):
     queryset = ProfesorPublicacion.objects.all()
-    multiple_lookup_fields = {
-        "id_publicacion": "publicacion_id",
-        "id_profesor": "profesor_id",
-    }
-
-    def get_queryset(self):
-        return self.queryset.filter(publicacion=self.obtener_publicacion())
+    multiple_lookup_fields = {"id_profesor": "profesor_id"}
+    parent_lookup_fields = {"id_publicacion": "publicacion"}
 
     def obtener_publicacion(self):
-        return get_object_or_404(
-            Publicacion.objects.all(),
-            pk=self.kwargs["id_publicacion"],
-        )
+        return self.obtener_padre("publicacion")
@@ -1,14 +1,31 @@
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_view, extend_schema
 from rest_framework import viewsets
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.negocio.sgac.models.publicacion import Publicacion
-from apps.negocio.sgac.views.serializers.publicacion import PublicacionSerializer
+from apps.negocio.sgac.reportes.duplicados import candidatos_duplicados
+from apps.negocio.sgac.views.filtros import PublicacionFilterSet
+from apps.negocio.sgac.views.serializers.publicacion import (
+    PublicacionDuplicadosParametrosSerializer,
+    PublicacionSerializer,
+)
+from general.busqueda import BusquedaTextoFilter
+from general.mixins import LecturaRapidaMixin, PrecargaMixin
+from general.ordenamiento import CamelCaseOrderingFilter
 
 
 @extend_schema_view(
     list=extend_schema(
         tags=["Gestión de Publicaciones"],
         summary="Lista las publicaciones.",
+        description=(
+            "Con `search` se buscan las publicaciones por título, revista o "
+            "editorial e ISBN/ISSN, ordenadas por relevancia."
+        ),
     ),
     retrieve=extend_schema(
         tags=["Gestión de Publicaciones"],
@@ -31,8 +48,46 @@ from apps.negocio.sgac.views.serializers.publicacion import PublicacionSerialize
         summary="Elimina una publicación.",
     ),
 )
-class PublicacionViewSet(viewsets.ModelViewSet):
+class PublicacionViewSet(LecturaRapidaMixin, PrecargaMixin, viewsets.ModelViewSet):
     serializer_class = PublicacionSerializer
     queryset = Publicacion.objects.all()
     lookup_url_kwarg = "id_publicacion"
     lookup_field = "pk"
+    filter_backends = [
+        DjangoFilterBackend,
+        CamelCaseOrderingFilter,
+        BusquedaTextoFilter,
+    ]
+    filterset_class = PublicacionFilterSet
+    ordering_fields = ["anno", "titulo", "tipo_publicacion", "nivel"]
+    ordering = ["id"]
+    campo_busqueda = "busqueda"
+    configuracion_busqueda = "spanish"
+
+
+class PublicacionDuplicadosView(APIView):
+    """
+    Publicaciones que probablemente están registradas más de una vez,
+    agrupadas como candidatas a fusionarse. Solo para administradores.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        tags=["Gestión de Publicaciones"],
+        summary="Busca publicaciones duplicadas.",
+        description=(
+            "Agrupa las publicaciones del mismo año con títulos parecidos o "
+            "con el mismo ISBN/ISSN y títulos algo menos parecidos. La "
+            "similitud de los títulos se mide por trigramas, sin tildes ni "
+            "mayúsculas."
+        ),
+        parameters=[PublicacionDuplicadosParametrosSerializer],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    def get(self, request, *args, **kwargs):
+        parametros = PublicacionDuplicadosParametrosSerializer(
+            data=request.query_params
+        )
+        parametros.is_valid(raise_exception=True)
+        return Response(candidatos_duplicados(**parametros.validated_data))
@@ -3,6 +3,7 @@ from rest_framework import viewsets
 
 from apps.negocio.sgac.models.publicacion import PublicacionClasificacion
 from apps.negocio.sgac.views.serializers.publicacion import PublicacionClasificacionSerializer
+from general.mixins import PrecargaMixin
 
 
 @extend_schema_view(
@@ -15,7 +16,7 @@ from apps.negocio.sgac.views.serializers.publicacion import PublicacionClasifica
         summary="Obtiene una clasificación de publicación.",
     ),
 )
-class PublicacionClasificacionViewSet(viewsets.ReadOnlyModelViewSet):
+class PublicacionClasificacionViewSet(PrecargaMixin, viewsets.ReadOnlyModelViewSet):
     queryset = PublicacionClasificacion.objects.all()
     serializer_class = PublicacionClasificacionSerializer
     lookup_url_kwarg = "id_clasificacion"
@@ -0,0 +1,158 @@
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.negocio.sgac.reportes import (
+    hojas_claustro,
+    hojas_claustro_asignaturas,
+    hojas_evaluaciones,
+    hojas_experiencia,
+    hojas_grados,
+    hojas_ponencias,
+    hojas_premios,
+    hojas_publicaciones,
+    reporte_claustro,
+    reporte_claustro_asignaturas,
+    reporte_evaluaciones,
+    reporte_experiencia,
+    reporte_grados,
+    reporte_ponencias,
+    reporte_premios,
+    reporte_publicaciones,
+)
+from apps.negocio.sgac.views.serializers.reporte import (
+    ReporteCarreraParametrosSerializer,
+    ReporteClaustroAsignaturasParametrosSerializer,
+    ReporteEvaluacionesParametrosSerializer,
+    ReporteExperienciaParametrosSerializer,
+    ReportePonenciasParametrosSerializer,
+    ReportePremiosParametrosSerializer,
+    ReportePublicacionesParametrosSerializer,
+)
+from general.exportacion import PARAMETRO_FORMATO, ExportacionMixin
+
+
+def esquema_reporte(summary, parametros):
+    return extend_schema_view(
+        get=extend_schema(
+            tags=["Reportes"],
+            summary=summary,
+            description=(
+                "Con `format` se descarga el reporte como hoja de cálculo "
+                "(xlsx, csv u ods) en lugar de JSON."
+            ),
+            parameters=[parametros, PARAMETRO_FORMATO],
+        )
+    )
+
+
+class ReporteView(ExportacionMixin, APIView):
+    """
+    Valida los parámetros de la consulta con ``parametros_serializer_class``,
+    calcula el reporte con ``generar`` y lo devuelve en JSON o, con
+    ``?format=xlsx|csv|ods``, como hoja de cálculo construida con ``hojas``.
+    """
+
+    parametros_serializer_class = None
+
+    def generar(self, **parametros):
+        raise NotImplementedError
+
+    def hojas(self, reporte, **parametros):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        parametros = self.parametros_serializer_class(data=request.query_params)
+        parametros.is_valid(raise_exception=True)
+        reporte = self.generar(**parametros.validated_data)
+        if self.exportando():
+            return self.exportar(self.hojas(reporte, **parametros.validated_data))
+        return Response(reporte)
+
+
+@esquema_reporte(
+    "Composición del claustro por categoría docente.",
+    ReporteCarreraParametrosSerializer,
+)
+class ReporteClaustroView(ReporteView):
+    parametros_serializer_class = ReporteCarreraParametrosSerializer
+    nombre_exportacion = "claustro"
+    generar = staticmethod(reporte_claustro)
+    hojas = staticmethod(hojas_claustro)
+
+
+@esquema_reporte(
+    "Claustro de las asignaturas de una carrera.",
+    ReporteClaustroAsignaturasParametrosSerializer,
+)
+class ReporteClaustroAsignaturasView(ReporteView):
+    parametros_serializer_class = ReporteClaustroAsignaturasParametrosSerializer
+    nombre_exportacion = "claustro-asignaturas"
+    generar = staticmethod(reporte_claustro_asignaturas)
+    hojas = staticmethod(hojas_claustro_asignaturas)
+
+
+@esquema_reporte(
+    "Distribución del claustro por años de experiencia.",
+    ReporteExperienciaParametrosSerializer,
+)
+class ReporteExperienciaView(ReporteView):
+    parametros_serializer_class = ReporteExperienciaParametrosSerializer
+    nombre_exportacion = "experiencia"
+    generar = staticmethod(reporte_experiencia)
+    hojas = staticmethod(hojas_experiencia)
+
+
+@esquema_reporte(
+    "Distribución del claustro por grado científico y categoría docente.",
+    ReporteCarreraParametrosSerializer,
+)
+class ReporteGradosView(ReporteView):
+    parametros_serializer_class = ReporteCarreraParametrosSerializer
+    nombre_exportacion = "grados"
+    generar = staticmethod(reporte_grados)
+    hojas = staticmethod(hojas_grados)
+
+
+@esquema_reporte(
+    "Publicaciones por tipo, nivel y año.",
+    ReportePublicacionesParametrosSerializer,
+)
+class ReportePublicacionesView(ReporteView):
+    parametros_serializer_class = ReportePublicacionesParametrosSerializer
+    nombre_exportacion = "publicaciones"
+    generar = staticmethod(reporte_publicaciones)
+    hojas = staticmethod(hojas_publicaciones)
+
+
+@esquema_reporte(
+    "Ponencias por clasificación del evento y año.",
+    ReportePonenciasParametrosSerializer,
+)
+class ReportePonenciasView(ReporteView):
+    parametros_serializer_class = ReportePonenciasParametrosSerializer
+    nombre_exportacion = "ponencias"
+    generar = staticmethod(reporte_ponencias)
+    hojas = staticmethod(hojas_ponencias)
+
+
+@esquema_reporte(
+    "Premios por clasificación y año, con los totales por profesor.",
+    ReportePremiosParametrosSerializer,
+)
+class ReportePremiosView(ReporteView):
+    parametros_serializer_class = ReportePremiosParametrosSerializer
+    nombre_exportacion = "premios"
+    generar = staticmethod(reporte_premios)
+    hojas = staticmethod(hojas_premios)
+
+
+@esquema_reporte(
+    "Distribución de las evaluaciones por indicador y año.",
+    ReporteEvaluacionesParametrosSerializer,
+)
+class ReporteEvaluacionesView(ReporteView):
+    parametros_serializer_class = ReporteEvaluacionesParametrosSerializer
+    nombre_exportacion = "evaluaciones"
+    generar = staticmethod(reporte_evaluaciones)
+    hojas = staticmethod(hojas_evaluaciones)
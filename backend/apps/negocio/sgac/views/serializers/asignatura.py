@@ -2,11 +2,13 @@ from rest_framework import serializers
 
 from apps.negocio.sgac.models import Asignatura
 from apps.negocio.sgac.views.serializers.disciplina import DisciplinaSerializer
+from general.campos import CamposDinamicosMixin
 
 
-class AsignaturaSerializer(serializers.ModelSerializer):
+class AsignaturaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
 
-    disciplina = DisciplinaSerializer(read_only=True)
+    disciplina = serializers.PrimaryKeyRelatedField(read_only=True)
+    campos_expandibles = {"disciplina": DisciplinaSerializer}
 
     class Meta:
         model = Asignatura
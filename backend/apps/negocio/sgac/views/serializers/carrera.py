@@ -2,9 +2,10 @@ from rest_framework import serializers
 
 from apps.negocio.sgac.models.carrera import Carrera
 from apps.negocio.sgac.models.disciplina import Disciplina
+from general.campos import CamposDinamicosMixin
 
 
-class CarreraSerializer(serializers.ModelSerializer):
+class CarreraSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Carrera
         fields = [
@@ -2,11 +2,13 @@ from rest_framework import serializers
 
 from apps.negocio.sgac.models.disciplina import Disciplina
 from apps.negocio.sgac.views.serializers.carrera import CarreraSerializer
+from general.campos import CamposDinamicosMixin
 
 
-class DisciplinaSerializer(serializers.ModelSerializer):
+class DisciplinaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
 
-    carrera = CarreraSerializer(read_only=True)
+    carrera = serializers.PrimaryKeyRelatedField(read_only=True)
+    campos_expandibles = {"carrera": CarreraSerializer}
 
     class Meta:
         model = Disciplina
@@ -1,11 +1,26 @@
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from apps.negocio.sgac.models.evento import Evento
 from apps.negocio.sgac.models.profesor_evento import ProfesorEvento
 from apps.negocio.sgac.models.profesor import Profesor
+from apps.negocio.sgac.views.serializers.profesor import nombre_completo
+from general.campos import CamposDinamicosMixin
+from general.precarga import requiere_relaciones
 
 
-class EventoSerializer(serializers.ModelSerializer):
+class AutorEventoSerializer(serializers.ModelSerializer):
+    nombre_completo = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Profesor
+        fields = ["id", "nombre_completo"]
+
+    def get_nombre_completo(self, instance) -> str:
+        return nombre_completo(instance)
+
+
+class EventoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     profesor_id = serializers.PrimaryKeyRelatedField(
         queryset=Profesor.objects.all(),
         required=True,
@@ -14,6 +29,7 @@ class EventoSerializer(serializers.ModelSerializer):
         label="Profesor"
     )
     profesor_nombre = serializers.SerializerMethodField()
+    autores = serializers.SerializerMethodField()
 
     class Meta:
         model = Evento
@@ -25,15 +41,29 @@ class EventoSerializer(serializers.ModelSerializer):
             "clasificacion",
             "profesor_id",
             "profesor_nombre",
+            "autores",
+        ]
+
+    def _profesores(self, instance):
+        # Se recorre ``all()`` (y no ``first()``) para leer de la precarga
+        # en lugar de consultar por cada evento
+        return [
+            profesor_evento.profesor
+            for profesor_evento in instance.profesorevento_set.all()
         ]
 
+    @requiere_relaciones("profesorevento_set__profesor")
     def get_profesor_nombre(self, instance):
-        profesor_evento = instance.profesorevento_set.first()
-        if profesor_evento and profesor_evento.profesor:
-            profesor = profesor_evento.profesor
-            return f"{profesor.nombre} {profesor.primer_apellido} {profesor.segundo_apellido or ''}".strip()
+        profesores = self._profesores(instance)
+        if profesores:
+            return nombre_completo(profesores[0])
         return "N/A"
 
+    @extend_schema_field(AutorEventoSerializer(many=True))
+    @requiere_relaciones("profesorevento_set__profesor")
+    def get_autores(self, instance):
+        return AutorEventoSerializer(self._profesores(instance), many=True).data
+
     def create(self, validated_data):
         profesor = validated_data.pop('profesor')
         evento = Evento.objects.create(**validated_data)
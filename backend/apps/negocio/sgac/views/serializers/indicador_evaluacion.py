@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
 from apps.negocio.sgac.models import IndicadorEvaluacion
+from general.campos import CamposDinamicosMixin
 
 
-class IndicadorEvaluacionSerializer(serializers.ModelSerializer):
+class IndicadorEvaluacionSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = IndicadorEvaluacion
         fields = [
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
 from apps.negocio.sgac.models.premio import Premio
+from general.campos import CamposDinamicosMixin
 
 
-class PremioSerializer(serializers.ModelSerializer):
+class PremioSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
 
     class Meta:
         model = Premio
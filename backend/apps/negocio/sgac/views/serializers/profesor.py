@@ -1,6 +1,16 @@
 from rest_framework import serializers
 
+from apps.negocio.sgac.models import ProfesorEvaluacion
 from apps.negocio.sgac.models.profesor import Profesor
+from apps.negocio.sgac.views.serializers.indicador_evaluacion import (
+    IndicadorEvaluacionSerializer,
+)
+from general.campos import CamposDinamicosMixin
+
+
+def nombre_completo(profesor):
+    return f"{profesor.nombre} {profesor.primer_apellido} {profesor.segundo_apellido or ''}".strip()
+
 
 class CorreoSerializer(serializers.Serializer):
     etiqueta = serializers.CharField()
@@ -10,7 +20,7 @@ class TelefonoSerializer(serializers.Serializer):
     etiqueta = serializers.CharField()
     numero = serializers.CharField()
 
-class ProfesorSerializer(serializers.ModelSerializer):
+class ProfesorSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
 
     telefonos = TelefonoSerializer(many=True)
     correos = CorreoSerializer(many=True)
@@ -30,3 +40,63 @@ class ProfesorSerializer(serializers.ModelSerializer):
             "correos",
             "telefonos",
         ]
+
+
+class UltimaEvaluacionSerializer(serializers.ModelSerializer):
+    indicador = IndicadorEvaluacionSerializer(read_only=True)
+
+    class Meta:
+        model = ProfesorEvaluacion
+        fields = ["indicador", "evaluacion", "fecha"]
+
+
+class ProfesorScorecardSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
+    total_publicaciones = serializers.IntegerField(read_only=True)
+    publicaciones_autor_principal = serializers.IntegerField(read_only=True)
+    publicaciones_coautor = serializers.IntegerField(read_only=True)
+    total_eventos = serializers.IntegerField(read_only=True)
+    total_premios = serializers.IntegerField(read_only=True)
+    ultima_evaluacion = serializers.DateField(read_only=True)
+    ultimas_evaluaciones = UltimaEvaluacionSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Profesor
+        fields = [
+            "id",
+            "nombre",
+            "primer_apellido",
+            "segundo_apellido",
+            "categoria_docente",
+            "grado_cientifico",
+            "total_publicaciones",
+            "publicaciones_autor_principal",
+            "publicaciones_coautor",
+            "total_eventos",
+            "total_premios",
+            "ultima_evaluacion",
+            "ultimas_evaluaciones",
+        ]
+
+
+class ProfesorBusquedaParametrosSerializer(serializers.Serializer):
+    q = serializers.CharField(
+        help_text="Texto a buscar en el nombre y los apellidos, con o sin tildes."
+    )
+    limit = serializers.IntegerField(
+        required=False,
+        default=10,
+        min_value=1,
+        max_value=50,
+        help_text="Cantidad máxima de resultados.",
+    )
+
+
+class ProfesorBusquedaSerializer(serializers.ModelSerializer):
+    nombre_completo = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Profesor
+        fields = ["id", "nombre_completo", "categoria_docente"]
+
+    def get_nombre_completo(self, instance) -> str:
+        return nombre_completo(instance)
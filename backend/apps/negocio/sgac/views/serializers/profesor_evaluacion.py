@@ -5,17 +5,22 @@ from apps.negocio.sgac.views.serializers.indicador_evaluacion import (
     IndicadorEvaluacionSerializer,
 )
 from apps.negocio.sgac.views.serializers.profesor import ProfesorSerializer
+from general.campos import CamposDinamicosMixin
 
 
-class ProfesorEvaluacionSerializer(serializers.ModelSerializer):
-    profesor = ProfesorSerializer(read_only=True)
+class ProfesorEvaluacionSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
+    profesor = serializers.PrimaryKeyRelatedField(read_only=True)
     profesor_id = serializers.PrimaryKeyRelatedField(
         queryset=Profesor.objects.all(), source='profesor', write_only=True
     )
-    indicador = IndicadorEvaluacionSerializer(read_only=True)
+    indicador = serializers.PrimaryKeyRelatedField(read_only=True)
     indicador_id = serializers.PrimaryKeyRelatedField(
         queryset=IndicadorEvaluacion.objects.all(), source='indicador', write_only=True
     )
+    campos_expandibles = {
+        "profesor": ProfesorSerializer,
+        "indicador": IndicadorEvaluacionSerializer,
+    }
 
     class Meta:
         model = ProfesorEvaluacion
@@ -1,9 +1,14 @@
 from rest_framework import serializers
 
 from apps.negocio.sgac.models.publicacion import Publicacion
+from apps.negocio.sgac.reportes.duplicados import (
+    SIMILITUD_TITULO,
+    SIMILITUD_TITULO_MISMO_ISBN,
+)
+from general.campos import CamposDinamicosMixin
 
 
-class PublicacionSerializer(serializers.ModelSerializer):
+class PublicacionSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     anno = serializers.IntegerField(required=False, allow_null=True)
     nivel = serializers.IntegerField(required=False, allow_null=True)
 
@@ -20,4 +25,19 @@ class PublicacionSerializer(serializers.ModelSerializer):
             "base_datos_revista",
             "verificacion_referencia",
             "nivel",
-        ]
\ No newline at end of file
+        ]
+
+
+class PublicacionDuplicadosParametrosSerializer(serializers.Serializer):
+    similitud = serializers.FloatField(
+        default=SIMILITUD_TITULO,
+        min_value=SIMILITUD_TITULO_MISMO_ISBN,
+        max_value=1,
+        help_text=(
+            f"Similitud mínima entre los títulos, de {SIMILITUD_TITULO_MISMO_ISBN} "
+            "a 1, para considerar duplicadas dos publicaciones del mismo año."
+        ),
+    )
+    anno = serializers.IntegerField(
+        required=False, help_text="Restringe la búsqueda a las publicaciones de un año."
+    )
@@ -0,0 +1,85 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+from apps.negocio.sgac.models import Carrera, Profesor
+from apps.negocio.sgac.reportes.experiencia import LIMITES_EXPERIENCIA
+from apps.negocio.sgac.reportes.pivote import rango_annos_por_defecto
+
+MAXIMO_ANNOS = 30
+
+
+class ReporteCarreraParametrosSerializer(serializers.Serializer):
+    carrera = serializers.PrimaryKeyRelatedField(
+        queryset=Carrera.objects.all(),
+        required=False,
+        help_text="Restringe el reporte a una carrera.",
+    )
+
+
+class ReporteAnnosParametrosSerializer(serializers.Serializer):
+    anno_inicio = serializers.IntegerField(
+        required=False,
+        help_text="Primer año del reporte. Por defecto, cuatro años antes del final.",
+    )
+    anno_fin = serializers.IntegerField(
+        required=False,
+        help_text="Último año del reporte. Por defecto, el año en curso.",
+    )
+
+    def validate(self, attrs):
+        anno_inicio, anno_fin = rango_annos_por_defecto(attrs.get("anno_fin"))
+        anno_inicio = attrs.get("anno_inicio", anno_inicio)
+        if anno_inicio > anno_fin:
+            raise serializers.ValidationError(
+                {"anno_inicio": _("El año inicial no puede ser posterior al final.")}
+            )
+        if anno_fin - anno_inicio >= MAXIMO_ANNOS:
+            raise serializers.ValidationError(
+                {
+                    "anno_fin": _("El reporte abarca como máximo %(maximo)d años.")
+                    % {"maximo": MAXIMO_ANNOS}
+                }
+            )
+        return {**attrs, "anno_inicio": anno_inicio, "anno_fin": anno_fin}
+
+
+class ReportePublicacionesParametrosSerializer(
+    ReporteAnnosParametrosSerializer, ReporteCarreraParametrosSerializer
+):
+    pass
+
+
+class ReportePonenciasParametrosSerializer(ReportePublicacionesParametrosSerializer):
+    profesor = serializers.PrimaryKeyRelatedField(
+        queryset=Profesor.objects.all(),
+        required=False,
+        help_text="Restringe el reporte a los eventos de un profesor.",
+    )
+
+
+class ReportePremiosParametrosSerializer(ReportePublicacionesParametrosSerializer):
+    pass
+
+
+class ReporteEvaluacionesParametrosSerializer(ReportePublicacionesParametrosSerializer):
+    pass
+
+
+class ReporteClaustroAsignaturasParametrosSerializer(serializers.Serializer):
+    carrera = serializers.PrimaryKeyRelatedField(
+        queryset=Carrera.objects.all(),
+        help_text="Carrera cuyas asignaturas se reportan.",
+    )
+
+
+class ReporteExperienciaParametrosSerializer(ReporteCarreraParametrosSerializer):
+    limites = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        default=LIMITES_EXPERIENCIA,
+        max_length=20,
+        help_text="Límites inferiores de los rangos de años de experiencia.",
+    )
+
+    def validate_limites(self, value):
+        return sorted(set(value))
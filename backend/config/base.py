@@ -119,11 +119,23 @@ USE_I18N = True
 USE_L10N = False
 DATE_FORMAT = "d, m, Y"
 
+# Conteos de los listados paginados (general.conteo)
+PAGINACION_TIEMPO_CACHE_CONTEOS = int(
+    os.getenv("PAGINACION_TIEMPO_CACHE_CONTEOS", 300)
+)
+PAGINACION_MINIMO_CONTEO_ESTIMADO = int(
+    os.getenv("PAGINACION_MINIMO_CONTEO_ESTIMADO", 100_000)
+)
+PAGINACION_MINIMO_CONTEO_CACHE = int(
+    os.getenv("PAGINACION_MINIMO_CONTEO_CACHE", 10_000)
+)
+PAGINACION_CACHE_CONTEOS = os.getenv("PAGINACION_CACHE_CONTEOS", "default")
+
 
 REST_FRAMEWORK = {
     # Rendering & Parsing
     "DEFAULT_RENDERER_CLASSES": (
-        "djangorestframework_camel_case.render.CamelCaseJSONRenderer",
+        "general.renderizadores.CamelCaseJSONRenderer",
         "djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer",
     ),
     "DEFAULT_PARSER_CLASSES": (
@@ -140,7 +152,7 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     # Schema
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_SCHEMA_CLASS": "general.esquema.AutoSchema",
     # Validations
     "NON_FIELD_ERRORS_KEY": "__general__",
 }
@@ -0,0 +1,65 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, FloatField, Func, TextField
+from django.db.models.functions import Cast
+from django.utils.encoding import force_str
+from django.utils.translation import gettext_lazy as _
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+
+class SinTildes(Func):
+    """
+    ``unaccent`` de PostgreSQL envuelto en la función inmutable
+    ``sgac_unaccent``, que se puede usar en columnas generadas e índices. La
+    función la crea la migración ``sgac.0016``.
+    """
+
+    function = "sgac_unaccent"
+    output_field = TextField()
+
+
+class BusquedaTextoFilter(BaseFilterBackend):
+    """
+    Búsqueda de texto completo con ``?search=`` sobre la columna
+    ``campo_busqueda`` de la vista, un ``SearchVectorField`` indexado con GIN
+    en la configuración ``configuracion_busqueda``. Acepta la sintaxis de los
+    buscadores web: frases entre comillas, ``or`` y ``-`` para excluir.
+
+    Si no se pide otro orden con ``?ordering=`` los resultados se ordenan por
+    relevancia, también con ``?cursor=``, por lo que debe ir después del
+    filtro de ordenamiento en ``filter_backends``.
+    """
+
+    search_param = api_settings.SEARCH_PARAM
+    search_description = _(
+        "Texto a buscar. Admite frases entre comillas, `or` y `-` para excluir."
+    )
+
+    def filter_queryset(self, request, queryset, view):
+        termino = request.query_params.get(self.search_param, "").strip()
+        if not termino:
+            return queryset
+        campo = view.campo_busqueda
+        consulta = SearchQuery(
+            termino,
+            search_type="websearch",
+            config=getattr(view, "configuracion_busqueda", "spanish"),
+        )
+        queryset = queryset.filter(**{campo: consulta})
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        # ``ts_rank`` devuelve ``real``: en doble precisión el valor que se lee
+        # es exactamente el que se compara al continuar desde un ``?cursor=``
+        relevancia = Cast(SearchRank(F(campo), consulta), FloatField())
+        return queryset.annotate(relevancia=relevancia).order_by("-relevancia", "pk")
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": force_str(self.search_description),
+                "schema": {"type": "string"},
+            },
+        ]
@@ -0,0 +1,223 @@
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import ForeignObjectRel, Prefetch
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camel_to_underscore
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+PARAMETRO_CAMPOS = OpenApiParameter(
+    name="fields",
+    type=OpenApiTypes.STR,
+    description=(
+        "Campos de la respuesta, separados por comas. Los demás no se "
+        "devuelven ni se leen de la base de datos."
+    ),
+)
+
+PARAMETRO_EXCLUIR = OpenApiParameter(
+    name="exclude",
+    type=OpenApiTypes.STR,
+    description="Campos que se omiten de la respuesta, separados por comas.",
+)
+
+PARAMETRO_EXPANDIR = OpenApiParameter(
+    name="expand",
+    type=OpenApiTypes.STR,
+    description=(
+        "Relaciones que se devuelven como objetos en lugar de su id, "
+        "separadas por comas. Las anidadas se indican con puntos, por "
+        "ejemplo `disciplina.carrera`."
+    ),
+)
+
+
+def _lista(valor):
+    if valor is None:
+        return None
+    return {
+        camel_to_underscore(campo.strip(), **api_settings.JSON_UNDERSCOREIZE)
+        for campo in valor.split(",")
+        if campo.strip()
+    }
+
+
+def campos_solicitados(request, nombres):
+    """
+    Campos de ``nombres`` que se piden con ``?fields=`` y ``?exclude=``, o
+    ``None`` si no se restringe ninguno. Solo se aplica a las lecturas: en las
+    escrituras los campos del serializer también validan la entrada.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    incluir = _lista(request.query_params.get(PARAMETRO_CAMPOS.name))
+    excluir = _lista(request.query_params.get(PARAMETRO_EXCLUIR.name))
+    if incluir is None and excluir is None:
+        return None
+    seleccion = set(nombres) if incluir is None else incluir.intersection(nombres)
+    return frozenset(seleccion - (excluir or set()))
+
+
+def expansiones_solicitadas(request):
+    """Rutas de ``?expand=``, como ``frozenset`` de cadenas ``"a.b"``."""
+    if request is None:
+        return frozenset()
+    valor = request.query_params.get(PARAMETRO_EXPANDIR.name)
+    if not valor:
+        return frozenset()
+    return frozenset(
+        ".".join(
+            camel_to_underscore(nombre, **api_settings.JSON_UNDERSCOREIZE)
+            for nombre in ruta.strip().split(".")
+        )
+        for ruta in valor.split(",")
+        if ruta.strip()
+    )
+
+
+def _dividir_expansiones(expansiones):
+    """``{"a.b", "c"}`` -> ``{"a": {"b"}, "c": set()}``."""
+    divididas = {}
+    for ruta in expansiones:
+        nombre, _, resto = ruta.partition(".")
+        hijas = divididas.setdefault(nombre, set())
+        if resto:
+            hijas.add(resto)
+    return divididas
+
+
+class CamposDinamicosMixin:
+    """
+    Serializer cuyos campos se pueden restringir con ``?fields=`` y
+    ``?exclude=``. Solo se aplica al serializer principal de la respuesta,
+    no a los anidados. Los campos de solo escritura se conservan.
+
+    Las relaciones de solo lectura de ``campos_expandibles`` (nombre del
+    campo -> serializer) se devuelven como ids salvo que se pidan con
+    ``?expand=``; entonces se serializan con su serializer, que a su vez
+    puede expandir las suyas (``?expand=disciplina.carrera``).
+    """
+
+    campos_expandibles = {}
+
+    def __init__(self, *args, expandir=None, **kwargs):
+        self._expandir = expandir
+        super().__init__(*args, **kwargs)
+
+    def _es_principal(self):
+        padre = self.parent
+        if isinstance(padre, serializers.ListSerializer):
+            padre = padre.parent
+        return padre is None
+
+    def _expansiones(self):
+        if self._expandir is not None:
+            return self._expandir
+        if self._es_principal():
+            return expansiones_solicitadas(self.context.get("request"))
+        return frozenset()
+
+    def get_fields(self):
+        campos = super().get_fields()
+        expansiones = _dividir_expansiones(self._expansiones())
+        for nombre, hijas in expansiones.items():
+            serializer_class = self.campos_expandibles.get(nombre)
+            if (
+                serializer_class is None
+                or nombre not in campos
+                or not campos[nombre].read_only
+            ):
+                continue
+            campos[nombre] = serializer_class(
+                source=campos[nombre].source,
+                many=isinstance(campos[nombre], serializers.ManyRelatedField),
+                read_only=True,
+                expandir=frozenset(hijas),
+            )
+
+        if not self._es_principal():
+            return campos
+        seleccion = campos_solicitados(self.context.get("request"), campos)
+        if seleccion is None:
+            return campos
+        return {
+            nombre: campo
+            for nombre, campo in campos.items()
+            if nombre in seleccion or campo.write_only
+        }
+
+
+@lru_cache(maxsize=None)
+def campos_serializer(serializer_class):
+    """Campos de ``serializer_class``, sin restringir. Se obtienen una vez por clase."""
+    return serializer_class().fields
+
+
+def _columnas_de_campo(campo, modelo, calculados):
+    """
+    Columnas del modelo que lee ``campo``, o ``None`` si no se pueden deducir
+    (por ejemplo un ``SerializerMethodField`` sin :func:`requiere_relaciones`).
+    """
+    if isinstance(campo, serializers.SerializerMethodField):
+        metodo = getattr(campo.parent, campo.method_name)
+        rutas = getattr(metodo, "relaciones", None)
+        if rutas is None:
+            return None
+        nombres = [ruta.split("__")[0] for ruta in rutas]
+    elif campo.source == "*":
+        return None
+    else:
+        nombres = [campo.source_attrs[0]]
+
+    columnas = set()
+    for nombre in nombres:
+        if nombre in calculados:
+            continue
+        try:
+            campo_modelo = modelo._meta.get_field(nombre)
+        except FieldDoesNotExist:
+            # Las relaciones inversas se leen por su accesor (``x_set``)
+            if any(
+                relacion.get_accessor_name() == nombre
+                for relacion in modelo._meta.related_objects
+            ):
+                continue
+            return None
+        if isinstance(campo_modelo, ForeignObjectRel) or campo_modelo.many_to_many:
+            continue
+        columnas.add(campo_modelo.name)
+    return columnas
+
+
+def podar_columnas(queryset, serializer_class, campos):
+    """
+    Limita con ``only()`` las columnas de ``queryset`` a las que leen los
+    ``campos`` de ``serializer_class``. Si alguno no se puede resolver a
+    columnas, el queryset se devuelve sin cambios.
+    """
+    modelo = queryset.model
+    # Anotaciones y precargas con ``to_attr`` no son columnas del modelo
+    calculados = set(queryset.query.annotations) | {
+        busqueda.to_attr
+        for busqueda in queryset._prefetch_related_lookups
+        if isinstance(busqueda, Prefetch) and busqueda.to_attr
+    }
+    columnas = {modelo._meta.pk.name}
+    seleccion_relacionada = queryset.query.select_related
+    if isinstance(seleccion_relacionada, dict):
+        # Un campo diferido no puede además unirse con ``select_related``
+        columnas |= set(seleccion_relacionada)
+    elif seleccion_relacionada:
+        return queryset
+
+    for nombre, campo in campos_serializer(serializer_class).items():
+        if campo.write_only or nombre not in campos:
+            continue
+        columnas_campo = _columnas_de_campo(campo, modelo, calculados)
+        if columnas_campo is None:
+            return queryset
+        columnas |= columnas_campo
+    return queryset.only(*columnas)
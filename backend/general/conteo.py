@@ -0,0 +1,145 @@
+import hashlib
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.exceptions import EmptyResultSet
+from django.db import connections, transaction
+
+# Segundos que se reutiliza un conteo exacto mientras no cambien sus tablas
+TIEMPO_CACHE_CONTEOS = getattr(settings, "PAGINACION_TIEMPO_CACHE_CONTEOS", 300)
+
+# Filas a partir de las cuales un listado sin filtros usa la estimación de
+# PostgreSQL en lugar de contar
+MINIMO_CONTEO_ESTIMADO = getattr(settings, "PAGINACION_MINIMO_CONTEO_ESTIMADO", 100_000)
+
+# Filas a partir de las cuales se guardan en caché los conteos de una tabla.
+# En tablas más pequeñas ``COUNT(*)`` cuesta menos que las consultas a la
+# caché (ver ``manage.py medir_conteos``)
+MINIMO_CONTEO_CACHE = getattr(settings, "PAGINACION_MINIMO_CONTEO_CACHE", 10_000)
+
+# Caché de los conteos. Debe ser compartida entre procesos (base de datos,
+# Redis, Memcached) para que la invalidación llegue a todos
+ALIAS_CACHE_CONTEOS = getattr(settings, "PAGINACION_CACHE_CONTEOS", DEFAULT_CACHE_ALIAS)
+
+# Segundos que cada proceso reutiliza la estimación del tamaño de una tabla
+TIEMPO_ESTIMACIONES = 60
+
+_estimaciones = {}
+
+
+def _clave_version(tabla):
+    return f"conteo:version:{tabla}"
+
+
+def invalidar_conteos(*tablas):
+    """
+    Descarta, al confirmar la transacción, los conteos en caché que leen
+    alguna de ``tablas``. Cada tabla tiene una versión que forma parte de la
+    clave de sus conteos; al cambiarla, los anteriores dejan de usarse y
+    expiran solos.
+
+    Antes de confirmar, un lector concurrente aún cuenta los datos anteriores
+    y los guardaría con la versión nueva.
+    """
+    transaction.on_commit(
+        lambda: caches[ALIAS_CACHE_CONTEOS].set_many(
+            {_clave_version(tabla): time.time_ns() for tabla in tablas}, timeout=None
+        )
+    )
+
+
+def _versiones(tablas):
+    cache = caches[ALIAS_CACHE_CONTEOS]
+    claves = [_clave_version(tabla) for tabla in tablas]
+    versiones = cache.get_many(claves)
+    nuevas = {clave: time.time_ns() for clave in claves if clave not in versiones}
+    if nuevas:
+        cache.set_many(nuevas, timeout=None)
+        versiones.update(nuevas)
+    return [versiones[clave] for clave in claves]
+
+
+def _tablas(sql, conexion):
+    # Se buscan en el SQL para incluir también las de las subconsultas
+    return sorted(
+        {
+            modelo._meta.db_table
+            for modelo in apps.get_models(include_auto_created=True)
+            if conexion.ops.quote_name(modelo._meta.db_table) in sql
+        }
+    )
+
+
+def _sin_filtros(query):
+    return not (
+        query.where
+        or query.distinct
+        or query.combinator
+        or query.group_by
+        or query.is_sliced
+    )
+
+
+def _estimacion(queryset):
+    """
+    ``reltuples`` de la tabla según las últimas estadísticas, o ``None``. Se
+    consulta una vez cada ``TIEMPO_ESTIMACIONES`` segundos por tabla.
+    """
+    conexion = connections[queryset.db]
+    if conexion.vendor != "postgresql":
+        return None
+    tabla = queryset.model._meta.db_table
+    momento, estimacion = _estimaciones.get((queryset.db, tabla), (None, None))
+    if momento is not None and time.monotonic() - momento < TIEMPO_ESTIMACIONES:
+        return estimacion
+    with conexion.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [tabla]
+        )
+        fila = cursor.fetchone()
+    # -1 si la tabla nunca se ha analizado
+    estimacion = None if fila is None or fila[0] < 0 else int(fila[0])
+    _estimaciones[queryset.db, tabla] = (time.monotonic(), estimacion)
+    return estimacion
+
+
+def contar(queryset):
+    """
+    Cantidad de resultados de ``queryset`` y si es una estimación.
+
+    Los listados sin filtros de tablas con al menos
+    ``MINIMO_CONTEO_ESTIMADO`` filas se cuentan con la estimación de
+    PostgreSQL. En tablas con al menos ``MINIMO_CONTEO_CACHE`` filas el
+    conteo se guarda en caché según su SQL y sus parámetros, hasta que se
+    escriba en alguna de las tablas que consulta. Las demás, o las que aún no
+    tienen estadísticas, se cuentan directamente con ``COUNT(*)``.
+    """
+    queryset = queryset.order_by()
+    query = queryset.query
+    estimacion = _estimacion(queryset)
+    if estimacion is None or estimacion < MINIMO_CONTEO_CACHE:
+        return queryset.count(), False
+    if _sin_filtros(query) and estimacion >= MINIMO_CONTEO_ESTIMADO:
+        return estimacion, True
+
+    return contar_en_cache(queryset), False
+
+
+def contar_en_cache(queryset):
+    """``queryset.count()`` guardado en caché hasta que cambien sus tablas."""
+    try:
+        sql, parametros = queryset.query.get_compiler(queryset.db).as_sql()
+    except EmptyResultSet:
+        # ``none()`` o un ``__in`` vacío: no hay nada que contar
+        return 0
+    tablas = _tablas(sql, connections[queryset.db])
+    firma = repr((queryset.db, sql, parametros, _versiones(tablas)))
+    clave = f"conteo:{hashlib.sha256(firma.encode()).hexdigest()}"
+    cache = caches[ALIAS_CACHE_CONTEOS]
+    conteo = cache.get(clave)
+    if conteo is None:
+        conteo = queryset.count()
+        cache.set(clave, conteo, TIEMPO_CACHE_CONTEOS)
+    return conteo
@@ -0,0 +1,14 @@
+from drf_spectacular import openapi
+
+
+class AutoSchema(openapi.AutoSchema):
+    """
+    Añade a las operaciones de lectura los ``parametros_lectura`` que declara
+    la vista, como ``?fields=`` en las vistas con ``PrecargaMixin``.
+    """
+
+    def get_override_parameters(self):
+        parametros = super().get_override_parameters()
+        if self.method == "GET":
+            parametros = [*parametros, *getattr(self.view, "parametros_lectura", [])]
+        return parametros
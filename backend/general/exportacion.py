@@ -0,0 +1,179 @@
+import csv
+import tempfile
+from typing import Iterable, NamedTuple, Sequence
+
+import tablib
+from django.http import StreamingHttpResponse
+from django.utils.functional import Promise
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from openpyxl import Workbook
+from rest_framework.renderers import BaseRenderer
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+TAMANO_BLOQUE = 64 * 1024
+
+
+class Hoja(NamedTuple):
+    """
+    Una tabla exportable. ``filas`` puede ser cualquier iterable (por ejemplo
+    un ``QuerySet.iterator()``), se consume una sola vez mientras se escribe.
+    """
+
+    titulo: str
+    columnas: Sequence[str]
+    filas: Iterable[Sequence]
+
+
+def _celda(valor):
+    # Las etiquetas de los choices son traducciones perezosas
+    if isinstance(valor, Promise):
+        return str(valor)
+    return valor
+
+
+def _filas(hoja):
+    for fila in hoja.filas:
+        yield [_celda(valor) for valor in fila]
+
+
+class _Eco:
+    """Pseudo-archivo que devuelve lo escrito, para usar ``csv.writer`` en streaming."""
+
+    def write(self, valor):
+        return valor
+
+
+def generar_csv(hojas):
+    """
+    Escribe las hojas una tras otra, separadas por una línea en blanco y
+    encabezadas por su título. Se genera fila a fila, sin acumular el archivo.
+    """
+    escritor = csv.writer(_Eco())
+    # BOM para que Excel reconozca el UTF-8
+    yield "﻿".encode()
+    for indice, hoja in enumerate(hojas):
+        if indice:
+            yield escritor.writerow([]).encode()
+        yield escritor.writerow([_celda(hoja.titulo)]).encode()
+        yield escritor.writerow([_celda(columna) for columna in hoja.columnas]).encode()
+        for fila in _filas(hoja):
+            yield escritor.writerow(fila).encode()
+
+
+def generar_xlsx(hojas):
+    """
+    Escribe las hojas con el modo de solo escritura de openpyxl, que vuelca
+    las filas a disco a medida que llegan. El libro terminado se envía en
+    bloques desde un archivo temporal.
+    """
+    libro = Workbook(write_only=True)
+    for hoja in hojas:
+        # Excel limita los títulos de las hojas a 31 caracteres
+        hoja_libro = libro.create_sheet(title=str(hoja.titulo)[:31])
+        hoja_libro.append([_celda(columna) for columna in hoja.columnas])
+        for fila in _filas(hoja):
+            hoja_libro.append(fila)
+
+    with tempfile.TemporaryFile() as archivo:
+        libro.save(archivo)
+        archivo.seek(0)
+        while bloque := archivo.read(TAMANO_BLOQUE):
+            yield bloque
+
+
+def generar_ods(hojas):
+    """
+    openpyxl no escribe ODS, así que se construye con tablib. A diferencia de
+    los otros formatos el libro se arma en memoria antes de enviarse.
+    """
+    libro = tablib.Databook()
+    for hoja in hojas:
+        datos = tablib.Dataset(
+            *_filas(hoja),
+            headers=[_celda(columna) for columna in hoja.columnas],
+            title=str(hoja.titulo)[:31],
+        )
+        libro.add_sheet(datos)
+    yield libro.export("ods")
+
+
+class ExportacionRenderer(BaseRenderer):
+    """
+    Renderer que solo habilita la negociación de ``?format=``. El contenido lo
+    genera :class:`ExportacionMixin` como una respuesta en streaming.
+    """
+
+    charset = None
+    render_style = "binary"
+    generar = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data
+
+
+class XlsxRenderer(ExportacionRenderer):
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    format = "xlsx"
+    generar = staticmethod(generar_xlsx)
+
+
+class CsvRenderer(ExportacionRenderer):
+    media_type = "text/csv"
+    format = "csv"
+    generar = staticmethod(generar_csv)
+
+
+class OdsRenderer(ExportacionRenderer):
+    media_type = "application/vnd.oasis.opendocument.spreadsheet"
+    format = "ods"
+    generar = staticmethod(generar_ods)
+
+
+RENDERERS_EXPORTACION = [XlsxRenderer, CsvRenderer, OdsRenderer]
+
+PARAMETRO_FORMATO = OpenApiParameter(
+    name=api_settings.URL_FORMAT_OVERRIDE,
+    type=OpenApiTypes.STR,
+    enum=[renderer.format for renderer in RENDERERS_EXPORTACION],
+    description="Descarga el reporte como hoja de cálculo en lugar de JSON.",
+)
+
+
+class ExportacionMixin:
+    """
+    Añade a una vista los formatos ``xlsx``, ``csv`` y ``ods``, seleccionables
+    con ``?format=``. Si se pide uno de ellos la vista debe responder con
+    :meth:`exportar`; los errores se siguen devolviendo en JSON.
+    """
+
+    nombre_exportacion = "reporte"
+
+    def get_renderers(self):
+        return [
+            *super().get_renderers(),
+            *[renderer() for renderer in RENDERERS_EXPORTACION],
+        ]
+
+    def exportando(self):
+        return isinstance(
+            getattr(self.request, "accepted_renderer", None), ExportacionRenderer
+        )
+
+    def exportar(self, hojas):
+        renderer = self.request.accepted_renderer
+        respuesta = StreamingHttpResponse(
+            renderer.generar(hojas), content_type=renderer.media_type
+        )
+        respuesta["Content-Disposition"] = (
+            f'attachment; filename="{self.nombre_exportacion}.{renderer.format}"'
+        )
+        return respuesta
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if isinstance(response, Response) and self.exportando():
+            renderer = super().get_renderers()[0]
+            request.accepted_renderer = renderer
+            request.accepted_media_type = renderer.media_type
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -0,0 +1,173 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils.encoding import force_str
+from django.utils.hashable import make_hashable
+from rest_framework import serializers
+
+from general.campos import campos_serializer
+
+# ``to_representation`` de DRF que devuelven sin cambios el valor que se lee
+# de las columnas de estos campos del modelo
+_IDENTIDAD = {
+    serializers.CharField.to_representation: (models.CharField, models.TextField),
+    serializers.ChoiceField.to_representation: (models.CharField, models.TextField),
+    serializers.IntegerField.to_representation: (models.IntegerField,),
+    serializers.BooleanField.to_representation: (models.BooleanField,),
+}
+
+_ETIQUETA = re.compile(r"get_(\w+)_display")
+
+
+class Entrada(NamedTuple):
+    """Un campo del plan: la columna de la que sale y cómo se convierte."""
+
+    nombre: str
+    columna: str
+    convertir: Optional[Callable] = None
+    # Si ``convertir`` también se aplica a ``None``, como hacen las etiquetas
+    con_nulos: bool = False
+
+
+def _etiqueta(campo, campo_modelo):
+    """``get_<campo>_display()`` a partir del valor de la columna."""
+    opciones = dict(make_hashable(campo_modelo.flatchoices))
+
+    def convertir(valor):
+        etiqueta = force_str(
+            opciones.get(make_hashable(valor), valor), strings_only=True
+        )
+        return None if etiqueta is None else campo.to_representation(etiqueta)
+
+    return convertir
+
+
+def _entrada(nombre, campo, modelo, calculados):
+    """Entrada de ``campo``, o ``None`` si no se lee directamente de una columna."""
+    if campo.source == "*" or len(campo.source_attrs) != 1:
+        return None
+    fuente = campo.source_attrs[0]
+
+    if isinstance(campo, serializers.PrimaryKeyRelatedField):
+        # ``values()`` devuelve el id de las claves foráneas, que es lo que
+        # serializa el campo
+        try:
+            campo_modelo = modelo._meta.get_field(fuente)
+        except FieldDoesNotExist:
+            return None
+        if (
+            campo.pk_field is not None
+            or not (campo_modelo.many_to_one or campo_modelo.one_to_one)
+            or not campo_modelo.concrete
+        ):
+            return None
+        return Entrada(nombre, fuente)
+    # Relaciones, ``SerializerMethodField`` y demás campos que no leen
+    # simplemente un atributo
+    if type(campo).get_attribute is not serializers.Field.get_attribute:
+        return None
+
+    if fuente in calculados:
+        return Entrada(nombre, fuente, campo.to_representation)
+
+    coincidencia = _ETIQUETA.fullmatch(fuente)
+    if coincidencia:
+        fuente = coincidencia.group(1)
+    try:
+        campo_modelo = modelo._meta.get_field(fuente)
+    except FieldDoesNotExist:
+        return None
+    if campo_modelo.is_relation or not campo_modelo.concrete:
+        return None
+    if coincidencia:
+        if not campo_modelo.choices:
+            return None
+        return Entrada(nombre, fuente, _etiqueta(campo, campo_modelo), con_nulos=True)
+
+    tipos = _IDENTIDAD.get(type(campo).to_representation)
+    if tipos and isinstance(campo_modelo, tipos):
+        return Entrada(nombre, fuente)
+    return Entrada(nombre, fuente, campo.to_representation)
+
+
+@dataclass(frozen=True)
+class PlanLectura:
+    entradas: tuple
+
+    def columnas(self, queryset):
+        """
+        Columnas para ``values()``: las del plan y las del orden, que la
+        paginación por cursor lee de cada fila.
+        """
+        orden = [
+            campo.lstrip("-")
+            for campo in queryset.query.order_by
+            if isinstance(campo, str) and campo != "?"
+        ]
+        columnas = [entrada.columna for entrada in self.entradas]
+        return list(dict.fromkeys([*columnas, *orden]))
+
+    def representar(self, filas):
+        """Lo mismo que ``serializer.data`` para las filas de ``values()``."""
+        datos = []
+        for fila in filas:
+            registro = {}
+            for nombre, columna, convertir, con_nulos in self.entradas:
+                valor = fila[columna]
+                if convertir is not None and (valor is not None or con_nulos):
+                    valor = convertir(valor)
+                registro[nombre] = valor
+            datos.append(registro)
+        return datos
+
+
+@lru_cache(maxsize=256)
+def _planificar(serializer_class, nombres, calculados):
+    campos = campos_serializer(serializer_class)
+    modelo = serializer_class.Meta.model
+    entradas = []
+    for nombre in nombres:
+        entrada = _entrada(nombre, campos[nombre], modelo, calculados)
+        if entrada is None:
+            return None
+        entradas.append(entrada)
+    return PlanLectura(tuple(entradas))
+
+
+def planificar_lectura(serializer, queryset):
+    """
+    Plan para construir la salida de ``serializer`` (sin instancia, con el
+    contexto de la petición) a partir de las filas de ``queryset.values()``,
+    o ``None`` si algún campo no se lee directamente de una columna o de una
+    anotación: relaciones anidadas o múltiples, ``SerializerMethodField``,
+    fuentes con puntos o serializers que redefinen ``to_representation``.
+
+    Los campos simples se copian tal cual si DRF no los transformaría, y los
+    demás (fechas, JSON, etiquetas de ``get_<campo>_display``) se convierten
+    con el ``to_representation`` del campo. Se calcula una vez por
+    serializer, campos pedidos y anotaciones.
+    """
+    serializer_class = type(serializer)
+    meta = getattr(serializer_class, "Meta", None)
+    if (
+        serializer_class.to_representation
+        is not serializers.Serializer.to_representation
+        or getattr(meta, "model", None) is not queryset.model
+    ):
+        return None
+    campos_clase = campos_serializer(serializer_class)
+    nombres = []
+    for nombre, campo in serializer.fields.items():
+        if campo.write_only:
+            continue
+        # Con ``?expand=`` el campo ya no es el de la clase
+        if type(campo) is not type(campos_clase.get(nombre)):
+            return None
+        nombres.append(nombre)
+    return _planificar(
+        serializer_class, tuple(nombres), frozenset(queryset.query.annotations)
+    )
@@ -1,17 +1,183 @@
 from rest_framework import viewsets
 from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+from rest_framework.utils.serializer_helpers import ReturnList
+
+from general.campos import (
+    PARAMETRO_CAMPOS,
+    PARAMETRO_EXCLUIR,
+    PARAMETRO_EXPANDIR,
+    campos_serializer,
+    campos_solicitados,
+    expansiones_solicitadas,
+    podar_columnas,
+)
+from general.lectura import planificar_lectura
+from general.precarga import precargar
 
 
 class ObtenerPorMultiplesCamposMixin:
+    """
+    Vistas de rutas anidadas como ``/carreras/<id>/disciplinas/<id>``.
+
+    ``parent_lookup_fields`` relaciona cada parámetro de la url con la ruta
+    hasta el objeto padre desde el modelo de la vista (por ejemplo
+    ``{"id_carrera": "disciplina__carrera"}``). El objeto se obtiene junto con
+    sus padres en una única consulta que valida toda la ruta, y los padres
+    quedan memorizados para el resto de la petición.
+    """
 
     multiple_lookup_fields = {}
+    parent_lookup_fields = {}
+
+    def get_queryset(self):
+        return super().get_queryset().filter(**self.filtro_padres())
+
+    def filtro_padres(self):
+        return {
+            f"{ruta}__pk": self.kwargs[url]
+            for url, ruta in self.parent_lookup_fields.items()
+            if url in self.kwargs
+        }
+
+    def rutas_padres(self):
+        """Rutas de los padres presentes en la url, del más cercano al más lejano."""
+        return sorted(
+            (
+                ruta
+                for url, ruta in self.parent_lookup_fields.items()
+                if url in self.kwargs
+            ),
+            key=lambda ruta: ruta.count("__"),
+        )
 
     def get_object(self: viewsets.GenericViewSet):
+        rutas = self.rutas_padres()
         queryset = self.get_queryset()
+        cargadas, diferir = queryset.query.deferred_loading
+        if rutas and cargadas and not diferir:
+            # Con ``?fields=`` las columnas se limitaron con ``only()``, y un
+            # campo diferido no puede unirse con ``select_related``
+            primeras = {ruta.split("__")[0] for ruta in rutas}
+            queryset = queryset.only(*cargadas, *primeras)
+        queryset = queryset.select_related(*rutas)
         filter = {}
         for url, model_field in self.multiple_lookup_fields.items():
             filter[model_field] = self.kwargs[url]
 
         obj = get_object_or_404(queryset, **filter)
+        for ruta in rutas:
+            self._padres()[ruta] = _seguir_ruta(obj, ruta)
         self.check_object_permissions(self.request, obj)
         return obj
+
+    def list(self, request, *args, **kwargs):
+        # Una lista vacía no distingue un padre inexistente: se responde 404
+        if self.rutas_padres():
+            self.obtener_padre(self.rutas_padres()[0])
+        return super().list(request, *args, **kwargs)
+
+    def obtener_padre(self, ruta):
+        """
+        Objeto padre de la ruta ``ruta``, o ``None`` si la url no lo incluye.
+        La primera vez se obtienen todos los padres en una sola consulta.
+        """
+        rutas = self.rutas_padres()
+        if ruta not in rutas:
+            return None
+        padres = self._padres()
+        if ruta not in padres:
+            cercana, *lejanas = rutas
+            relativas = [lejana[len(cercana) + 2 :] for lejana in lejanas]
+            urls = {ruta: url for url, ruta in self.parent_lookup_fields.items()}
+            modelo = _modelo_de_ruta(self.queryset.model, cercana)
+            padre = get_object_or_404(
+                modelo._default_manager.select_related(*relativas),
+                pk=self.kwargs[urls[cercana]],
+                **{
+                    f"{relativa}__pk": self.kwargs[urls[lejana]]
+                    for relativa, lejana in zip(relativas, lejanas)
+                },
+            )
+            padres[cercana] = padre
+            for relativa, lejana in zip(relativas, lejanas):
+                padres[lejana] = _seguir_ruta(padre, relativa)
+        return padres[ruta]
+
+    def _padres(self):
+        if not hasattr(self, "_padres_memorizados"):
+            self._padres_memorizados = {}
+        return self._padres_memorizados
+
+
+def _seguir_ruta(obj, ruta):
+    for nombre in ruta.split("__"):
+        obj = getattr(obj, nombre)
+    return obj
+
+
+def _modelo_de_ruta(modelo, ruta):
+    for nombre in ruta.split("__"):
+        modelo = modelo._meta.get_field(nombre).related_model
+    return modelo
+
+
+class PrecargaMixin:
+    """
+    Aplica en ``get_queryset`` los ``select_related``/``prefetch_related``
+    que necesita el serializer de la vista, deducidos de sus campos (ver
+    ``general.precarga``). Con ``?fields=`` o ``?exclude=`` solo se precargan
+    y se leen las columnas de los campos pedidos, y con ``?expand=`` se unen
+    las relaciones expandidas (ver ``general.campos``).
+    Las vistas que redefinen ``get_queryset`` deben partir de
+    ``super().get_queryset()``.
+    """
+
+    parametros_lectura = [PARAMETRO_CAMPOS, PARAMETRO_EXCLUIR, PARAMETRO_EXPANDIR]
+
+    def get_queryset(self: viewsets.GenericViewSet):
+        serializer_class = self.get_serializer_class()
+        request = getattr(self, "request", None)
+        campos = campos_solicitados(request, campos_serializer(serializer_class))
+        queryset = precargar(
+            super().get_queryset(),
+            serializer_class,
+            campos,
+            expansiones_solicitadas(request),
+        )
+        if campos is not None:
+            queryset = podar_columnas(queryset, serializer_class, campos)
+        return queryset
+
+
+class LecturaRapidaMixin:
+    """
+    Listados que se leen con ``values()`` en lugar de construir y serializar
+    una instancia del modelo por fila, cuando todos los campos del serializer
+    salen directamente de columnas o anotaciones (ver ``general.lectura``).
+    La respuesta es idéntica; si algún campo no lo permite, por ejemplo con
+    ``?expand=``, se usa el serializer. El detalle y las escrituras no
+    cambian.
+    """
+
+    def list(self: viewsets.GenericViewSet, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer(many=True)
+        plan = planificar_lectura(serializer.child, queryset)
+        if plan is None:
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
+            serializer = self.get_serializer(queryset, many=True)
+            return Response(serializer.data)
+
+        # Las precargas no aplican a ``values()``
+        filas = queryset.prefetch_related(None).values(*plan.columnas(queryset))
+        page = self.paginate_queryset(filas)
+        datos = ReturnList(
+            plan.representar(filas if page is None else page), serializer=serializer
+        )
+        if page is not None:
+            return self.get_paginated_response(datos)
+        return Response(datos)
@@ -0,0 +1,33 @@
+from django.utils.translation import gettext_lazy as _
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camel_to_underscore
+from rest_framework.filters import OrderingFilter
+
+CAMPOS_UNICOS = {"pk", "-pk", "id", "-id"}
+
+
+class CamelCaseOrderingFilter(OrderingFilter):
+    """
+    ``OrderingFilter`` que acepta los campos en camelCase, como los devuelve
+    la API (``CamelCaseMiddleWare`` solo convierte los nombres de los
+    parámetros, no sus valores). Si el orden no incluye la clave primaria se
+    añade al final, para que la paginación sea estable con empates.
+    """
+
+    ordering_description = _(
+        "Campos por los que ordenar, separados por comas. Con `-` delante el "
+        "orden es descendente."
+    )
+
+    def remove_invalid_fields(self, queryset, fields, view, request):
+        fields = [
+            camel_to_underscore(campo, **api_settings.JSON_UNDERSCOREIZE)
+            for campo in fields
+        ]
+        return super().remove_invalid_fields(queryset, fields, view, request)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if ordering and not CAMPOS_UNICOS.intersection(ordering):
+            ordering = [*ordering, "pk"]
+        return ordering
@@ -1,16 +1,249 @@
+import json
+from urllib.parse import parse_qs, urlparse
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import EmptyPage
+from django.core.paginator import Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 
+from general.conteo import contar
+from general.ordenamiento import CAMPOS_UNICOS
+
+
+class Paginator(DjangoPaginator):
+    """
+    Paginador que obtiene el total con :func:`general.conteo.contar`: en
+    caché mientras no cambien los datos o, en tablas grandes sin filtros,
+    estimado. Con un total estimado no se descartan las páginas que quedan
+    fuera de él; solo las que no tienen resultados.
+    """
+
+    estimado = False
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        conteo, self.estimado = contar(self.object_list)
+        return conteo
+
+    def page(self, number):
+        # El total se obtiene primero porque decide si es estimado
+        self.count
+        if not self.estimado:
+            return super().page(number)
+        number = self.validate_number(number)
+        inicio = (number - 1) * self.per_page
+        object_list = self.object_list[inicio : inicio + self.per_page]
+        if number > 1 and not object_list:
+            raise EmptyPage(self.error_messages["no_results"])
+        return self._get_page(object_list, number, self)
+
+    def validate_number(self, number):
+        if self.estimado:
+            try:
+                return max(int(number), 1)
+            except (TypeError, ValueError):
+                pass
+        return super().validate_number(number)
+
+
+def _admite_nulos(modelo, campo):
+    """Si la columna de orden ``campo`` puede ser nula; las anotaciones, sí."""
+    if campo == "pk":
+        return False
+    try:
+        return modelo._meta.get_field(campo).null
+    except FieldDoesNotExist:
+        return True
+
+
+def _despues_de(modelo, ordering, posicion):
+    """
+    Filas que siguen a ``posicion`` (los valores de las columnas de
+    ``ordering`` en una fila) en ese orden: ``(a, b) > (x, y)`` escrito como
+    ``a > x OR (a = x AND b > y)``, respetando la dirección de cada columna y
+    que PostgreSQL ordena los nulos como mayores que cualquier valor.
+    """
+    condicion, iguales = Q(pk__in=[]), Q()
+    for campo, valor in zip(ordering, posicion):
+        descendente = campo.startswith("-")
+        campo = campo.lstrip("-")
+        nulos = _admite_nulos(modelo, campo)
+        if valor is None:
+            mayor = Q(**{f"{campo}__isnull": False}) if descendente else Q(pk__in=[])
+            igual = Q(**{f"{campo}__isnull": True})
+        else:
+            mayor = Q(**{f"{campo}__{'lt' if descendente else 'gt'}": valor})
+            if nulos and not descendente:
+                mayor |= Q(**{f"{campo}__isnull": True})
+            igual = Q(**{campo: valor})
+        condicion |= iguales & mayor
+        iguales &= igual
+
+    primero, valor = ordering[0], posicion[0]
+    if valor is not None and not _admite_nulos(modelo, primero.lstrip("-")):
+        # Cota redundante sobre la primera columna, para que se recorra su
+        # índice desde la posición
+        descendente = primero.startswith("-")
+        condicion &= Q(
+            **{f"{primero.lstrip('-')}__{'lte' if descendente else 'gte'}": valor}
+        )
+    return condicion
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Paginación por clave (keyset): cada página continúa desde la posición de
+    la anterior con ``WHERE (columnas del orden) > posición`` en lugar de
+    ``OFFSET``. La posición son los valores de todas las columnas del orden,
+    que siempre termina en la clave primaria, así que es única y no hace
+    falta el desplazamiento que usa DRF entre empates de la primera columna.
+    La consulta recorre un índice si la primera columna del orden lo tiene
+    (la clave primaria, ``anno``...); si no, PostgreSQL ordena las filas que
+    cumplen la condición. No cuenta los resultados; para saber si hay página
+    siguiente se pide una fila más de las que caben en la página.
+    """
+
+    page_size_query_param = "limit"
+    ordering = "pk"
+    cursor_query_description = _(
+        "Cursor de la página. Vacío para obtener la primera página."
+    )
+    page_size_query_description = _("Cantidad de resultados por página")
+
+    def _cursor(self, url):
+        if url is None:
+            return None
+        return parse_qs(urlparse(url).query).get(self.cursor_query_param, [None])[0]
+
+    def get_ordering(self, request, queryset, view):
+        # El orden que dejaron los filtros, como la relevancia de ``?search=``;
+        # DRF solo consultaría el filtro de ordenamiento, que no la conoce
+        ordering = queryset.query.order_by
+        if not ordering or any(
+            not isinstance(campo, str) or campo == "?" or "__" in campo
+            for campo in ordering
+        ):
+            ordering = super().get_ordering(request, queryset, view)
+        ordering = list(ordering)
+        if not CAMPOS_UNICOS.intersection(ordering):
+            ordering.append("pk")
+        return tuple(ordering)
+
+    def _get_position_from_instance(self, instance, ordering):
+        valores = []
+        for campo in ordering:
+            campo = campo.lstrip("-")
+            if isinstance(instance, dict):
+                valores.append(instance[campo])
+            else:
+                valores.append(getattr(instance, campo))
+        return json.dumps(valores, cls=DjangoJSONEncoder)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        ``CursorPagination.paginate_queryset`` de DRF, salvo que la posición
+        filtra por todas las columnas del orden y no solo por la primera.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            offset, reverse, posicion = 0, False, None
+        else:
+            offset, reverse, posicion = self.cursor
+
+        ordering = self.ordering
+        if reverse:
+            ordering = pagination._reverse_ordering(ordering)
+        queryset = queryset.order_by(*ordering)
+
+        if posicion is not None:
+            try:
+                valores = json.loads(posicion)
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+            if not isinstance(valores, list) or len(valores) != len(ordering):
+                raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.filter(_despues_de(queryset.model, ordering, valores))
+
+        # Se pide una fila más para saber si hay página siguiente
+        resultados = list(queryset[offset : offset + self.page_size + 1])
+        self.page = resultados[: self.page_size]
+
+        if len(resultados) > len(self.page):
+            siguiente = self._get_position_from_instance(resultados[-1], self.ordering)
+        else:
+            siguiente = None
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = posicion is not None or offset > 0
+            self.has_previous = siguiente is not None
+            self.next_position = posicion
+            self.previous_position = siguiente
+        else:
+            self.has_next = siguiente is not None
+            self.has_previous = posicion is not None or offset > 0
+            self.next_position = siguiente
+            self.previous_position = posicion
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_paginated_response(self, data):
+        next = self.get_next_link()
+        previous = self.get_previous_link()
+        return Response(
+            {
+                "meta": {
+                    "itemCount": None,
+                    "itemCountEstimated": None,
+                    "pageCount": None,
+                    "currentPage": None,
+                    "next": next,
+                    "nextPage": None,
+                    "nextCursor": self._cursor(next),
+                    "previous": previous,
+                    "previousPage": None,
+                    "previousCursor": self._cursor(previous),
+                },
+                "data": data,
+            }
+        )
+
 
 class CustomPageNumberPagination(pagination.PageNumberPagination):
+    django_paginator_class = Paginator
     page_size_query_param = "limit"
     page_query_description = _(
         "Número de página dentro del conjunto de resultados paginados."
     )
     page_size_query_description = _("Cantidad de resultados por página")
+    cursor_query_param = CursorPagination.cursor_query_param
 
     def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_pagination = None
+        if self.cursor_query_param in request.query_params:
+            # Con ``?cursor=`` se pagina por clave en lugar de por número de página
+            self.cursor_pagination = CursorPagination()
+            return self.cursor_pagination.paginate_queryset(queryset, request, view)
+
         page_query_param = request.query_params.get(self.page_query_param)
 
         if not page_query_param:
@@ -20,6 +253,9 @@ class CustomPageNumberPagination(pagination.PageNumberPagination):
         return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if self.cursor_pagination is not None:
+            return self.cursor_pagination.get_paginated_response(data)
+
         current_page = self.page.number
         next_page = self.page.next_page_number() if self.get_next_link() else None
         previous_page = (
@@ -30,6 +266,7 @@ class CustomPageNumberPagination(pagination.PageNumberPagination):
             {
                 "meta": {
                     "itemCount": self.page.paginator.count,
+                    "itemCountEstimated": self.page.paginator.estimado,
                     "pageCount": self.page.paginator.num_pages,
                     "currentPage": current_page,
                     "next": self.get_next_link(),
@@ -41,6 +278,18 @@ class CustomPageNumberPagination(pagination.PageNumberPagination):
             }
         )
 
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": force_str(CursorPagination.cursor_query_description),
+                "schema": {"type": "string"},
+            },
+        ]
+
     def get_paginated_response_schema(self, schema):
         return {
             "type": "object",
@@ -49,17 +298,27 @@ class CustomPageNumberPagination(pagination.PageNumberPagination):
                 "meta": {
                     "type": "object",
                     "properties": {
+                        # Los conteos y números de página son nulos con ``?cursor=``
                         "itemCount": {
                             "type": "integer",
                             "required": "true",
+                            "nullable": True,
+                        },
+                        "itemCountEstimated": {
+                            "type": "boolean",
+                            "nullable": True,
+                            "description": "Indica que itemCount y pageCount "
+                            "son una estimación de PostgreSQL.",
                         },
                         "pageCount": {
                             "type": "integer",
                             "required": "true",
+                            "nullable": True,
                         },
                         "currentPage": {
                             "type": "integer",
                             "required": "true",
+                            "nullable": True,
                         },
                         "next": {
                             "type": "string",
@@ -85,6 +344,14 @@ class CustomPageNumberPagination(pagination.PageNumberPagination):
                             "type": "integer",
                             "nullable": True,
                         },
+                        "nextCursor": {
+                            "type": "string",
+                            "nullable": True,
+                        },
+                        "previousCursor": {
+                            "type": "string",
+                            "nullable": True,
+                        },
                     },
                 },
                 "data": schema,
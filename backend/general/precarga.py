@@ -0,0 +1,179 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import ForeignObjectRel, Prefetch
+from rest_framework import serializers
+
+
+def requiere_relaciones(*rutas):
+    """
+    Declara las relaciones que lee un ``SerializerMethodField``, con rutas de
+    atributos separadas por ``__`` (por ejemplo ``"profesorevento_set__profesor"``),
+    para que :func:`precargar` las incluya en su plan. También se pueden
+    declarar los campos simples del modelo que lee, para que
+    :func:`general.campos.podar_columnas` no los excluya.
+    """
+
+    def decorador(metodo):
+        metodo.relaciones = rutas
+        return metodo
+
+    return decorador
+
+
+@dataclass
+class Relacion:
+    """Nodo del plan de precarga: una relación y las que se leen a través de ella."""
+
+    modelo: type
+    multiple: bool = False
+    solo_pk: bool = True
+    hijas: dict = field(default_factory=dict)
+
+
+def _obtener_relacion(modelo, nombre):
+    # Las relaciones inversas se recorren por su accesor (``x_set``), que es
+    # el nombre que usan los serializers y ``prefetch_related``
+    for relacion in modelo._meta.related_objects:
+        if relacion.get_accessor_name() == nombre:
+            return relacion
+    try:
+        campo = modelo._meta.get_field(nombre)
+    except FieldDoesNotExist:
+        return None
+    if not campo.is_relation or isinstance(campo, ForeignObjectRel):
+        return None
+    return campo
+
+
+def _agregar_ruta(raiz, nombres, solo_pk=False):
+    """Añade al plan la ruta ``nombres`` y devuelve su último nodo, o ``None``."""
+    nodo = raiz
+    for indice, nombre in enumerate(nombres):
+        relacion = _obtener_relacion(nodo.modelo, nombre)
+        if relacion is None:
+            return None
+        es_ultima = indice == len(nombres) - 1
+        hija = nodo.hijas.get(nombre)
+        if hija is None:
+            hija = nodo.hijas[nombre] = Relacion(
+                relacion.related_model,
+                multiple=relacion.many_to_many or relacion.one_to_many,
+            )
+        hija.solo_pk = hija.solo_pk and es_ultima and solo_pk
+        nodo = hija
+    return nodo
+
+
+def _recorrer(serializer, nodo, campos=None):
+    for nombre, campo in serializer.fields.items():
+        if campo.write_only or (campos is not None and nombre not in campos):
+            continue
+
+        if isinstance(campo, serializers.SerializerMethodField):
+            metodo = getattr(serializer, campo.method_name)
+            for ruta in getattr(metodo, "relaciones", ()):
+                _agregar_ruta(nodo, ruta.split("__"))
+            continue
+
+        if isinstance(campo, serializers.ListSerializer):
+            anidado = campo.child
+        elif isinstance(campo, serializers.BaseSerializer):
+            anidado = campo
+        else:
+            anidado = None
+
+        if campo.source == "*":
+            if anidado is not None:
+                _recorrer(anidado, nodo)
+            continue
+
+        fuentes = campo.source_attrs
+        if anidado is not None:
+            hija = _agregar_ruta(nodo, fuentes)
+            if hija is not None:
+                _recorrer(anidado, hija)
+        elif isinstance(campo, serializers.ManyRelatedField):
+            solo_pk = isinstance(
+                campo.child_relation, serializers.PrimaryKeyRelatedField
+            )
+            _agregar_ruta(nodo, fuentes, solo_pk=solo_pk)
+        elif isinstance(campo, serializers.PrimaryKeyRelatedField):
+            # Se serializa con la columna ``<campo>_id``, sin acceder al objeto
+            if len(fuentes) > 1:
+                _agregar_ruta(nodo, fuentes[:-1])
+        elif isinstance(campo, serializers.RelatedField):
+            _agregar_ruta(nodo, fuentes)
+        elif len(fuentes) > 1:
+            # Campo simple de un objeto relacionado, como ``source="a.b"``
+            _agregar_ruta(nodo, fuentes[:-1])
+
+
+@lru_cache(maxsize=256)
+def planificar_precarga(serializer_class, campos=None, expandir=None):
+    """
+    Relaciones que lee ``serializer_class``: sus serializers anidados, sus
+    campos relacionados y los ``SerializerMethodField`` marcados con
+    :func:`requiere_relaciones`. Con ``campos`` (un ``frozenset``) solo se
+    consideran esos campos del serializer principal, y con ``expandir`` se
+    incluyen las relaciones expandidas (ver ``general.campos``). Se calcula
+    una sola vez por combinación.
+    """
+    raiz = Relacion(serializer_class.Meta.model, solo_pk=False)
+    serializer = serializer_class(expandir=expandir) if expandir else serializer_class()
+    _recorrer(serializer, raiz, campos)
+    return raiz
+
+
+def _busquedas(nodo):
+    """
+    Convierte un nodo del plan en argumentos de ``select_related`` y
+    ``prefetch_related``. Las relaciones simples se unen con JOIN; las
+    múltiples se precargan con un ``Prefetch`` cuyo queryset, a su vez, une o
+    precarga lo que se lee de ellas.
+    """
+    unir, precargar = [], []
+    for nombre, hija in nodo.hijas.items():
+        unir_hija, precargar_hija = _busquedas(hija)
+        if not hija.multiple:
+            unir.append(nombre)
+            unir += [f"{nombre}__{ruta}" for ruta in unir_hija]
+            precargar += [
+                Prefetch(f"{nombre}__{busqueda.prefetch_through}", busqueda.queryset)
+                for busqueda in precargar_hija
+            ]
+            continue
+        queryset = hija.modelo._default_manager.all()
+        if hija.solo_pk and not hija.hijas:
+            queryset = queryset.only("pk")
+        if unir_hija:
+            queryset = queryset.select_related(*unir_hija)
+        if precargar_hija:
+            queryset = queryset.prefetch_related(*precargar_hija)
+        precargar.append(Prefetch(nombre, queryset))
+    return unir, precargar
+
+
+def precargar(queryset, serializer_class, campos=None, expandir=None):
+    """
+    Aplica a ``queryset`` el plan de precarga de ``serializer_class`` (o de
+    sus ``campos``, con las relaciones de ``expandir``). Las precargas que el
+    queryset ya declara explícitamente se respetan.
+    """
+    plan = planificar_precarga(serializer_class, campos, expandir)
+    if plan.modelo is not queryset.model:
+        return queryset
+    unir, precargas = _busquedas(plan)
+    declaradas = {
+        busqueda.prefetch_to if isinstance(busqueda, Prefetch) else busqueda
+        for busqueda in queryset._prefetch_related_lookups
+    }
+    precargas = [
+        busqueda for busqueda in precargas if busqueda.prefetch_to not in declaradas
+    ]
+    if unir:
+        queryset = queryset.select_related(*unir)
+    if precargas:
+        queryset = queryset.prefetch_related(*precargas)
+    return queryset
@@ -0,0 +1,108 @@
+import re
+from functools import lru_cache
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case import util
+from djangorestframework_camel_case.settings import api_settings
+from rest_framework import serializers
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from general.campos import campos_serializer
+
+
+@lru_cache(maxsize=4096)
+def _clave_camel(clave):
+    # ``util.camelize_re`` se lee en cada llamada porque ``config.base`` lo
+    # reemplaza
+    if "_" not in clave:
+        return clave
+    return re.sub(util.camelize_re, util.underscore_to_camel, clave)
+
+
+def _clases_anidadas(serializer_class):
+    """Clases de los serializers que pueden aparecer dentro de ``serializer_class``."""
+    clases = list(getattr(serializer_class, "campos_expandibles", {}).values())
+    for campo in campos_serializer(serializer_class).values():
+        if isinstance(campo, serializers.ListSerializer):
+            campo = campo.child
+        if isinstance(campo, serializers.BaseSerializer):
+            clases.append(type(campo))
+    return clases
+
+
+@lru_cache(maxsize=None)
+def mapa_claves(serializer_class):
+    """
+    ``{nombre: nombreCamel}`` de los campos de ``serializer_class`` y de sus
+    serializers anidados y expandibles. Se calcula una vez por clase.
+    """
+    mapa = {}
+    pendientes, vistas = [serializer_class], set()
+    while pendientes:
+        clase = pendientes.pop()
+        if clase in vistas:
+            continue
+        vistas.add(clase)
+        try:
+            campos = campos_serializer(clase)
+            pendientes += _clases_anidadas(clase)
+        except TypeError:
+            # Serializers que no se pueden instanciar sin argumentos: sus
+            # claves se convierten al vuelo
+            continue
+        mapa.update({nombre: _clave_camel(nombre) for nombre in campos})
+    return mapa
+
+
+def _mapa_de(datos, mapa):
+    serializer = datos.serializer
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    if serializer is None:
+        return mapa
+    return mapa_claves(type(serializer))
+
+
+def _camelizar(datos, mapa):
+    if isinstance(datos, (ReturnDict, ReturnList)):
+        mapa = _mapa_de(datos, mapa)
+    if isinstance(datos, dict):
+        resultado = {}
+        for clave, valor in datos.items():
+            if isinstance(clave, Promise):
+                clave = force_str(clave)
+            if isinstance(clave, str):
+                clave = mapa.get(clave) or _clave_camel(clave)
+            resultado[clave] = _camelizar(valor, mapa)
+        return resultado
+    if isinstance(datos, list):
+        return [_camelizar(elemento, mapa) for elemento in datos]
+    if datos is None or isinstance(datos, (str, int, float)):
+        return datos
+    if isinstance(datos, Promise):
+        return force_str(datos)
+    if util.is_iterable(datos):
+        return [_camelizar(elemento, mapa) for elemento in datos]
+    return datos
+
+
+class CamelCaseJSONRenderer(api_settings.RENDERER_CLASS):
+    """
+    ``CamelCaseJSONRenderer`` que no aplica la expresión regular a cada clave
+    de cada objeto: las claves de los serializers de la respuesta se
+    convierten una vez por clase con :func:`mapa_claves`, y las demás (meta
+    de la paginación, reportes) se recuerdan tras convertirlas. La
+    codificación sigue siendo la de ``JSONRenderer`` y la salida es idéntica
+    byte a byte.
+    """
+
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    def render(self, data, *args, **kwargs):
+        opciones = self.json_underscoreize
+        if opciones.get("ignore_fields") or opciones.get("ignore_keys"):
+            data = util.camelize(data, **opciones)
+        else:
+            data = _camelizar(data, {})
+        return super().render(data, *args, **kwargs)
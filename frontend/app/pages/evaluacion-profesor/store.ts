@@ -19,8 +19,8 @@ export const useEvaluationStore = defineStore('evaluationStore', {
         this.evaluations = Array.isArray(data)
           ? data.map((item: any) => ({
               id: item.id,
-              profesor: item.profesor?.id || '',
-              indicador: item.indicador?.id || '',
+              profesor: item.profesor || '',
+              indicador: item.indicador || '',
               fecha: item.fecha,
               evaluacion: item.evaluacion,
             }))
@@ -49,8 +49,8 @@ export const useEvaluationStore = defineStore('evaluationStore', {
         // Mapear respuesta
         this.evaluations.push({
           id: (data as any).id,
-          profesor: (data as any).profesor?.id || '',
-          indicador: (data as any).indicador?.id || '',
+          profesor: (data as any).profesor || '',
+          indicador: (data as any).indicador || '',
           fecha: (data as any).fecha,
           evaluacion: (data as any).evaluacion,
         });
@@ -81,8 +81,8 @@ export const useEvaluationStore = defineStore('evaluationStore', {
         if (idx !== -1) {
           this.evaluations.splice(idx, 1, {
             id: (data as any).id,
-            profesor: (data as any).profesor?.id || '',
-            indicador: (data as any).indicador?.id || '',
+            profesor: (data as any).profesor || '',
+            indicador: (data as any).indicador || '',
             fecha: (data as any).fecha,
             evaluacion: (data as any).evaluacion,
           });
@@ -273,7 +273,7 @@ export const useProfessorStore = defineStore( 'professorStore', {
 		
 		try {
 		  const config = useRuntimeConfig();
-		  const url = `/api/profesores/category/${ category }`;
+		  const url = `/api/profesores?categoriaDocente=${ encodeURIComponent( category ) }`;
 		  console.log('Fetching professors by category from:', url);
 
 		  const { data, error } = await useFetch( url );